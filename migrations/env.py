@@ -13,6 +13,9 @@ from src.db.models.ticket import Ticket
 from src.db.models.comment import Comment
 from src.db.models.attachment import Attachment
 from src.db.models.ticket_history import TicketHistory
+from src.db.models.ticket_counter import TicketCounter
+from src.db.models.ticket_resolution import TicketResolution
+from src.db.models.attachment_blob import AttachmentBlob
 
 from sqlmodel import SQLModel
 from src.config import Config
@@ -0,0 +1,89 @@
+"""feat: added hot path indexes
+
+Revision ID: 3f6a9d2c8e41
+Revises: b91f4c0e7d58
+Create Date: 2026-10-18 16:05:37.918204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3f6a9d2c8e41'
+down_revision: Union[str, Sequence[str], None] = 'b91f4c0e7d58'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # CONCURRENTLY keeps the tables writable while the indexes build
+    with op.get_context().autocommit_block():
+        # my-tickets: created_by OR assigned_to becomes a BitmapOr of these two
+        op.create_index(
+            'ix_tickets_created_by_updated_at', 'tickets',
+            ['created_by', 'updated_at', 'ticket_id'],
+            postgresql_concurrently=True
+        )
+        # Also covers the per-assignee analytics joins
+        op.create_index(
+            'ix_tickets_assigned_to_updated_at', 'tickets',
+            ['assigned_to', 'updated_at', 'ticket_id'],
+            postgresql_include=['status', 'created_at'],
+            postgresql_concurrently=True
+        )
+        op.create_index(
+            'ix_tickets_unassigned_updated_at', 'tickets',
+            ['updated_at', 'ticket_id'],
+            postgresql_where=sa.text('assigned_to IS NULL'),
+            postgresql_concurrently=True
+        )
+        op.create_index(
+            'ix_tickets_created_at', 'tickets', ['created_at'],
+            postgresql_concurrently=True
+        )
+        op.create_index(
+            'ix_ticket_history_ticket_id_changed_at', 'ticket_history',
+            ['ticket_id', 'changed_at', 'history_id'],
+            postgresql_concurrently=True
+        )
+        op.create_index(
+            'ix_ticket_history_status_changes', 'ticket_history', ['changed_at'],
+            postgresql_include=['new_value'],
+            postgresql_where=sa.text("action_type = 'status_changed'"),
+            postgresql_concurrently=True
+        )
+        op.create_index(
+            'ix_comments_ticket_id_created_at', 'comments',
+            ['ticket_id', 'created_at'],
+            postgresql_concurrently=True
+        )
+        op.create_index(
+            'ix_attachments_ticket_id', 'attachments', ['ticket_id'],
+            postgresql_concurrently=True
+        )
+        op.create_index(
+            'ix_ticket_resolutions_resolved_at', 'ticket_resolutions', ['resolved_at'],
+            postgresql_concurrently=True
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        for index_name, table_name in [
+            ('ix_ticket_resolutions_resolved_at', 'ticket_resolutions'),
+            ('ix_attachments_ticket_id', 'attachments'),
+            ('ix_comments_ticket_id_created_at', 'comments'),
+            ('ix_ticket_history_status_changes', 'ticket_history'),
+            ('ix_ticket_history_ticket_id_changed_at', 'ticket_history'),
+            ('ix_tickets_created_at', 'tickets'),
+            ('ix_tickets_unassigned_updated_at', 'tickets'),
+            ('ix_tickets_assigned_to_updated_at', 'tickets'),
+            ('ix_tickets_created_by_updated_at', 'tickets'),
+        ]:
+            op.drop_index(index_name, table_name=table_name, postgresql_concurrently=True)
@@ -0,0 +1,33 @@
+"""feat: added unresolved tickets partial index
+
+Revision ID: 5a8e0b3d6f21
+Revises: 7c2d9e4f1a63
+Create Date: 2026-10-18 11:46:55.210392
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5a8e0b3d6f21'
+down_revision: Union[str, Sequence[str], None] = '7c2d9e4f1a63'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        'ix_tickets_unresolved_created_at', 'tickets', ['created_at'],
+        unique=False,
+        postgresql_where=sa.text("status NOT IN ('RESOLVED', 'CLOSED')")
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_tickets_unresolved_created_at', table_name='tickets')
@@ -0,0 +1,34 @@
+"""feat: added ticket counters model
+
+Revision ID: 7c2d9e4f1a63
+Revises: e3f1a7c2b914
+Create Date: 2026-10-18 11:02:17.884120
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7c2d9e4f1a63'
+down_revision: Union[str, Sequence[str], None] = 'e3f1a7c2b914'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('ticket_counters',
+    sa.Column('counter_key', sa.String(length=64), nullable=False),
+    sa.Column('count', sa.BigInteger(), server_default='0', nullable=False),
+    sa.PrimaryKeyConstraint('counter_key')
+    )
+    # Counters are filled by the reconcile job that runs on application startup
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('ticket_counters')
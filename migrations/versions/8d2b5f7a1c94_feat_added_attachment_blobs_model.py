@@ -0,0 +1,43 @@
+"""feat: added attachment blobs model
+
+Revision ID: 8d2b5f7a1c94
+Revises: 3f6a9d2c8e41
+Create Date: 2026-10-18 16:42:51.203318
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8d2b5f7a1c94'
+down_revision: Union[str, Sequence[str], None] = '3f6a9d2c8e41'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('attachment_blobs',
+    sa.Column('sha256', sa.String(length=64), nullable=False),
+    sa.Column('size', sa.BigInteger(), nullable=False),
+    sa.Column('content_type', sqlmodel.sql.sqltypes.AutoString(), nullable=False),
+    sa.Column('ref_count', sa.BigInteger(), server_default='0', nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('sha256')
+    )
+    op.add_column('attachments', sa.Column('blob_sha256', sa.String(length=64), nullable=True))
+    op.create_foreign_key('attachments_blob_sha256_fkey', 'attachments', 'attachment_blobs', ['blob_sha256'], ['sha256'])
+    op.create_index('ix_attachments_blob_sha256', 'attachments', ['blob_sha256'], unique=False)
+    # Existing attachments keep their own objects; only new uploads are content-addressed
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_attachments_blob_sha256', table_name='attachments')
+    op.drop_constraint('attachments_blob_sha256_fkey', 'attachments', type_='foreignkey')
+    op.drop_column('attachments', 'blob_sha256')
+    op.drop_table('attachment_blobs')
@@ -0,0 +1,41 @@
+"""feat: added ticket resolutions model
+
+Revision ID: b91f4c0e7d58
+Revises: 5a8e0b3d6f21
+Create Date: 2026-10-18 13:20:04.671935
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b91f4c0e7d58'
+down_revision: Union[str, Sequence[str], None] = '5a8e0b3d6f21'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('ticket_resolutions',
+    sa.Column('ticket_id', sa.UUID(), nullable=False),
+    sa.Column('assigned_to', sa.UUID(), nullable=True),
+    sa.Column('types_of_issue', postgresql.ENUM('HARDWARE', 'SOFTWARE', 'ACCESS_PERMISSION', 'OTHER', name='issue_types', create_type=False), nullable=False),
+    sa.Column('created_at', postgresql.TIMESTAMP(timezone=True), nullable=False),
+    sa.Column('resolved_at', postgresql.TIMESTAMP(timezone=True), nullable=False),
+    sa.Column('resolution_seconds', sa.Float(), nullable=False),
+    sa.ForeignKeyConstraint(['assigned_to'], ['users.user_id'], ondelete='SET NULL'),
+    sa.ForeignKeyConstraint(['ticket_id'], ['tickets.ticket_id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('ticket_id')
+    )
+    # Rows are backfilled from ticket_history on application startup
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('ticket_resolutions')
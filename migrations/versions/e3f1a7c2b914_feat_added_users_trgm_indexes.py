@@ -0,0 +1,47 @@
+"""feat: added users trigram and keyset indexes
+
+Revision ID: e3f1a7c2b914
+Revises: b4ae26a8f173
+Create Date: 2026-10-18 10:12:41.503218
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e3f1a7c2b914'
+down_revision: Union[str, Sequence[str], None] = 'b4ae26a8f173'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Trigram GIN indexes serve the ILIKE '%term%' filters on /analytics/users-stats
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.create_index(
+        'ix_users_full_name_trgm', 'users', ['full_name'],
+        postgresql_using='gin', postgresql_ops={'full_name': 'gin_trgm_ops'}
+    )
+    op.create_index(
+        'ix_users_email_trgm', 'users', ['email'],
+        postgresql_using='gin', postgresql_ops={'email': 'gin_trgm_ops'}
+    )
+    op.create_index(
+        'ix_users_username_trgm', 'users', ['username'],
+        postgresql_using='gin', postgresql_ops={'username': 'gin_trgm_ops'}
+    )
+    # Keyset pagination order for users-stats
+    op.create_index('ix_users_created_at_user_id', 'users', ['created_at', 'user_id'])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_users_created_at_user_id', table_name='users')
+    op.drop_index('ix_users_username_trgm', table_name='users')
+    op.drop_index('ix_users_email_trgm', table_name='users')
+    op.drop_index('ix_users_full_name_trgm', table_name='users')
@@ -0,0 +1,144 @@
+"""Benchmark login throughput and event-loop lag under concurrent sign-ins.
+
+Creates a user with a real argon2 hash, sends concurrent POST /auth/login
+requests through the app in process and, alongside them, runs a ticker that
+measures how late the event loop wakes it up. Each mode reports logins per
+second, the responses by status and the loop lag; the user is deleted
+afterwards.
+
+    pool    password checks go through PasswordHasherPool (what the app does)
+    inline  argon2 runs on the event loop, as before the pool was added
+
+    python -m scripts.bench_login [--logins 200] [--concurrency 50] [--mode pool inline]
+"""
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+import uuid
+from collections import Counter
+from contextlib import contextmanager
+
+import httpx
+from sqlalchemy import delete
+
+from src.auth.hashing import password_hasher
+from src.auth.utils import generate_hash_password, verify_password
+from src.db.models.user import User, UserRole
+from src.db.session import async_session_maker, engine
+from src.main import _app
+
+
+LOGIN_PATH = "/api/v1/auth/login"
+
+# How often the lag probe asks to be woken up
+TICK_SECONDS = 0.005
+
+
+async def probe_loop_lag(lags: list[float], stop: asyncio.Event) -> None:
+    """Record, in ms, how much later than requested each tick resumes."""
+    loop = asyncio.get_running_loop()
+    while not stop.is_set():
+        expected = loop.time() + TICK_SECONDS
+        await asyncio.sleep(TICK_SECONDS)
+        lags.append(max(loop.time() - expected, 0.0) * 1000)
+
+
+@contextmanager
+def inline_hashing():
+    """Verify passwords on the event loop, the way login did before the pool."""
+
+    async def verify(password: str, password_hash: str) -> bool:
+        return verify_password(password, password_hash)
+
+    password_hasher.verify = verify
+    try:
+        yield
+    finally:
+        del password_hasher.verify
+
+
+def percentile(values: list[float], fraction: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(int(len(ordered) * fraction), len(ordered) - 1)]
+
+
+async def run_mode(credentials: dict, logins: int, concurrency: int) -> None:
+    statuses: Counter = Counter()
+    lags: list[float] = []
+    stop = asyncio.Event()
+    semaphore = asyncio.Semaphore(concurrency)
+
+    transport = httpx.ASGITransport(app=_app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=None) as client:
+        async def login():
+            async with semaphore:
+                response = await client.post(LOGIN_PATH, json=credentials)
+            statuses[response.status_code] += 1
+            return response
+
+        # One warm-up login opens the pool connections and loads the app
+        response = await login()
+        if response.status_code != 200:
+            raise SystemExit(f"Warm-up login failed: {response.status_code} {response.text}")
+        statuses.clear()
+
+        probe = asyncio.create_task(probe_loop_lag(lags, stop))
+        started = time.perf_counter()
+        await asyncio.gather(*(login() for _ in range(logins)))
+        elapsed = time.perf_counter() - started
+        stop.set()
+        await probe
+
+    print(f"  {statuses[200] / elapsed:.1f} logins/s over {elapsed:.1f} s, responses {dict(sorted(statuses.items()))}")
+    print(
+        f"  loop lag p50 {statistics.median(lags):.1f} ms, p99 {percentile(lags, 0.99):.1f} ms, "
+        f"max {max(lags):.1f} ms"
+    )
+
+
+async def run(logins: int, concurrency: int, modes: list[str]) -> int:
+    name = f"bench_login_{uuid.uuid4().hex[:8]}"
+    password = "bench-password"
+    email = f"{name}@example.com"
+    credentials = {"username": name, "email": email, "password": password}
+    async with async_session_maker() as session:
+        session.add(User(
+            username=name,
+            email=email,
+            full_name="Login Benchmark",
+            password_hash=generate_hash_password(password),
+            role=UserRole.USER,
+        ))
+        await session.commit()
+
+    try:
+        for mode in modes:
+            print(f"{mode}: {logins} logins at concurrency {concurrency}")
+            if mode == "inline":
+                with inline_hashing():
+                    await run_mode(credentials, logins, concurrency)
+            else:
+                await run_mode(credentials, logins, concurrency)
+        print(f"hasher pool: {password_hasher.stats()}")
+    finally:
+        async with async_session_maker() as session:
+            await session.execute(delete(User).where(User.email == email))
+            await session.commit()
+        password_hasher.shutdown()
+        await engine.dispose()
+    return 0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--logins", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--mode", nargs="+", choices=["pool", "inline"], default=["pool", "inline"])
+    args = parser.parse_args()
+    sys.exit(asyncio.run(run(args.logins, args.concurrency, args.mode)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,173 @@
+"""Load-test the database layer with concurrent GET /ticket/history/{id}.
+
+Creates an admin, a ticket and a page of history, then sends concurrent
+requests through the app in process and reports throughput, latency and the
+pool statistics. The rows are deleted afterwards.
+
+    shared  the app's engine and process-wide session factories
+    legacy  the setup before them: a sessionmaker built on every request over
+            an engine with the default pool and echo=True (logged to /dev/null)
+
+    python -m scripts.bench_pool [--requests 2000] [--concurrency 20] [--mode shared legacy]
+"""
+import argparse
+import asyncio
+import logging
+import os
+import statistics
+import sys
+import time
+import uuid
+from collections import Counter
+from datetime import datetime, timedelta
+
+import httpx
+from sqlalchemy import delete
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from src.auth.utils import create_access_token
+from src.config import Config
+from src.db.main import get_read_session, get_session
+from src.db.models.ticket import IssueType, Ticket, TicketPriority, TicketStatus
+from src.db.models.ticket_history import TicketHistory
+from src.db.models.user import User, UserRole
+from src.db.session import _connect_args, async_session_maker, engine, pool_stats
+from src.main import _app
+
+
+HISTORY_ENTRIES = 20
+
+
+def percentile(values: list[float], fraction: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(int(len(ordered) * fraction), len(ordered) - 1)]
+
+
+async def create_ticket_with_history() -> tuple[User, Ticket]:
+    name = f"bench_pool_{uuid.uuid4().hex[:8]}"
+    async with async_session_maker() as session:
+        admin = User(
+            username=name,
+            email=f"{name}@example.com",
+            full_name="Pool Benchmark",
+            password_hash="not-a-real-hash",
+            role=UserRole.ADMIN,
+        )
+        session.add(admin)
+        await session.flush()
+        ticket = Ticket(
+            subject="Pool benchmark",
+            description="Synthetic ticket for the pool benchmark.",
+            priority=TicketPriority.LOW,
+            types_of_issue=IssueType.OTHER,
+            status=TicketStatus.OPEN,
+            created_by=admin.user_id,
+        )
+        session.add(ticket)
+        await session.flush()
+        started = datetime.utcnow() - timedelta(hours=HISTORY_ENTRIES)
+        session.add_all([
+            TicketHistory(
+                ticket_id=ticket.ticket_id,
+                action_type="comment_added",
+                new_value=f"Comment {index}",
+                changed_by=admin.user_id,
+                changed_at=started + timedelta(hours=index),
+            )
+            for index in range(HISTORY_ENTRIES)
+        ])
+        await session.commit()
+    return admin, ticket
+
+
+def legacy_session_overrides() -> tuple[dict, object]:
+    """Dependency overrides that rebuild the old per-request session setup."""
+    logger = logging.getLogger("sqlalchemy.engine.Engine")
+    # With a handler present, echo=True logs through it instead of stdout
+    logger.addHandler(logging.StreamHandler(open(os.devnull, "w")))
+    legacy_engine = create_async_engine(Config.DATABASE_URL, echo=True, connect_args=_connect_args())
+
+    async def get_legacy_session():
+        session_maker = async_sessionmaker(bind=legacy_engine, class_=AsyncSession, expire_on_commit=False)
+        async with session_maker() as session:
+            yield session
+
+    return {get_session: get_legacy_session, get_read_session: get_legacy_session}, legacy_engine
+
+
+async def run_mode(path: str, headers: dict, requests: int, concurrency: int) -> None:
+    statuses: Counter = Counter()
+    latencies: list[float] = []
+    semaphore = asyncio.Semaphore(concurrency)
+
+    transport = httpx.ASGITransport(app=_app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=None) as client:
+        async def get():
+            async with semaphore:
+                started = time.perf_counter()
+                response = await client.get(path, headers=headers)
+                latencies.append((time.perf_counter() - started) * 1000)
+            statuses[response.status_code] += 1
+            return response
+
+        # One warm-up request opens a connection and caches the principal
+        response = await get()
+        if response.status_code != 200:
+            raise SystemExit(f"Warm-up request failed: {response.status_code} {response.text}")
+        statuses.clear()
+        latencies.clear()
+
+        started = time.perf_counter()
+        await asyncio.gather(*(get() for _ in range(requests)))
+        elapsed = time.perf_counter() - started
+
+    print(f"  {requests / elapsed:.0f} req/s over {elapsed:.1f} s, responses {dict(sorted(statuses.items()))}")
+    print(
+        f"  latency p50 {statistics.median(latencies):.0f} ms, p99 {percentile(latencies, 0.99):.0f} ms, "
+        f"max {max(latencies):.0f} ms"
+    )
+
+
+async def run(requests: int, concurrency: int, modes: list[str]) -> int:
+    admin, ticket = await create_ticket_with_history()
+    token = create_access_token(user_data={
+        "email": admin.email, "user_id": str(admin.user_id), "role": admin.role.value,
+    })
+    path = f"/api/v1/ticket/history/{ticket.ticket_id}"
+    headers = {"Authorization": f"Bearer {token}"}
+
+    try:
+        for mode in modes:
+            print(f"{mode}: {requests} requests at concurrency {concurrency}")
+            if mode == "legacy":
+                overrides, legacy_engine = legacy_session_overrides()
+                _app.dependency_overrides.update(overrides)
+                try:
+                    await run_mode(path, headers, requests, concurrency)
+                finally:
+                    for dependency in overrides:
+                        _app.dependency_overrides.pop(dependency, None)
+                    await legacy_engine.dispose()
+            else:
+                await run_mode(path, headers, requests, concurrency)
+                print(f"  pool: {pool_stats()['primary']}")
+    finally:
+        async with async_session_maker() as session:
+            await session.execute(delete(Ticket).where(Ticket.ticket_id == ticket.ticket_id))
+            await session.execute(delete(User).where(User.user_id == admin.user_id))
+            await session.commit()
+        await engine.dispose()
+    return 0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--mode", nargs="+", choices=["shared", "legacy"], default=["shared", "legacy"])
+    args = parser.parse_args()
+    sys.exit(asyncio.run(run(args.requests, args.concurrency, args.mode)))
+
+
+if __name__ == "__main__":
+    main()
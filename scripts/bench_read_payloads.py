@@ -0,0 +1,183 @@
+"""Measure the rows and bytes each read endpoint pulls from the database.
+
+Creates users and a page of tickets (one with comments and attachments),
+calls each endpoint once through the app in process and records the SELECTs
+it sent. Each SELECT is then run again wrapped in a count(*) and
+sum(pg_column_size()) to report the result rows and bytes the request
+transferred. The rows are deleted afterwards.
+
+Caches are kept in process memory so every first request reaches the
+database; the principal is looked up once before measuring. For reference,
+the same ticket page is also loaded as select(Ticket) entities, which joins
+both users.
+
+    python -m scripts.bench_read_payloads [--users 50] [--tickets 21]
+"""
+import os
+
+# Every endpoint is measured cold, whatever cache the environment configures
+os.environ["CACHE_BACKEND"] = "memory"
+
+import argparse
+import asyncio
+import sys
+import uuid
+from datetime import datetime, timedelta
+
+import httpx
+from sqlalchemy import delete, select
+
+from src.analytics.overdue import overdue_thresholds
+from src.auth.utils import create_access_token
+from src.db.models.attachment import Attachment
+from src.db.models.comment import Comment
+from src.db.models.ticket import IssueType, Ticket, TicketPriority, TicketStatus
+from src.db.models.ticket_history import TicketHistory
+from src.db.models.user import User, UserRole
+from src.db.session import async_session_maker, engine
+from src.main import _app
+from tests.queries import recorded_queries
+
+
+DETAIL_CHILDREN = 5
+
+
+async def create_rows(prefix: str, users: int, tickets: int) -> tuple[User, Ticket]:
+    """An admin who reported every ticket (unassigned and overdue) and other users."""
+    async with async_session_maker() as session:
+        people = [
+            User(
+                username=f"{prefix}_{index}",
+                email=f"{prefix}_{index}@example.com",
+                full_name=f"Payload User {index}",
+                password_hash="$argon2id$v=19$m=65536,t=3,p=4$" + "x" * 70,
+                role=UserRole.ADMIN if index == 0 else UserRole.USER,
+            )
+            for index in range(users)
+        ]
+        session.add_all(people)
+        await session.flush()
+        admin = people[0]
+
+        created_at = datetime.utcnow() - max(overdue_thresholds().values()) - timedelta(days=1)
+        ticket_rows = [
+            Ticket(
+                subject=f"Payload ticket {index}",
+                description="The printer on floor two is jammed again. " * 4,
+                priority=TicketPriority.LOW,
+                types_of_issue=IssueType.HARDWARE,
+                status=TicketStatus.OPEN,
+                created_by=admin.user_id,
+                created_at=created_at + timedelta(minutes=index),
+                updated_at=created_at + timedelta(minutes=index),
+            )
+            for index in range(tickets)
+        ]
+        session.add_all(ticket_rows)
+        await session.flush()
+
+        detailed = ticket_rows[-1]
+        session.add_all([
+            Comment(content=f"Comment {index} on the jammed printer.", ticket_id=detailed.ticket_id, user_id=admin.user_id)
+            for index in range(DETAIL_CHILDREN)
+        ] + [
+            Attachment(
+                ticket_id=detailed.ticket_id,
+                file_name=f"photo-{index}.jpg",
+                file_url=f"tickets/{detailed.ticket_id}/photo-{index}.jpg",
+                file_type="image/jpeg",
+            )
+            for index in range(DETAIL_CHILDREN)
+        ] + [
+            TicketHistory(
+                ticket_id=detailed.ticket_id,
+                action_type="comment_added",
+                new_value=f"Comment {index}",
+                changed_by=admin.user_id,
+                changed_at=created_at + timedelta(hours=index),
+            )
+            for index in range(DETAIL_CHILDREN * 2)
+        ])
+        await session.commit()
+    return admin, detailed
+
+
+async def transferred(connection, queries: list) -> tuple[int, int, int]:
+    """Statements, result rows and result bytes of the SELECTs in queries."""
+    selects = [query for query in queries if query[0].lstrip().upper().startswith(("SELECT", "WITH"))]
+    rows = size = 0
+    for statement, parameters in selects:
+        result = await connection.exec_driver_sql(
+            f"SELECT count(*), coalesce(sum(pg_column_size(r.*)), 0) FROM ({statement}) AS r", parameters
+        )
+        count, total = result.one()
+        rows += count
+        size += total
+    return len(selects), rows, size
+
+
+def report(name: str, queries: int, rows: int, size: int) -> None:
+    print(f"{name:<34} {queries:>7} {rows:>6} {size:>8}")
+
+
+async def run(users: int, tickets: int) -> int:
+    prefix = f"bench_payload_{uuid.uuid4().hex[:8]}"
+    admin, detailed = await create_rows(prefix, users, tickets)
+    token = create_access_token(user_data={
+        "email": admin.email, "user_id": str(admin.user_id), "role": admin.role.value,
+    })
+    headers = {"Authorization": f"Bearer {token}"}
+    endpoints = {
+        "GET /ticket/{id}": f"/api/v1/ticket/{detailed.ticket_id}",
+        f"GET /user/all-users ({users})": f"/api/v1/user/all-users?page_size={users}",
+        "GET /ticket/history/{id}": f"/api/v1/ticket/history/{detailed.ticket_id}",
+        "GET /ticket/my-tickets": "/api/v1/ticket/my-tickets",
+        "GET /ticket/unassigned": "/api/v1/ticket/unassigned",
+        "GET /analytics/overdue-tickets": "/api/v1/analytics/overdue-tickets",
+    }
+
+    try:
+        print(f"{'endpoint':<34} {'queries':>7} {'rows':>6} {'bytes':>8}")
+        transport = httpx.ASGITransport(app=_app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client, \
+                engine.connect() as connection:
+            # Resolve and cache the principal so it is not counted below
+            response = await client.get("/api/v1/health/db-pool", headers=headers)
+            if response.status_code != 200:
+                raise SystemExit(f"Warm-up request failed: {response.status_code} {response.text}")
+
+            for name, path in endpoints.items():
+                with recorded_queries(engine) as queries:
+                    response = await client.get(path, headers=headers)
+                if response.status_code != 200:
+                    raise SystemExit(f"{name} failed: {response.status_code} {response.text}")
+                report(name, *await transferred(connection, queries))
+
+            async with async_session_maker() as session:
+                with recorded_queries(engine) as queries:
+                    await session.execute(
+                        select(Ticket)
+                        .where(Ticket.created_by == admin.user_id)
+                        .order_by(Ticket.created_at.desc())
+                        .limit(tickets)
+                    )
+            report("my-tickets page as select(Ticket)", *await transferred(connection, queries))
+    finally:
+        async with async_session_maker() as session:
+            await session.execute(delete(Ticket).where(Ticket.created_by == admin.user_id))
+            await session.execute(delete(User).where(User.username.like(f"{prefix}_%")))
+            await session.commit()
+        await engine.dispose()
+    return 0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--users", type=int, default=50)
+    parser.add_argument("--tickets", type=int, default=21)
+    args = parser.parse_args()
+    sys.exit(asyncio.run(run(args.users, args.tickets)))
+
+
+if __name__ == "__main__":
+    main()
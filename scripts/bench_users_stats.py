@@ -0,0 +1,129 @@
+"""Benchmark the grouped per-user ticket stats behind /users-stats and /detail-stats.
+
+Seeds users and tickets inside a transaction, calls AnalyticsService the way
+both endpoints do and reports how many statements each call sent and how
+long it took, then rolls the seed back. --per-user-sample also times the old
+path (one status count per user) on a sample of users and extrapolates it to
+every user, since running it in full takes minutes.
+
+The seed is rolled back, but ANALYZE writes the table size estimates in
+place; run this against a disposable or staging database, not production.
+
+    python -m scripts.bench_users_stats [--users 10000] [--tickets 1000000] [--repeat 5]
+"""
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from datetime import datetime, timedelta
+
+from sqlalchemy import func, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+# Every model is registered before the services build their projections
+from src.db.models.attachment import Attachment
+from src.db.models.comment import Comment
+from src.db.models.ticket import Ticket
+from src.db.models.ticket_history import TicketHistory
+from src.db.models.user import User
+from src.db.session import engine
+from src.analytics.service import AnalyticsService
+from scripts.check_query_plans import TICKET_SEED_STATEMENTS, seed
+from tests.queries import recorded_statements
+
+
+BENCHMARKED_TABLES = "users, tickets"
+
+
+async def measure(call, repeat: int) -> tuple[int, list[float]]:
+    """Run call repeat times; returns the statements of one run and every run's latency in ms."""
+    timings = []
+    for _ in range(repeat):
+        with recorded_statements(engine) as statements:
+            started = time.perf_counter()
+            await call()
+            timings.append((time.perf_counter() - started) * 1000)
+    return len(statements), timings
+
+
+def report(name: str, queries: int, timings: list[float]) -> None:
+    print(
+        f"{name:<28} {queries:>7} queries  p50 {statistics.median(timings):>10.1f} ms  "
+        f"max {max(timings):>10.1f} ms"
+    )
+
+
+async def per_user_stats(session: AsyncSession, user_ids: list) -> None:
+    """The path the grouped query replaced: one status count per user."""
+    for user_id in user_ids:
+        await session.execute(
+            select(Ticket.status, func.count(Ticket.ticket_id))
+            .where(Ticket.assigned_to == user_id)
+            .group_by(Ticket.status)
+        )
+
+
+async def run(users: int, tickets: int, repeat: int, per_user_sample: int) -> int:
+    analytics = AnalyticsService()
+    now = datetime.utcnow()
+    month_ago = now - timedelta(days=30)
+
+    async with engine.connect() as connection:
+        transaction = await connection.begin()
+        try:
+            started = time.perf_counter()
+            await seed(connection, users, tickets, TICKET_SEED_STATEMENTS)
+            await connection.execute(text(f"ANALYZE {BENCHMARKED_TABLES}"))
+            print(f"Seeded {users} users and {tickets} tickets in {time.perf_counter() - started:.1f} s")
+
+            session = AsyncSession(bind=connection, join_transaction_mode="create_savepoint", expire_on_commit=False)
+            scenarios = {
+                "users-stats first page": lambda: analytics.get_users_with_stats(session),
+                "users-stats last 30 days": lambda: analytics.get_users_with_stats(
+                    session, start_date=month_ago, end_date=now
+                ),
+                "users-stats by name": lambda: analytics.get_users_with_stats(
+                    session, full_name="plan user 1", statuses=["assigned_open"]
+                ),
+                "detail-stats": lambda: analytics.SupportMetricsService(session),
+            }
+            for name, scenario in scenarios.items():
+                report(name, *await measure(scenario, repeat))
+
+            if per_user_sample:
+                user_ids = list((await session.execute(
+                    select(User.user_id).limit(per_user_sample)
+                )).scalars())
+                queries, timings = await measure(lambda: per_user_stats(session, user_ids), repeat)
+                scale = users / len(user_ids)
+                report(
+                    f"per-user path (x{scale:.0f})",
+                    round(queries * scale) + 1,
+                    [timing * scale for timing in timings],
+                )
+        finally:
+            await transaction.rollback()
+
+    # The rollback removed the seed but not the size estimates it gave the planner
+    async with engine.begin() as connection:
+        await connection.execute(text(f"ANALYZE {BENCHMARKED_TABLES}"))
+    await engine.dispose()
+    return 0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--users", type=int, default=10000)
+    parser.add_argument("--tickets", type=int, default=1000000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument(
+        "--per-user-sample", type=int, default=200,
+        help="Users to time the old per-user path on; 0 skips it.",
+    )
+    args = parser.parse_args()
+    sys.exit(asyncio.run(run(args.users, args.tickets, args.repeat, args.per_user_sample)))
+
+
+if __name__ == "__main__":
+    main()
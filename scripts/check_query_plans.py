@@ -0,0 +1,298 @@
+"""Fail when a hot query falls back to a sequential scan.
+
+Seeds a synthetic dataset inside a transaction, calls the ticket, history
+and analytics services on it, records the statements they send and runs
+EXPLAIN ANALYZE on each, then rolls everything back. Exits with status 1 if
+any plan reads one of the large tables with a Seq Scan (tables under
+MIN_TABLE_ROWS rows are not checked).
+
+The seeded rows are rolled back, but ANALYZE writes the table size
+estimates (pg_class.reltuples) in place, so the rollback does not undo
+them; the checker analyzes the tables again afterwards. Run the seeded
+mode against a disposable or staging database, not production.
+
+    python -m scripts.check_query_plans [--tickets 100000] [--no-seed]
+"""
+import argparse
+import asyncio
+import json
+import sys
+from datetime import datetime, timedelta
+from typing import Optional
+
+from sqlalchemy import select, text
+from fastapi import HTTPException
+from sqlalchemy.ext.asyncio import AsyncSession
+
+# Every model is registered before the services build their projections
+from src.db.models.attachment import Attachment
+from src.db.models.comment import Comment
+from src.db.models.ticket import Ticket, TicketPriority, TicketStatus
+from src.db.models.ticket_history import TicketHistory
+from src.db.models.user import User, UserRole
+from src.db.session import engine
+from src.analytics.schemas import ResolutionGroupBy, VolumeInterval
+from src.analytics.service import AnalyticsService
+from src.ticket.schemas import HistoryTotal
+from src.ticket.service import TicketService
+from tests.factories import auth_context
+from tests.queries import recorded_queries
+
+
+# Tables that grow with ticket volume; users is small enough to scan
+CHECKED_TABLES = {"tickets", "ticket_history", "comments", "attachments", "ticket_resolutions"}
+
+# Below this size a sequential scan is the right plan
+MIN_TABLE_ROWS = 1000
+
+
+# ==================== Seed data ====================
+
+# Users and a year of tickets; the benchmarks that only need these use them alone
+TICKET_SEED_STATEMENTS = [
+    """
+    INSERT INTO users (user_id, username, email, full_name, password_hash, role, is_active, created_at, updated_at)
+    SELECT gen_random_uuid(), 'plan_user_' || g, 'plan_user_' || g || '@example.com', 'Plan User ' || g, 'x',
+           (ARRAY['USER', 'ADMIN', 'IT_SUPPORT', 'MANAGER'])[1 + g % 4]::user_roles, true, now(), now()
+    FROM generate_series(1, :users) g
+    """,
+    # A year of tickets; only recent ones and a small tail of old ones are unresolved
+    """
+    WITH u AS (SELECT array_agg(user_id) AS ids FROM users WHERE username LIKE 'plan_user_%%')
+    INSERT INTO tickets (ticket_id, subject, description, priority, types_of_issue, status,
+                         created_by, assigned_to, created_at, updated_at)
+    SELECT gen_random_uuid(), 'Ticket ' || g, 'Synthetic ticket',
+           (ARRAY['LOW', 'MEDIUM', 'HIGH'])[1 + g % 3]::ticket_priority,
+           (ARRAY['HARDWARE', 'SOFTWARE', 'ACCESS_PERMISSION', 'OTHER'])[1 + g % 4]::issue_types,
+           CASE WHEN g % 50 = 0 OR g > :tickets * 0.99
+                THEN (ARRAY['OPEN', 'IN_PROGRESS', 'APPROVAL_PENDING', 'APPROVED', 'PENDING'])[1 + g % 5]
+                ELSE (ARRAY['RESOLVED', 'CLOSED'])[1 + g % 2] END::ticket_status,
+           u.ids[1 + (g * 7) % :users],
+           CASE WHEN g % 40 = 0 THEN NULL ELSE u.ids[1 + (g * 13) % :users] END,
+           now() - interval '365 days' * (1 - g::float / :tickets),
+           now() - interval '365 days' * (1 - g::float / :tickets) + interval '1 hour'
+    FROM generate_series(1, :tickets) g, u
+    """,
+]
+
+SEED_STATEMENTS = TICKET_SEED_STATEMENTS + [
+    """
+    INSERT INTO ticket_history (history_id, ticket_id, action_type, old_value, new_value, changed_by, changed_at)
+    SELECT gen_random_uuid(), t.ticket_id, e.action_type, NULL, e.new_value, t.created_by, t.created_at + e.delay
+    FROM tickets t
+    CROSS JOIN (VALUES
+        ('created', NULL, interval '0'),
+        ('status_changed', 'TicketStatus.RESOLVED', interval '1 hour')
+    ) AS e(action_type, new_value, delay)
+    WHERE t.subject LIKE 'Ticket %%'
+    """,
+    """
+    INSERT INTO comments (comment_id, content, ticket_id, user_id, visibility, created_at, updated_at)
+    SELECT gen_random_uuid(), 'Synthetic comment', ticket_id, created_by, 'PUBLIC', created_at, created_at
+    FROM tickets WHERE subject LIKE 'Ticket %%'
+    """,
+    """
+    INSERT INTO attachments (attachment_id, ticket_id, file_name, file_url, file_type, uploaded_at)
+    SELECT gen_random_uuid(), ticket_id, 'file.txt', 'https://example.com/file.txt', 'text/plain', created_at
+    FROM tickets WHERE subject LIKE 'Ticket %%' AND ticket_id::text < '8'
+    """,
+    """
+    INSERT INTO ticket_resolutions (ticket_id, assigned_to, types_of_issue, created_at, resolved_at, resolution_seconds)
+    SELECT ticket_id, assigned_to, types_of_issue, created_at, created_at + interval '1 hour', 3600
+    FROM tickets WHERE subject LIKE 'Ticket %%' AND status = 'RESOLVED'
+    """,
+]
+
+
+async def seed(connection, users: int, tickets: int, statements: list[str] = SEED_STATEMENTS) -> None:
+    for statement in statements:
+        await connection.execute(text(statement), {"users": users, "tickets": tickets})
+
+
+# ==================== Hot queries ====================
+
+async def hot_queries(session: AsyncSession, admin: User, reporter: User, assignee: User, ticket_id) -> dict:
+    """Call the services behind the hot endpoints; returns the statements each one sent.
+
+    Caches are bypassed (details are loaded directly, history totals are
+    exact) so every call reaches the database.
+    """
+    tickets = TicketService()
+    analytics = AnalyticsService()
+    now = datetime.utcnow()
+    month_ago = now - timedelta(days=30)
+
+    async def second_page(first_page: dict, load) -> None:
+        if first_page["next_cursor"]:
+            await load(first_page["next_cursor"])
+
+    async def my_tickets():
+        load = lambda cursor=None: tickets.get_user_tickets(auth_context(assignee), session, cursor=cursor)
+        await second_page(await load(), load)
+
+    async def ticket_history():
+        load = lambda cursor=None: tickets.get_ticket_history(
+            ticket_id, auth_context(admin), session, cursor=cursor, total=HistoryTotal.EXACT
+        )
+        await second_page(await load(), load)
+
+    async def filtered_history():
+        # The route always scopes history to one ticket
+        load = lambda cursor=None: tickets.get_ticket_history(
+            ticket_id, auth_context(admin), session,
+            status=TicketStatus.RESOLVED, priority=TicketPriority.HIGH, changed_by=reporter.user_id,
+            cursor=cursor, limit=1, total=HistoryTotal.EXACT,
+        )
+        await second_page(await load(), load)
+
+    scenarios = {
+        "my tickets": my_tickets,
+        "my tickets by status": lambda: tickets.get_user_tickets(
+            auth_context(assignee), session, status=TicketStatus.OPEN
+        ),
+        "unassigned tickets": lambda: tickets.get_unassigned_tickets(session),
+        "unassigned by priority": lambda: tickets.get_unassigned_tickets(session, priority=TicketPriority.HIGH),
+        "ticket details": lambda: tickets._load_ticket_details(ticket_id, session),
+        "ticket history": ticket_history,
+        "own ticket history": lambda: tickets.get_ticket_history(
+            ticket_id, auth_context(reporter), session, total=HistoryTotal.EXACT
+        ),
+        "filtered history": filtered_history,
+        "opened today": lambda: analytics.get_tickets_opened_today(session),
+        "ticket volume": lambda: analytics.get_ticket_volume(session, VolumeInterval.DAY, month_ago, now),
+        "overdue count": lambda: analytics.get_overdue_tickets_count(session),
+        "overdue tickets": lambda: analytics.get_overdue_tickets(session),
+        "resolution times": lambda: analytics.get_resolution_times(
+            session, ResolutionGroupBy.ASSIGNEE, month_ago, now
+        ),
+        "assignee ticket stats": lambda: analytics.SupportMetricsService(
+            session, month_ago, now, user_id=assignee.user_id
+        ),
+        "users stats by name": lambda: analytics.get_users_with_stats(
+            session, full_name="plan user 1", statuses=["assigned_open"]
+        ),
+        "users stats by email": lambda: analytics.get_users_with_stats(
+            session, roles=["it_support", "admin"], email="plan_user_2", start_date=month_ago, end_date=now
+        ),
+    }
+
+    statements = {}
+    for name, scenario in scenarios.items():
+        with recorded_queries(engine) as queries:
+            try:
+                await scenario()
+            except HTTPException:
+                # An empty result can be a 404; its queries still ran
+                pass
+        selects = [query for query in queries if query[0].lstrip().upper().startswith(("SELECT", "WITH"))]
+        for index, query in enumerate(selects, start=1):
+            statements[name if len(selects) == 1 else f"{name} [{index}]"] = query
+    return statements
+
+
+async def explain(connection, statement: str, parameters) -> dict:
+    raw = (await connection.exec_driver_sql(
+        "EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) " + statement, parameters
+    )).scalar_one()
+    return (json.loads(raw) if isinstance(raw, str) else raw)[0]
+
+
+async def plan_users(session: AsyncSession) -> Optional[tuple[User, User, User, object]]:
+    """An admin, a reporter with tickets, an assignee and one of the assignee's tickets."""
+    ticket = (await session.execute(
+        select(Ticket.ticket_id, Ticket.assigned_to)
+        .where(Ticket.assigned_to.is_not(None))
+        .order_by(Ticket.updated_at.desc())
+        .limit(1)
+    )).first()
+    admin = (await session.execute(select(User).where(User.role == UserRole.ADMIN).limit(1))).scalar()
+    reporter = (await session.execute(
+        select(User).join(Ticket, Ticket.created_by == User.user_id).where(User.role == UserRole.USER).limit(1)
+    )).scalar()
+    if ticket is None or admin is None or reporter is None:
+        return None
+    assignee = await session.get(User, ticket.assigned_to)
+    return admin, reporter, assignee, ticket.ticket_id
+
+
+def _walk(plan: dict):
+    yield plan
+    for child in plan.get("Plans", []):
+        yield from _walk(child)
+
+
+async def large_tables(connection) -> set[str]:
+    await connection.execute(text("ANALYZE " + ", ".join(sorted(CHECKED_TABLES))))
+    result = await connection.execute(
+        text("SELECT relname FROM pg_class WHERE relname = ANY(:tables) AND reltuples >= :min_rows"),
+        {"tables": sorted(CHECKED_TABLES), "min_rows": MIN_TABLE_ROWS},
+    )
+    return set(result.scalars())
+
+
+def seq_scans(plan: dict, tables: set[str]) -> list[str]:
+    return [
+        node["Relation Name"]
+        for node in _walk(plan)
+        if node["Node Type"] == "Seq Scan" and node.get("Relation Name") in tables
+    ]
+
+
+def scan_nodes(plan: dict) -> str:
+    return ", ".join(
+        f"{node['Node Type']} {node.get('Index Name') or node['Relation Name']}"
+        for node in _walk(plan)
+        if "Relation Name" in node or "Index Name" in node
+    )
+
+
+async def check_plans(users: int, tickets: int, with_seed: bool) -> int:
+    failures = 0
+    async with engine.connect() as connection:
+        transaction = await connection.begin()
+        try:
+            if with_seed:
+                await seed(connection, users, tickets)
+            checked_tables = await large_tables(connection)
+
+            # Service commits release a savepoint; the seed stays in the outer transaction
+            session = AsyncSession(bind=connection, join_transaction_mode="create_savepoint", expire_on_commit=False)
+            found = await plan_users(session)
+            if found is None:
+                print("No tickets to plan against; run without --no-seed.")
+                return 1
+
+            for name, (statement, parameters) in (await hot_queries(session, *found)).items():
+                result = await explain(connection, statement, parameters)
+                plan = result["Plan"]
+                scanned = seq_scans(plan, checked_tables)
+                failures += bool(scanned)
+                print(
+                    f"{'FAIL' if scanned else 'ok  '} {name:<26} {result['Execution Time']:>9.3f} ms  "
+                    f"{scan_nodes(plan)}"
+                )
+        finally:
+            await transaction.rollback()
+
+    if with_seed:
+        # The rollback removed the seed but not the size estimates it gave the planner
+        async with engine.begin() as connection:
+            await connection.execute(text("ANALYZE " + ", ".join(sorted(CHECKED_TABLES))))
+    await engine.dispose()
+
+    if failures:
+        print(f"{failures} hot queries use a sequential scan.")
+    return 1 if failures else 0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--users", type=int, default=500)
+    parser.add_argument("--tickets", type=int, default=100000)
+    parser.add_argument("--no-seed", action="store_true", help="Plan against the existing data only.")
+    args = parser.parse_args()
+    sys.exit(asyncio.run(check_plans(args.users, args.tickets, not args.no_seed)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,40 @@
+from src.config import Config
+from src.cache import create_cache
+from src.utils.cache import make_cache_key
+
+
+# Tags describe which writes make a cached analytics response stale
+TICKETS_TAG = "tickets"
+# Deleting a ticket also changes counts for time ranges that have already ended
+TICKET_DELETES_TAG = "ticket_deletes"
+USERS_TAG = "users"
+
+analytics_cache = create_cache(
+    "analytics",
+    ttl_seconds=Config.ANALYTICS_CACHE_TTL_SECONDS,
+    max_local_entries=Config.ANALYTICS_CACHE_MAX_ENTRIES,
+)
+
+
+async def invalidate_ticket_analytics(deleted: bool = False) -> None:
+    """Call after a committed ticket write; pass deleted=True for a ticket delete."""
+    if deleted:
+        await analytics_cache.invalidate(TICKETS_TAG, TICKET_DELETES_TAG)
+    else:
+        await analytics_cache.invalidate(TICKETS_TAG)
+
+
+async def invalidate_user_analytics() -> None:
+    """Call after a committed user role/status change."""
+    await analytics_cache.invalidate(USERS_TAG)
+
+
+__all__ = [
+    "analytics_cache",
+    "make_cache_key",
+    "invalidate_ticket_analytics",
+    "invalidate_user_analytics",
+    "TICKETS_TAG",
+    "TICKET_DELETES_TAG",
+    "USERS_TAG",
+]
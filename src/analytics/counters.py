@@ -0,0 +1,150 @@
+from sqlmodel.ext.asyncio.session import AsyncSession
+from sqlmodel import select, func
+from sqlalchemy import delete, text
+from sqlalchemy.dialects.postgresql import insert
+from src.db.models.ticket import Ticket, TicketStatus, TicketPriority
+from src.db.models.ticket_counter import TicketCounter
+from typing import Iterable, Optional, Dict
+from uuid import UUID
+
+
+UNASSIGNED_COUNTER_KEY = "unassigned"
+
+
+def status_counter_key(status: TicketStatus) -> str:
+    return f"status:{status.value}"
+
+
+def priority_counter_key(priority: TicketPriority) -> str:
+    return f"priority:{priority.value}"
+
+
+class TicketCounterService:
+    """Keeps the ticket_counters rollup in step with ticket writes.
+
+    Adjustments are executed on the caller's session and are committed
+    together with the ticket change that caused them.
+    """
+
+    def counter_keys(
+            self,
+            status: TicketStatus,
+            priority: TicketPriority,
+            assigned_to: Optional[UUID]
+    ) -> list[str]:
+        """Counters a ticket in this state contributes to."""
+        keys = [status_counter_key(status), priority_counter_key(priority)]
+        if assigned_to is None:
+            keys.append(UNASSIGNED_COUNTER_KEY)
+        return keys
+
+    def ticket_counter_keys(self, ticket: Ticket) -> list[str]:
+        return self.counter_keys(ticket.status, ticket.priority, ticket.assigned_to)
+
+    async def apply_change(
+            self,
+            session: AsyncSession,
+            old_keys: Iterable[str],
+            new_keys: Iterable[str]
+    ) -> None:
+        """Move a ticket from old_keys to new_keys with a single upsert."""
+        old_keys, new_keys = set(old_keys), set(new_keys)
+        deltas = {key: -1 for key in old_keys - new_keys}
+        deltas.update({key: 1 for key in new_keys - old_keys})
+        if not deltas:
+            return
+
+        # Sorted so concurrent updates lock counter rows in the same order
+        statement = insert(TicketCounter).values([
+            {"counter_key": key, "count": deltas[key]} for key in sorted(deltas)
+        ])
+        statement = statement.on_conflict_do_update(
+            index_elements=[TicketCounter.counter_key],
+            set_={"count": TicketCounter.count + statement.excluded.count},
+        )
+        await session.execute(statement)
+
+    async def get_counts(
+            self,
+            session: AsyncSession,
+            keys: Iterable[str]
+    ) -> Dict[str, int]:
+        """Look up counters by key; missing counters are zero."""
+        result = await session.execute(
+            select(TicketCounter.counter_key, TicketCounter.count)
+            .where(TicketCounter.counter_key.in_(list(keys)))
+        )
+        return {row.counter_key: row.count for row in result.all()}
+
+    async def reconcile(
+            self,
+            session: AsyncSession
+    ) -> Dict[str, int]:
+        """Rebuild every counter from the tickets table and commit."""
+        await self._lock(session)
+        return await self._rebuild(session)
+
+    async def backfill(
+            self,
+            session: AsyncSession
+    ) -> Optional[Dict[str, int]]:
+        """Rebuild the counters if there are none; returns them, or None if there were."""
+        # Checked before locking so a populated table never blocks ticket writes
+        if not await self.is_empty(session):
+            await session.commit()
+            return None
+        await self._lock(session)
+        if not await self.is_empty(session):
+            await session.commit()
+            return None
+        return await self._rebuild(session)
+
+    async def is_empty(
+            self,
+            session: AsyncSession
+    ) -> bool:
+        result = await session.execute(select(TicketCounter.counter_key).limit(1))
+        return result.first() is None
+
+    async def _lock(
+            self,
+            session: AsyncSession
+    ) -> None:
+        # Block ticket writes while rebuilding so no adjustment is lost
+        await session.execute(text("LOCK TABLE tickets IN SHARE MODE"))
+        # SHARE is self-compatible; this makes concurrent rebuilds (several
+        # workers starting at once) run one after another
+        await session.execute(text("LOCK TABLE ticket_counters IN EXCLUSIVE MODE"))
+
+    async def _rebuild(
+            self,
+            session: AsyncSession
+    ) -> Dict[str, int]:
+        counts: Dict[str, int] = {}
+        status_rows = await session.execute(
+            select(Ticket.status, func.count(Ticket.ticket_id).label("count"))
+            .group_by(Ticket.status)
+        )
+        for row in status_rows.all():
+            counts[status_counter_key(row.status)] = row.count
+
+        priority_rows = await session.execute(
+            select(Ticket.priority, func.count(Ticket.ticket_id).label("count"))
+            .group_by(Ticket.priority)
+        )
+        for row in priority_rows.all():
+            counts[priority_counter_key(row.priority)] = row.count
+
+        unassigned = await session.execute(
+            select(func.count(Ticket.ticket_id)).where(Ticket.assigned_to.is_(None))
+        )
+        counts[UNASSIGNED_COUNTER_KEY] = unassigned.scalar_one() or 0
+
+        await session.execute(delete(TicketCounter))
+        await session.execute(
+            insert(TicketCounter).values([
+                {"counter_key": key, "count": count} for key, count in counts.items()
+            ])
+        )
+        await session.commit()
+        return counts
@@ -0,0 +1,99 @@
+from sqlmodel.ext.asyncio.session import AsyncSession
+from sqlmodel import select, func
+from sqlalchemy import and_, or_, tuple_
+from src.config import Config
+from src.db.models.ticket import Ticket, TicketStatus, TicketPriority
+from src.errors import BadRequestError
+from src.utils.pagination import encode_cursor, decode_cursor
+from src.ticket.projections import TICKET_SUMMARY
+from datetime import datetime, timedelta
+from typing import Optional, Dict
+from uuid import UUID
+
+
+# Must match the predicate of ix_tickets_unresolved_created_at
+RESOLVED_STATUSES = [TicketStatus.RESOLVED, TicketStatus.CLOSED]
+
+OVERDUE_PAGE_SIZE = 20
+
+
+def overdue_thresholds() -> Dict[TicketPriority, timedelta]:
+    """Per-priority SLA thresholds from settings."""
+    return {
+        TicketPriority.LOW: timedelta(hours=Config.OVERDUE_SLA_HOURS_LOW),
+        TicketPriority.MEDIUM: timedelta(hours=Config.OVERDUE_SLA_HOURS_MEDIUM),
+        TicketPriority.HIGH: timedelta(hours=Config.OVERDUE_SLA_HOURS_HIGH),
+    }
+
+
+class OverdueTicketService:
+    """Finds unresolved tickets that have been open longer than their priority's SLA."""
+
+    def _overdue_conditions(self, now: datetime) -> list:
+        """Build predicates served by the partial created_at index."""
+        cutoffs = {
+            priority: now - threshold
+            for priority, threshold in overdue_thresholds().items()
+        }
+        return [
+            Ticket.status.not_in(RESOLVED_STATUSES),
+            # Range on the indexed column; the per-priority check below refines it
+            Ticket.created_at < max(cutoffs.values()),
+            or_(*[
+                and_(Ticket.priority == priority, Ticket.created_at < cutoff)
+                for priority, cutoff in cutoffs.items()
+            ]),
+        ]
+
+    async def count_overdue_tickets(
+            self,
+            session: AsyncSession
+    ) -> int:
+        result = await session.execute(
+            select(func.count(Ticket.ticket_id))
+            .where(*self._overdue_conditions(datetime.utcnow()))
+        )
+        return result.scalar_one() or 0
+
+    async def get_overdue_tickets(
+            self,
+            session: AsyncSession,
+            cursor: Optional[str] = None,
+            limit: int = OVERDUE_PAGE_SIZE
+    ) -> dict:
+        """Get a page of overdue tickets, oldest first."""
+        statement = (
+            TICKET_SUMMARY.select()
+            .where(*self._overdue_conditions(datetime.utcnow()))
+        )
+
+        if cursor:
+            values = decode_cursor(cursor)
+            try:
+                last_created_at = datetime.fromisoformat(values["created_at"])
+                last_ticket_id = UUID(values["ticket_id"])
+            except (KeyError, TypeError, ValueError):
+                raise BadRequestError("Invalid pagination cursor.")
+            statement = statement.where(
+                tuple_(Ticket.created_at, Ticket.ticket_id) > tuple_(last_created_at, last_ticket_id)
+            )
+
+        statement = (
+            statement
+            .order_by(Ticket.created_at.asc(), Ticket.ticket_id.asc())
+            .limit(limit + 1)
+        )
+        tickets = (await session.execute(statement)).all()
+
+        next_cursor = None
+        if len(tickets) > limit:
+            tickets = tickets[:limit]
+            next_cursor = encode_cursor({
+                "created_at": tickets[-1].created_at.isoformat(),
+                "ticket_id": str(tickets[-1].ticket_id),
+            })
+
+        return {
+            "tickets": [dict(row._mapping) for row in tickets],
+            "next_cursor": next_cursor,
+        }
@@ -0,0 +1,219 @@
+from sqlmodel.ext.asyncio.session import AsyncSession
+from sqlmodel import select, func
+from sqlalchemy import delete, text
+from sqlalchemy.dialects.postgresql import insert
+from src.db.models.ticket import Ticket, TicketStatus
+from src.db.models.ticket_history import TicketHistory
+from src.db.models.ticket_resolution import TicketResolution
+from src.db.models.user import User
+from .schemas import ResolutionGroupBy, ResolutionTimeStats, ResolutionTimesResponse
+from datetime import datetime, timezone
+from typing import Optional
+
+
+# status_changed history entries store str(TicketStatus)
+RESOLVED_HISTORY_VALUE = str(TicketStatus.RESOLVED)
+CLOSED_HISTORY_VALUE = str(TicketStatus.CLOSED)
+
+SECONDS_PER_HOUR = 3600
+
+
+def _as_utc(value: datetime) -> datetime:
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value
+
+
+class ResolutionMetricsService:
+    """Time-to-resolution metrics served from the ticket_resolutions table.
+
+    A ticket's row is written when it moves to RESOLVED and removed when it
+    is reopened (moved to any status other than RESOLVED/CLOSED), so
+    percentile queries never need to rescan ticket_history.
+    """
+
+    async def record_status_change(
+            self,
+            session: AsyncSession,
+            ticket: Ticket,
+            new_status: TicketStatus,
+            changed_at: Optional[datetime] = None
+    ) -> None:
+        """Update the ticket's resolution row; runs in the caller's transaction."""
+        if new_status == TicketStatus.CLOSED:
+            return
+
+        if new_status != TicketStatus.RESOLVED:
+            await session.execute(
+                delete(TicketResolution).where(TicketResolution.ticket_id == ticket.ticket_id)
+            )
+            return
+
+        resolved_at = _as_utc(changed_at or datetime.now(timezone.utc))
+        created_at = _as_utc(ticket.created_at)
+        values = {
+            "ticket_id": ticket.ticket_id,
+            "assigned_to": ticket.assigned_to,
+            "types_of_issue": ticket.types_of_issue,
+            "created_at": created_at,
+            "resolved_at": resolved_at,
+            "resolution_seconds": (resolved_at - created_at).total_seconds(),
+        }
+        statement = insert(TicketResolution).values(**values)
+        statement = statement.on_conflict_do_update(
+            index_elements=[TicketResolution.ticket_id],
+            set_={key: value for key, value in values.items() if key != "ticket_id"},
+        )
+        await session.execute(statement)
+
+    async def rebuild(
+            self,
+            session: AsyncSession
+    ) -> int:
+        """Recompute every resolution row in one pass over ticket_history and commit."""
+        await self._lock(session)
+
+        # Latest status event per ticket, ignoring CLOSED so resolved-then-closed
+        # tickets keep their resolution time
+        status_events = (
+            select(
+                TicketHistory.ticket_id,
+                TicketHistory.new_value,
+                TicketHistory.changed_at,
+                func.row_number().over(
+                    partition_by=TicketHistory.ticket_id,
+                    order_by=TicketHistory.changed_at.desc(),
+                ).label("event_rank"),
+            )
+            .where(
+                TicketHistory.action_type == "status_changed",
+                TicketHistory.new_value != CLOSED_HISTORY_VALUE,
+            )
+            .subquery()
+        )
+
+        resolutions = (
+            select(
+                Ticket.ticket_id,
+                Ticket.assigned_to,
+                Ticket.types_of_issue,
+                Ticket.created_at,
+                status_events.c.changed_at,
+                func.extract("epoch", status_events.c.changed_at - Ticket.created_at),
+            )
+            .join(status_events, status_events.c.ticket_id == Ticket.ticket_id)
+            .where(
+                status_events.c.event_rank == 1,
+                status_events.c.new_value == RESOLVED_HISTORY_VALUE,
+            )
+        )
+
+        await session.execute(delete(TicketResolution))
+        result = await session.execute(
+            insert(TicketResolution).from_select(
+                [
+                    "ticket_id",
+                    "assigned_to",
+                    "types_of_issue",
+                    "created_at",
+                    "resolved_at",
+                    "resolution_seconds",
+                ],
+                resolutions,
+            )
+        )
+        await session.commit()
+        return result.rowcount
+
+    async def backfill(
+            self,
+            session: AsyncSession
+    ) -> Optional[int]:
+        """Rebuild the table if it is empty; returns the row count, or None if it was not."""
+        await self._lock(session)
+        if not await self.is_empty(session):
+            await session.commit()
+            return None
+        return await self.rebuild(session)
+
+    async def _lock(
+            self,
+            session: AsyncSession
+    ) -> None:
+        # Until commit: concurrent rebuilds (several workers starting at once)
+        # wait for each other, and status changes wait for the rebuild
+        await session.execute(text("LOCK TABLE ticket_resolutions IN EXCLUSIVE MODE"))
+
+    async def is_empty(
+            self,
+            session: AsyncSession
+    ) -> bool:
+        result = await session.execute(select(TicketResolution.ticket_id).limit(1))
+        return result.first() is None
+
+    async def get_resolution_times(
+            self,
+            session: AsyncSession,
+            group_by: ResolutionGroupBy = ResolutionGroupBy.ASSIGNEE,
+            start_date: Optional[datetime] = None,
+            end_date: Optional[datetime] = None
+    ) -> ResolutionTimesResponse:
+        """MTTR and p50/p90/p99 resolution hours per assignee, role or issue type."""
+        seconds = TicketResolution.resolution_seconds
+
+        if group_by == ResolutionGroupBy.ASSIGNEE:
+            group_columns = [TicketResolution.assigned_to, User.username]
+        elif group_by == ResolutionGroupBy.ROLE:
+            group_columns = [User.role]
+        else:
+            group_columns = [TicketResolution.types_of_issue]
+
+        statement = (
+            select(
+                *group_columns,
+                func.count().label("resolved_tickets"),
+                func.avg(seconds).label("mean_seconds"),
+                func.percentile_cont(0.5).within_group(seconds).label("p50_seconds"),
+                func.percentile_cont(0.9).within_group(seconds).label("p90_seconds"),
+                func.percentile_cont(0.99).within_group(seconds).label("p99_seconds"),
+            )
+            .select_from(TicketResolution)
+            .outerjoin(User, User.user_id == TicketResolution.assigned_to)
+            .group_by(*group_columns)
+        )
+
+        if start_date:
+            statement = statement.where(TicketResolution.resolved_at >= start_date)
+        if end_date:
+            statement = statement.where(TicketResolution.resolved_at <= end_date)
+
+        result = await session.execute(statement)
+
+        stats = []
+        for row in result.all():
+            if group_by == ResolutionGroupBy.ASSIGNEE:
+                group = str(row.assigned_to) if row.assigned_to else None
+                label = row.username
+            elif group_by == ResolutionGroupBy.ROLE:
+                group = row.role.value if row.role else None
+                label = group
+            else:
+                group = row.types_of_issue.value
+                label = group
+
+            stats.append(ResolutionTimeStats(
+                group=group,
+                label=label,
+                resolved_tickets=row.resolved_tickets,
+                mttr_hours=round(row.mean_seconds / SECONDS_PER_HOUR, 2),
+                p50_hours=round(row.p50_seconds / SECONDS_PER_HOUR, 2),
+                p90_hours=round(row.p90_seconds / SECONDS_PER_HOUR, 2),
+                p99_hours=round(row.p99_seconds / SECONDS_PER_HOUR, 2),
+            ))
+
+        return ResolutionTimesResponse(
+            group_by=group_by,
+            results=stats,
+            start_date=start_date,
+            end_date=end_date,
+        )
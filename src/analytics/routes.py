@@ -1,8 +1,14 @@
 from fastapi import APIRouter, Depends, status, Query
 from sqlmodel.ext.asyncio.session import AsyncSession
-from .service import AnalyticsService
+from .service import AnalyticsService, USERS_STATS_PAGE_SIZE, OVERDUE_PAGE_SIZE
+from .schemas import AnalyticsDashboardResponse, RoleTicketStatsResponse, UsersWithStatsResponse, OverdueTicketsResponse, TicketVolumeResponse, VolumeInterval, ResolutionGroupBy, ResolutionTimesResponse
+from .cache import analytics_cache, make_cache_key, TICKETS_TAG, USERS_TAG
+from src.cache import cache_stats
+from src.ticket.blobs import attachment_blob_service
+from src.ticket.service import TicketService
 from src.auth.dependencies import role_checker
-from src.db.main import get_session
+from src.db.main import get_session, get_read_session
+from src.db.session import on_primary
 from src.db.models import User
 from typing import Optional
 from datetime import datetime
@@ -12,7 +18,9 @@ from uuid import UUID
 
 analytics_router = APIRouter()
 analytics_service = AnalyticsService()
+ticket_service = TicketService()
 AnalyticsAccess = Depends(role_checker(["admin", "manager", "it_support"]))
+AdminOnly = Depends(role_checker(["admin"]))
 
 
 @analytics_router.get(
@@ -22,16 +30,100 @@ AnalyticsAccess = Depends(role_checker(["admin", "manager", "it_support"]))
     summary="Get analytics dashboard data",
 )
 async def get_analytics_dashboard(
-    session: AsyncSession = Depends(get_session),
     page: int = Query(1, ge=1, description="Page number for pagination"),
     page_size: int = Query(10, ge=1, le=100, description="Number of items per page"),
 ):
-    return await analytics_service.get_analytics_dashboard(
+    return await analytics_cache.get_or_compute(
+        make_cache_key("dashboard", page=page, page_size=page_size),
+        on_primary(lambda: analytics_service.get_analytics_dashboard(
+            page=page,
+            page_size=page_size
+        )),
+        response_type=AnalyticsDashboardResponse,
+        tags=(TICKETS_TAG,),
+    )
+
+@analytics_router.get(
+    "/overdue-tickets",
+    status_code=status.HTTP_200_OK,
+    response_model=OverdueTicketsResponse,
+    dependencies=[AnalyticsAccess],
+    summary="Get unresolved tickets open longer than their priority's SLA",
+)
+async def get_overdue_tickets(
+    session: AsyncSession = Depends(get_read_session),
+    cursor: Optional[str] = Query(None, description="Cursor returned as next_cursor by the previous page"),
+    limit: int = Query(OVERDUE_PAGE_SIZE, ge=1, le=100, description="Number of tickets per page"),
+):
+    """Overdue tickets, oldest first."""
+    return await analytics_service.get_overdue_tickets(
         session=session,
-        page=page,
-        page_size=page_size
+        cursor=cursor,
+        limit=limit
     )
 
+@analytics_router.get(
+    "/ticket-volume",
+    status_code=status.HTTP_200_OK,
+    response_model=TicketVolumeResponse,
+    dependencies=[AnalyticsAccess],
+    summary="Get created/resolved ticket counts per hour, day or week",
+)
+async def get_ticket_volume(
+    session: AsyncSession = Depends(get_read_session),
+    interval: VolumeInterval = Query(VolumeInterval.DAY, description="Bucket size"),
+    start_date: Optional[datetime] = Query(None, description="Start of the series (defaults to 30 buckets back)"),
+    end_date: Optional[datetime] = Query(None, description="End of the series (defaults to now)"),
+):
+    return await analytics_service.get_ticket_volume(
+        session=session,
+        interval=interval,
+        start_date=start_date,
+        end_date=end_date
+    )
+
+@analytics_router.get(
+    "/resolution-times",
+    status_code=status.HTTP_200_OK,
+    response_model=ResolutionTimesResponse,
+    dependencies=[AnalyticsAccess],
+    summary="Get mean and p50/p90/p99 time to resolution",
+)
+async def get_resolution_times(
+    session: AsyncSession = Depends(get_read_session),
+    group_by: ResolutionGroupBy = Query(ResolutionGroupBy.ASSIGNEE, description="Group by assignee, role or issue type"),
+    start_date: Optional[datetime] = Query(None, description="Only tickets resolved on or after this date"),
+    end_date: Optional[datetime] = Query(None, description="Only tickets resolved on or before this date"),
+):
+    return await analytics_service.get_resolution_times(
+        session=session,
+        group_by=group_by,
+        start_date=start_date,
+        end_date=end_date
+    )
+
+@analytics_router.post(
+    "/resolution-times/rebuild",
+    status_code=status.HTTP_200_OK,
+    dependencies=[AdminOnly],
+    summary="Recompute resolution times from ticket history",
+)
+async def rebuild_resolution_times(
+    session: AsyncSession = Depends(get_session),
+):
+    return await analytics_service.rebuild_resolution_times(session)
+
+@analytics_router.post(
+    "/counters/reconcile",
+    status_code=status.HTTP_200_OK,
+    dependencies=[AdminOnly],
+    summary="Rebuild dashboard ticket counters from the tickets table",
+)
+async def reconcile_ticket_counters(
+    session: AsyncSession = Depends(get_session),
+):
+    return await analytics_service.reconcile_ticket_counters(session)
+
 @analytics_router.get(
     "/detail-stats",
     status_code=status.HTTP_200_OK,
@@ -39,7 +131,7 @@ async def get_analytics_dashboard(
     summary="Get support metrics based on user roles and user",
 )
 async def get_support_metrics(
-    session: AsyncSession = Depends(get_session),
+    session: AsyncSession = Depends(get_read_session),
     start_date: Optional[datetime] = Query(None, description="Start date for filtering metrics"),
     end_date: Optional[datetime] = Query(None, description="End date for filtering metrics"),
     user_id: Optional[UUID] = Query(None, description="User ID to filter metrics"),
@@ -48,12 +140,23 @@ async def get_support_metrics(
         description="List of user roles to filter metrics (e.g., admin, it_support, manager)"
     ),
 ):
-    return await analytics_service.SupportMetricsService(
-        session=session,
-        start_date=start_date,
-        end_date=end_date,
-        user_id=user_id,
-        roles=roles
+    return await analytics_cache.get_or_compute(
+        make_cache_key(
+            "detail-stats",
+            start_date=start_date,
+            end_date=end_date,
+            user_id=user_id,
+            roles=roles,
+        ),
+        on_primary(lambda: analytics_service.SupportMetricsService(
+            session=session,
+            start_date=start_date,
+            end_date=end_date,
+            user_id=user_id,
+            roles=roles
+        )),
+        response_type=RoleTicketStatsResponse,
+        tags=(TICKETS_TAG, USERS_TAG),
     )
 
 @analytics_router.get(
@@ -63,20 +166,85 @@ async def get_support_metrics(
     summary="Get all users with their ticket statistics (not grouped by role)",
 )
 async def get_users_with_stats(
-    session: AsyncSession = Depends(get_session),
+    session: AsyncSession = Depends(get_read_session),
     start_date: Optional[datetime] = Query(None, description="Start date for filtering metrics"),
     end_date: Optional[datetime] = Query(None, description="End date for filtering metrics"),
     roles: Optional[list[str]] = Query(
         None,
         description="List of user roles to filter (e.g., admin, it_support, manager). Defaults to all privileged roles."
     ),
+    full_name: Optional[str] = Query(None, description="Case-insensitive substring match on full name"),
+    email: Optional[str] = Query(None, description="Case-insensitive substring match on email"),
+    username: Optional[str] = Query(None, description="Case-insensitive substring match on username"),
+    statuses: Optional[list[str]] = Query(
+        None,
+        description="Only users with tickets in at least one of these statuses (e.g., resolved, assigned_open)"
+    ),
+    cursor: Optional[str] = Query(None, description="Cursor returned as next_cursor by the previous page"),
+    limit: int = Query(USERS_STATS_PAGE_SIZE, ge=1, le=200, description="Number of users per page"),
 ):
     """Get a flat list of users with their ticket statistics, without role grouping."""
-    return await analytics_service.get_users_with_stats(
-        session=session,
-        start_date=start_date,
-        end_date=end_date,
-        roles=roles
+    return await analytics_cache.get_or_compute(
+        make_cache_key(
+            "users-stats",
+            start_date=start_date,
+            end_date=end_date,
+            roles=roles,
+            full_name=full_name.lower() if full_name else None,
+            email=email.lower() if email else None,
+            username=username.lower() if username else None,
+            statuses=[ticket_status.lower() for ticket_status in statuses] if statuses else None,
+            cursor=cursor,
+            limit=limit,
+        ),
+        on_primary(lambda: analytics_service.get_users_with_stats(
+            session=session,
+            start_date=start_date,
+            end_date=end_date,
+            roles=roles,
+            full_name=full_name,
+            email=email,
+            username=username,
+            statuses=statuses,
+            cursor=cursor,
+            limit=limit
+        )),
+        response_type=UsersWithStatsResponse,
+        tags=(TICKETS_TAG, USERS_TAG),
     )
 
 
+@analytics_router.get(
+    "/cache-stats",
+    status_code=status.HTTP_200_OK,
+    dependencies=[AdminOnly],
+    summary="Get hit/miss counters for every shared cache",
+)
+async def get_cache_stats():
+    return cache_stats()
+
+
+@analytics_router.get(
+    "/attachment-storage",
+    status_code=status.HTTP_200_OK,
+    dependencies=[AdminOnly],
+    summary="Get attachment storage saved by content deduplication",
+)
+async def get_attachment_storage_stats(
+    session: AsyncSession = Depends(get_read_session),
+):
+    return await attachment_blob_service.storage_stats(session)
+
+@analytics_router.post(
+    "/attachment-storage/sweep",
+    status_code=status.HTTP_200_OK,
+    dependencies=[AdminOnly],
+    summary="Delete stored attachment files that no attachment references",
+)
+async def sweep_attachment_storage(
+    session: AsyncSession = Depends(get_session),
+):
+    return {
+        "deleted_blobs": await attachment_blob_service.delete_unreferenced(session),
+        "deleted_uploads": await ticket_service.delete_unfinalized_uploads(session),
+    }
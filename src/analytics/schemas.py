@@ -1,7 +1,9 @@
 from pydantic import BaseModel
-from typing import List, Optional
+from typing import Dict, List, Optional
 from uuid import UUID
 from datetime import datetime
+from src.ticket.schemas import TicketSummaryResponse
+import enum
 
 class TicketCountByStatus(BaseModel):
     open : int = 0
@@ -24,6 +26,7 @@ class UserWithTicketStats(BaseModel):
     full_name: str | None
     role: str
     is_active: bool
+    created_at: Optional[datetime] = None
     resolved: int = 0
     pending: int = 0
     assigned_open: int = 0
@@ -52,8 +55,51 @@ class AnalyticsDashboardResponse(BaseModel):
     tickets_opened_today: int
     overdue_tickets: int
     unassigned_tickets: int
+    section_timings_ms: Dict[str, float] = {}
 
 class UsersWithStatsResponse(BaseModel):
     users: List[UserWithTicketStats]
     start_date: Optional[datetime] = None
     end_date: Optional[datetime] = None
+    next_cursor: Optional[str] = None
+
+
+class OverdueTicketsResponse(BaseModel):
+    tickets: List[TicketSummaryResponse]
+    next_cursor: Optional[str] = None
+
+
+class VolumeInterval(str, enum.Enum):
+    HOUR = "hour"
+    DAY = "day"
+    WEEK = "week"
+
+class TicketVolumeBucket(BaseModel):
+    bucket_start: datetime
+    created: int = 0
+    resolved: int = 0
+
+class TicketVolumeResponse(BaseModel):
+    interval: VolumeInterval
+    buckets: List[TicketVolumeBucket]
+
+
+class ResolutionGroupBy(str, enum.Enum):
+    ASSIGNEE = "assignee"
+    ROLE = "role"
+    ISSUE_TYPE = "issue_type"
+
+class ResolutionTimeStats(BaseModel):
+    group: Optional[str] = None
+    label: Optional[str] = None
+    resolved_tickets: int = 0
+    mttr_hours: float = 0
+    p50_hours: float = 0
+    p90_hours: float = 0
+    p99_hours: float = 0
+
+class ResolutionTimesResponse(BaseModel):
+    group_by: ResolutionGroupBy
+    results: List[ResolutionTimeStats]
+    start_date: Optional[datetime] = None
+    end_date: Optional[datetime] = None
@@ -1,18 +1,52 @@
+import asyncio
+import time
 from sqlmodel.ext.asyncio.session import AsyncSession
-from .schemas import TicketCountByStatus, TicketCountByPriority, AnalyticsDashboardResponse, RoleTicketStatsResponse, RoleTicketStatusBreakdown, UserWithTicketStats, UsersWithStatsResponse
+from .schemas import TicketCountByStatus, TicketCountByPriority, AnalyticsDashboardResponse, RoleTicketStatsResponse, RoleTicketStatusBreakdown, UserWithTicketStats, UsersWithStatsResponse, TicketVolumeResponse, VolumeInterval, ResolutionGroupBy, ResolutionTimesResponse
 from sqlmodel import select, func
 from src.db.models.ticket import Ticket, TicketStatus, TicketPriority
 from src.db.models.user import User, UserRole
 from src.user.service import UserManagementService
+from src.config import Config
+from src.db.session import read_session_maker
+from .overdue import OverdueTicketService, OVERDUE_PAGE_SIZE
+from .timeseries import TicketVolumeService
+from .resolution import ResolutionMetricsService
+from .counters import TicketCounterService, UNASSIGNED_COUNTER_KEY, status_counter_key, priority_counter_key
 from datetime import datetime, timedelta
-from sqlalchemy import cast, Date
-from typing import Optional, Dict
+from sqlalchemy import and_, false, tuple_
+from typing import Optional, Dict, Any, Awaitable, Callable
 from uuid import UUID
+from src.errors import BadRequestError
+from src.utils.pagination import encode_cursor, decode_cursor
+
+
+# Maps UserWithTicketStats fields to the ticket status they count
+USER_STATS_STATUS_FIELDS = {
+    "resolved": TicketStatus.RESOLVED,
+    "pending": TicketStatus.PENDING,
+    "assigned_open": TicketStatus.OPEN,
+    "in_progress": TicketStatus.IN_PROGRESS,
+    "approval_pending": TicketStatus.APPROVAL_PENDING,
+    "approved": TicketStatus.APPROVED,
+}
+
+USERS_STATS_PAGE_SIZE = 50
+
+# Connections one dashboard fill holds at once; the rest of the pool stays
+# free for other endpoints while its sections run
+DASHBOARD_MAX_CONNECTIONS = max(1, Config.DB_POOL_SIZE // 2)
+
+# Roles whose users are listed in support metrics
+SUPPORT_ROLES = {UserRole.ADMIN, UserRole.IT_SUPPORT, UserRole.MANAGER}
 
 
 class AnalyticsService:
     def __init__(self):
         self.user_service = UserManagementService() ## Import User Management Service
+        self.counter_service = TicketCounterService()
+        self.overdue_service = OverdueTicketService()
+        self.volume_service = TicketVolumeService()
+        self.resolution_service = ResolutionMetricsService()
 
     # ==================== Helper Methods ====================
 
@@ -21,25 +55,18 @@ class AnalyticsService:
             self,
             session : AsyncSession
     ) -> TicketCountByStatus:
-        tickets = await session.execute(
-            select(
-                Ticket.status,
-                func.count(Ticket.ticket_id).label("count")
-            )
-            .group_by(Ticket.status)
+        status_counts = await self.counter_service.get_counts(
+            session, [status_counter_key(ticket_status) for ticket_status in TicketStatus]
         )
-        status_counts = {
-            row.status.value: row.count for row in tickets.all()
-        }
 
         return TicketCountByStatus(
-            open=status_counts.get("open", 0),
-            in_progress=status_counts.get("in_progress", 0),
-            resolved=status_counts.get("resolved", 0),
-            closed=status_counts.get("closed", 0),
-            approval_pending=status_counts.get("approval_pending", 0),
-            approved=status_counts.get("approved", 0),
-            pending=status_counts.get("pending", 0)
+            open=status_counts.get(status_counter_key(TicketStatus.OPEN), 0),
+            in_progress=status_counts.get(status_counter_key(TicketStatus.IN_PROGRESS), 0),
+            resolved=status_counts.get(status_counter_key(TicketStatus.RESOLVED), 0),
+            closed=status_counts.get(status_counter_key(TicketStatus.CLOSED), 0),
+            approval_pending=status_counts.get(status_counter_key(TicketStatus.APPROVAL_PENDING), 0),
+            approved=status_counts.get(status_counter_key(TicketStatus.APPROVED), 0),
+            pending=status_counts.get(status_counter_key(TicketStatus.PENDING), 0)
         )
     
 
@@ -47,71 +74,143 @@ class AnalyticsService:
             self,
             session: AsyncSession
     ) -> TicketCountByPriority:
-        tickets = await session.execute(
-            select(
-                Ticket.priority,
-                func.count(Ticket.ticket_id).label("count")
-            )
-            .group_by(Ticket.priority)
+        priority_counts = await self.counter_service.get_counts(
+            session, [priority_counter_key(priority) for priority in TicketPriority]
         )
-        priority_counts = {
-            row.priority.value: row.count for row in tickets.all()
-        }
 
         return TicketCountByPriority(
-            low=priority_counts.get("low", 0),
-            medium=priority_counts.get("medium", 0),
-            high=priority_counts.get("high", 0),
+            low=priority_counts.get(priority_counter_key(TicketPriority.LOW), 0),
+            medium=priority_counts.get(priority_counter_key(TicketPriority.MEDIUM), 0),
+            high=priority_counts.get(priority_counter_key(TicketPriority.HIGH), 0),
         )
 
     async def get_unassigned_tickets(
             self,
             session: AsyncSession
     ) -> int:
-        result = await session.execute(
-            select(func.count(Ticket.ticket_id))
-            .where(Ticket.assigned_to == None)
+        counts = await self.counter_service.get_counts(
+            session, [UNASSIGNED_COUNTER_KEY]
         )
-        return result.scalar_one() or 0
+        return counts.get(UNASSIGNED_COUNTER_KEY, 0)
 
     async def get_tickets_opened_today(
             self,
             session : AsyncSession
     ) -> int:
         
-        today_utc = datetime.utcnow().date()
+        # Range predicate instead of casting created_at, so an index on it can be used
+        today_start = datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0)
         tickets = await session.execute(
             select(func.count(Ticket.ticket_id))
             .where(
-                cast(Ticket.created_at, Date) == today_utc
+                Ticket.created_at >= today_start,
+                Ticket.created_at < today_start + timedelta(days=1)
             )
         )
         return tickets.scalar_one() or 0
     
+    async def get_ticket_volume(
+            self,
+            session: AsyncSession,
+            interval: VolumeInterval = VolumeInterval.DAY,
+            start_date: Optional[datetime] = None,
+            end_date: Optional[datetime] = None
+    ) -> TicketVolumeResponse:
+        return await self.volume_service.get_ticket_volume(
+            session, interval, start_date, end_date
+        )
 
+    async def get_resolution_times(
+            self,
+            session: AsyncSession,
+            group_by: ResolutionGroupBy = ResolutionGroupBy.ASSIGNEE,
+            start_date: Optional[datetime] = None,
+            end_date: Optional[datetime] = None
+    ) -> ResolutionTimesResponse:
+        return await self.resolution_service.get_resolution_times(
+            session, group_by, start_date, end_date
+        )
+
+    async def rebuild_resolution_times(
+            self,
+            session: AsyncSession
+    ) -> dict:
+        """Recompute ticket_resolutions from ticket_history."""
+        resolved_tickets = await self.resolution_service.rebuild(session)
+        return {"resolved_tickets": resolved_tickets}
+
+    async def get_overdue_tickets_count(
+            self,
+            session: AsyncSession
+    ) -> int:
+        return await self.overdue_service.count_overdue_tickets(session)
+
+    async def get_overdue_tickets(
+            self,
+            session: AsyncSession,
+            cursor: Optional[str] = None,
+            limit: int = OVERDUE_PAGE_SIZE
+    ) -> dict:
+        return await self.overdue_service.get_overdue_tickets(session, cursor, limit)
 
     # ==================== Main Service Method ====================
 
+    async def _run_dashboard_section(
+            self,
+            name: str,
+            section: Callable[[AsyncSession], Awaitable[Any]],
+            timings: Dict[str, float],
+            connections: asyncio.Semaphore
+    ) -> Any:
+        """Run one dashboard section on its own read session and record its duration."""
+        async with connections, read_session_maker() as section_session:
+            started = time.perf_counter()
+            result = await section(section_session)
+            timings[name] = round((time.perf_counter() - started) * 1000, 2)
+        return result
+
     async def get_analytics_dashboard(
             self,
-            session : AsyncSession,
             page: int = 1,
             page_size: int = 10
     ) -> AnalyticsDashboardResponse:
-        tickets_by_status = await self.get_tickets_by_status(session)
-        tickets_by_priority = await self.get_tickets_by_priority(session)
-        tickets_opened_today = await self.get_tickets_opened_today(session)
-        unassigned_tickets = await self.get_unassigned_tickets(session)
+        # Sections are independent, so run them concurrently on separate
+        # connections, at most DASHBOARD_MAX_CONNECTIONS at a time: the dashboard
+        # costs a few round trips instead of one per section.
+        timings: Dict[str, float] = {}
+        connections = asyncio.Semaphore(DASHBOARD_MAX_CONNECTIONS)
+        (
+            tickets_by_status,
+            tickets_by_priority,
+            tickets_opened_today,
+            unassigned_tickets,
+            overdue_tickets,
+        ) = await asyncio.gather(
+            self._run_dashboard_section("tickets_by_status", self.get_tickets_by_status, timings, connections),
+            self._run_dashboard_section("tickets_by_priority", self.get_tickets_by_priority, timings, connections),
+            self._run_dashboard_section("tickets_opened_today", self.get_tickets_opened_today, timings, connections),
+            self._run_dashboard_section("unassigned_tickets", self.get_unassigned_tickets, timings, connections),
+            self._run_dashboard_section("overdue_tickets", self.get_overdue_tickets_count, timings, connections),
+        )
 
         return AnalyticsDashboardResponse(
             tickets_by_status=tickets_by_status,
             tickets_by_priority=tickets_by_priority,
             tickets_opened_today=tickets_opened_today,
-            overdue_tickets=0,
+            overdue_tickets=overdue_tickets,
             unassigned_tickets=unassigned_tickets,
+            section_timings_ms=timings,
         )
     
 
+    async def reconcile_ticket_counters(
+            self,
+            session: AsyncSession
+    ) -> Dict[str, int]:
+        """Rebuild the ticket_counters rollup from the tickets table."""
+        return await self.counter_service.reconcile(session)
+
+
     # ==================== Support Metrics Helper Methods ====================
 
     async def _validate_and_filter_roles(
@@ -216,113 +315,103 @@ class AnalyticsService:
 
         return role_breakdowns
 
-    async def _get_users_by_role(
-            self,
-            session: AsyncSession,
-            role_enum: UserRole
-    ) -> list[User]:
-        """Get all users for a specific role."""
-        if role_enum == UserRole.ADMIN:
-            return await self.user_service.get_all_admins(session)
-        elif role_enum == UserRole.IT_SUPPORT:
-            return await self.user_service.get_all_support(session)
-        elif role_enum == UserRole.MANAGER:
-            return await self.user_service.get_all_managers(session)
-        else:
-            return []
-
-    async def _calculate_user_ticket_stats(
+    def _build_users_ticket_stats_query(
             self,
-            session: AsyncSession,
-            user: User,
             start_date: Optional[datetime] = None,
-            end_date: Optional[datetime] = None
-    ) -> Dict[str, int]:
-        """Calculate ticket statistics for a single user."""
-        ticket_stats_query = (
+            end_date: Optional[datetime] = None,
+            roles: Optional[list[UserRole]] = None
+    ):
+        """Build a single grouped query returning users with their per-status ticket counts."""
+        # Date filters live in the join condition so users without tickets are still returned
+        join_condition = Ticket.assigned_to == User.user_id
+        if start_date:
+            join_condition = and_(join_condition, Ticket.created_at >= start_date)
+        if end_date:
+            join_condition = and_(join_condition, Ticket.created_at <= end_date)
+
+        status_counts = [
+            func.count(Ticket.ticket_id).filter(Ticket.status == ticket_status).label(field)
+            for field, ticket_status in USER_STATS_STATUS_FIELDS.items()
+        ]
+
+        statement = (
             select(
-                Ticket.status,
-                func.count(Ticket.ticket_id).label("count")
+                User.user_id,
+                User.username,
+                User.email,
+                User.full_name,
+                User.role,
+                User.is_active,
+                User.created_at,
+                *status_counts
             )
-            .where(Ticket.assigned_to == user.user_id)
+            .select_from(User)
+            .outerjoin(Ticket, join_condition)
         )
-        
-        # Apply date filters if provided
-        if start_date:
-            ticket_stats_query = ticket_stats_query.where(Ticket.created_at >= start_date)
-        if end_date:
-            ticket_stats_query = ticket_stats_query.where(Ticket.created_at <= end_date)
-        
-        ticket_stats_query = ticket_stats_query.group_by(Ticket.status)
-        ticket_stats_result = await session.execute(ticket_stats_query)
-        
-        # Initialize counts
-        stats = {
-            "resolved": 0,
-            "pending": 0,
-            "assigned_open": 0,
-            "in_progress": 0,
-            "approval_pending" : 0,
-            "approved" : 0,
-        }
-        
-        # Aggregate ticket counts by status
-        for stat_row in ticket_stats_result.all():
-            if stat_row.status == TicketStatus.RESOLVED:
-                stats["resolved"] = stat_row.count
-            elif stat_row.status == TicketStatus.PENDING:
-                stats["pending"] = stat_row.count
-            elif stat_row.status == TicketStatus.OPEN:
-                stats["assigned_open"] = stat_row.count
-            elif stat_row.status == TicketStatus.IN_PROGRESS:
-                stats["in_progress"] = stat_row.count
-            elif stat_row.status == TicketStatus.APPROVAL_PENDING:
-                stats["approval_pending"] = stat_row.count
-            elif stat_row.status == TicketStatus.APPROVED:
-                stats["approved"] = stat_row.count
-        
-        return stats
+
+        if roles is not None:
+            statement = statement.where(User.role.in_(roles))
+
+        return (
+            statement
+            .group_by(User.user_id)
+            .order_by(User.created_at.desc(), User.user_id.desc())
+        )
+
+    async def _fetch_users_with_ticket_stats(
+            self,
+            session: AsyncSession,
+            statement
+    ) -> list[UserWithTicketStats]:
+        """Run a grouped stats query and stream its rows into UserWithTicketStats."""
+        result = await session.stream(statement)
+
+        return [
+            UserWithTicketStats(
+                user_id=row.user_id,
+                username=row.username,
+                email=row.email,
+                full_name=row.full_name,
+                role=row.role.value,
+                is_active=row.is_active,
+                created_at=row.created_at,
+                **{field: getattr(row, field) for field in USER_STATS_STATUS_FIELDS}
+            )
+            async for row in result
+        ]
+
+    def _get_support_role_enums(
+            self,
+            role_values: list[str]
+    ) -> list[UserRole]:
+        """Convert role values to enums, keeping only roles listed in support metrics."""
+        role_enums = []
+        for role_value in role_values:
+            try:
+                role_enum = UserRole(role_value)
+            except ValueError:
+                # Invalid role, skip
+                continue
+            if role_enum in SUPPORT_ROLES:
+                role_enums.append(role_enum)
+        return role_enums
 
     async def _get_users_with_ticket_stats(
             self,
             session: AsyncSession,
-            role_value: str,
+            role_values: list[str],
             start_date: Optional[datetime] = None,
             end_date: Optional[datetime] = None
     ) -> list[UserWithTicketStats]:
-        """Get all users for a role with their ticket statistics."""
-        users_list = []
-        
-        try:
-            role_enum = UserRole(role_value)
-            users = await self._get_users_by_role(session, role_enum)
-            
-            # Calculate ticket stats for each user
-            for user in users:
-                stats = await self._calculate_user_ticket_stats(
-                    session, user, start_date, end_date
-                )
-                
-                # Create user with ticket stats
-                user_with_stats = UserWithTicketStats(
-                    user_id=user.user_id,
-                    username=user.username,
-                    email=user.email,
-                    full_name=user.full_name,
-                    role=user.role.value,
-                    is_active=user.is_active,
-                    resolved=stats["resolved"],
-                    pending=stats["pending"],
-                    assigned_open=stats["assigned_open"],
-                    in_progress=stats["in_progress"]
-                )
-                users_list.append(user_with_stats)
-                
-        except ValueError:
-            # Invalid role, skip
-            pass
-        
-        return users_list
+        """Get all users for the given roles with their ticket statistics."""
+        role_enums = self._get_support_role_enums(role_values)
+        if not role_enums:
+            return []
+
+        statement = self._build_users_ticket_stats_query(
+            start_date, end_date, role_enums
+        )
+        return await self._fetch_users_with_ticket_stats(session, statement)
 
     # ==================== Main Service Method ====================
 
@@ -352,12 +441,12 @@ class AnalyticsService:
             role_status_counts, filtered_roles
         )
 
-        # Step 4: Fetch users with ticket stats for each role
-        for role_value in filtered_roles:
-            users_with_stats = await self._get_users_with_ticket_stats(
-                session, role_value, start_date, end_date
-            )
-            role_breakdowns[role_value].users = users_with_stats
+        # Step 4: Fetch users with ticket stats for all roles in one query
+        users_with_stats = await self._get_users_with_ticket_stats(
+            session, filtered_roles, start_date, end_date
+        )
+        for user_with_stats in users_with_stats:
+            role_breakdowns[user_with_stats.role].users.append(user_with_stats)
             
         return RoleTicketStatsResponse(
             results=list(role_breakdowns.values()),
@@ -368,130 +457,86 @@ class AnalyticsService:
     
     # ==================== Users Stats Helper Methods ====================
 
-    async def _get_all_users_with_stats(
-            self,
-            session: AsyncSession,
-            start_date: Optional[datetime] = None,
-            end_date: Optional[datetime] = None,
-    ) -> list[UserWithTicketStats]:
-        """Get all users with their ticket statistics."""
-        all_users_result = await session.execute(select(User))
-        all_users = all_users_result.scalars().all()
-
-        all_users_with_stats = []
-        for user in all_users:
-            stats = await self._calculate_user_ticket_stats(
-                session, user, start_date, end_date
-            )
-            user_with_stats = UserWithTicketStats(
-                user_id=user.user_id,
-                username=user.username,
-                email=user.email,
-                full_name=user.full_name,
-                role=user.role.value,
-                is_active=user.is_active,
-                resolved=stats["resolved"],
-                pending=stats["pending"],
-                assigned_open=stats["assigned_open"],
-                in_progress=stats["in_progress"],
-                approval_pending = stats["approval_pending"],
-                approved = stats["approved"],
-            )
-            all_users_with_stats.append(user_with_stats)
-
-        return all_users_with_stats
-    
-    async def _get_users_by_role_with_stats(
-            self,
-            session: AsyncSession,
-            roles: list[str],
-            start_date: Optional[datetime] = None,
-            end_date: Optional[datetime] = None
-    ) -> list[UserWithTicketStats]:
-        """Get users filtered by roles with their ticket statistics."""
-        filtered_roles = await self._validate_and_filter_roles(
-            session, roles, None
+    def _contains_pattern(self, value: str) -> str:
+        """Build an ILIKE pattern matching value as a literal substring."""
+        escaped = (
+            value.replace("\\", "\\\\")
+            .replace("%", "\\%")
+            .replace("_", "\\_")
         )
-        all_users_with_stats = []
-        for role_value in filtered_roles:
-            users_with_stats = await self._get_users_with_ticket_stats(
-                session, role_value, start_date, end_date
-            )
-            all_users_with_stats.extend(users_with_stats)
+        return f"%{escaped}%"
 
-        return all_users_with_stats
-    
     def _filter_users_by_profile_field(
             self,
-            users: list[UserWithTicketStats],
+            statement,
             full_name: Optional[str] = None,
             email: Optional[str] = None,
             username: Optional[str] = None
-    ) -> list[UserWithTicketStats]:
-        """Filter users based on profile fields."""
-        filtered_users = users
-
+    ):
+        """Filter users on profile fields with ILIKE (served by the pg_trgm indexes)."""
         if full_name:
-            filtered_users = [
-                user for user in filtered_users
-                if user.full_name and full_name.lower() in user.full_name.lower()
-            ]
+            statement = statement.where(
+                User.full_name.ilike(self._contains_pattern(full_name), escape="\\")
+            )
         
         if email:
-            filtered_users = [
-                user for user in filtered_users
-                if email.lower() in user.email.lower()
-            ]
+            statement = statement.where(
+                User.email.ilike(self._contains_pattern(email), escape="\\")
+            )
         
         if username:
-            filtered_users = [
-                user for user in filtered_users
-                if username.lower() in user.username.lower()
-            ]
+            statement = statement.where(
+                User.username.ilike(self._contains_pattern(username), escape="\\")
+            )
         
-        return filtered_users
+        return statement
     
 
 
     def _filter_users_by_ticket_stats(
             self,
-            users: list[UserWithTicketStats],
-            stauses: Optional[list[str]] = None
-    ) -> list[UserWithTicketStats]:
-        
-        """Filter users based on ticket statistics."""
-        if not stauses:
-            return users
+            statement,
+            statuses: Optional[list[str]] = None
+    ):
         
-        status_field_map = {
-            "resolved": "resolved",
-            "pending": "pending",
-            "assigned_open": "assigned_open",
-            "in_progress": "in_progress",
-            "approval_pending": "approval_pending",
-            "approved": "approved",
-        }
+        """Keep users with tickets in at least one of the given statuses (HAVING clause)."""
+        if not statuses:
+            return statement
+
+        ticket_statuses = [
+            USER_STATS_STATUS_FIELDS[status.lower()]
+            for status in statuses
+            if status.lower() in USER_STATS_STATUS_FIELDS
+        ]
+
+        # Only unknown statuses were requested, so no user can match
+        if not ticket_statuses:
+            return statement.having(false())
+
+        return statement.having(
+            func.count(Ticket.ticket_id).filter(Ticket.status.in_(ticket_statuses)) > 0
+        )
 
-        # Filter users who have tickets in at least one of the specified statuses
-        filtered_users = []
-        # ✔ Prevents duplicates
-        # ✔ Makes the filtering accurate
-        # ✔ Improves performance for large lists
-        seen_user_ids = set()
+    def _paginate_users_query(
+            self,
+            statement,
+            cursor: Optional[str] = None,
+            limit: int = USERS_STATS_PAGE_SIZE
+    ):
+        """Apply keyset pagination on (created_at, user_id), fetching one extra row."""
+        if cursor:
+            values = decode_cursor(cursor)
+            try:
+                last_created_at = datetime.fromisoformat(values["created_at"])
+                last_user_id = UUID(values["user_id"])
+            except (KeyError, TypeError, ValueError):
+                raise BadRequestError("Invalid pagination cursor.")
+
+            statement = statement.where(
+                tuple_(User.created_at, User.user_id) < tuple_(last_created_at, last_user_id)
+            )
 
-        for user in users:
-            # Skip if user already added
-            if user.user_id in seen_user_ids:
-                continue
-            for status in stauses:
-                status_lower = status.lower()
-                if status_lower in status_field_map:
-                    stat_field = status_field_map[status_lower]
-                    if getattr(user, stat_field, 0) > 0:
-                        filtered_users.append(user)
-                        seen_user_ids.add(user.user_id)
-                        break
-        return filtered_users
+        return statement.limit(limit + 1)
 
 
 
@@ -505,34 +550,51 @@ class AnalyticsService:
             full_name: Optional[str] = None,
             email: Optional[str] = None,
             username: Optional[str] = None,
-            stauses: Optional[list[str]] = None,
+            statuses: Optional[list[str]] = None,
+            cursor: Optional[str] = None,
+            limit: int = USERS_STATS_PAGE_SIZE,
 
     ) -> UsersWithStatsResponse:
-        """Get all users with their ticket statistics."""
+        """Get a page of users with their ticket statistics."""
 
-        # Step 1: Get users with stats (all users or filtered by roles)
-        if roles is None:
-            users_with_stats = await self._get_all_users_with_stats(
-                session, start_date, end_date
-            )
-        else:
-            users_with_stats = await self._get_users_by_role_with_stats(
-                session, roles, start_date, end_date
+        # Step 1: Resolve roles (all users when no roles are given)
+        role_enums = None
+        if roles is not None:
+            filtered_roles = await self._validate_and_filter_roles(
+                session, roles, None
             )
-        
+            role_enums = self._get_support_role_enums(filtered_roles)
+
+        statement = self._build_users_ticket_stats_query(
+            start_date, end_date, role_enums
+        )
+
         # Step 2: Apply profile filters (full_name, email, username)
-        filtered_users = self._filter_users_by_profile_field(
-            users_with_stats, full_name, email, username
+        statement = self._filter_users_by_profile_field(
+            statement, full_name, email, username
         )
 
         # Step 3: Apply ticket status filters
-        filtered_users = self._filter_users_by_ticket_stats(
-            filtered_users, stauses
+        statement = self._filter_users_by_ticket_stats(
+            statement, statuses
         )
 
+        # Step 4: Fetch one page of users
+        statement = self._paginate_users_query(statement, cursor, limit)
+        users = await self._fetch_users_with_ticket_stats(session, statement)
+
+        next_cursor = None
+        if len(users) > limit:
+            users = users[:limit]
+            last_user = users[-1]
+            next_cursor = encode_cursor({
+                "created_at": last_user.created_at.isoformat(),
+                "user_id": str(last_user.user_id),
+            })
+
         return UsersWithStatsResponse(
-            users=filtered_users,
+            users=users,
             start_date=start_date,
-            end_date=end_date
+            end_date=end_date,
+            next_cursor=next_cursor
         )
-        
\ No newline at end of file
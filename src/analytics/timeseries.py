@@ -0,0 +1,149 @@
+from sqlmodel.ext.asyncio.session import AsyncSession
+from sqlmodel import select, func
+from src.db.models.ticket import Ticket, TicketStatus
+from src.db.models.ticket_history import TicketHistory
+from src.errors import BadRequestError
+from .schemas import TicketVolumeBucket, TicketVolumeResponse, VolumeInterval
+from .cache import analytics_cache, TICKET_DELETES_TAG
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
+from typing import Optional, Dict, Tuple
+
+
+INTERVAL_STEPS = {
+    VolumeInterval.HOUR: timedelta(hours=1),
+    VolumeInterval.DAY: timedelta(days=1),
+    VolumeInterval.WEEK: timedelta(weeks=1),
+}
+
+DEFAULT_BUCKET_COUNT = 30
+MAX_BUCKET_COUNT = 1000
+MAX_CACHED_BUCKETS = 20000
+# A bucket is cached only this long after it ends: rows stamped just before
+# the boundary may commit late, and reads may come from a lagging replica
+CLOSED_BUCKET_GRACE = timedelta(minutes=5)
+
+# status_changed history entries store str(TicketStatus)
+RESOLVED_HISTORY_VALUE = str(TicketStatus.RESOLVED)
+
+
+def truncate_to_bucket(value: datetime, interval: VolumeInterval) -> datetime:
+    """Python mirror of date_trunc(interval, value, 'UTC')."""
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    value = value.astimezone(timezone.utc)
+
+    if interval == VolumeInterval.HOUR:
+        return value.replace(minute=0, second=0, microsecond=0)
+    day_start = value.replace(hour=0, minute=0, second=0, microsecond=0)
+    if interval == VolumeInterval.DAY:
+        return day_start
+    # ISO weeks start on Monday, like date_trunc('week', ...)
+    return day_start - timedelta(days=day_start.weekday())
+
+
+class TicketVolumeService:
+    """Created/resolved ticket counts per time bucket.
+
+    Buckets that ended more than CLOSED_BUCKET_GRACE ago only change when
+    a ticket is deleted, so they are kept in a process-local LRU, cleared on
+    any worker's ticket delete, and only recent buckets are recomputed.
+    """
+
+    def __init__(self):
+        self._closed_buckets: "OrderedDict[Tuple[VolumeInterval, datetime], TicketVolumeBucket]" = OrderedDict()
+        analytics_cache.on_invalidate(TICKET_DELETES_TAG, self.clear)
+
+    def clear(self) -> None:
+        self._closed_buckets.clear()
+
+    def _cache_bucket(self, interval: VolumeInterval, bucket: TicketVolumeBucket) -> None:
+        key = (interval, bucket.bucket_start)
+        self._closed_buckets[key] = bucket
+        self._closed_buckets.move_to_end(key)
+        while len(self._closed_buckets) > MAX_CACHED_BUCKETS:
+            self._closed_buckets.popitem(last=False)
+
+    async def _count_per_bucket(
+            self,
+            session: AsyncSession,
+            column,
+            interval: VolumeInterval,
+            range_start: datetime,
+            range_end: datetime,
+            *conditions
+    ) -> Dict[datetime, int]:
+        """Group rows into buckets on the server using a sargable range on column."""
+        bucket = func.date_trunc(interval.value, column, "UTC").label("bucket_start")
+        result = await session.execute(
+            select(bucket, func.count().label("count"))
+            .where(column >= range_start, column < range_end, *conditions)
+            .group_by(bucket)
+        )
+        return {
+            row.bucket_start.astimezone(timezone.utc): row.count
+            for row in result.all()
+        }
+
+    async def get_ticket_volume(
+            self,
+            session: AsyncSession,
+            interval: VolumeInterval = VolumeInterval.DAY,
+            start_date: Optional[datetime] = None,
+            end_date: Optional[datetime] = None
+    ) -> TicketVolumeResponse:
+        now = datetime.now(timezone.utc)
+        step = INTERVAL_STEPS[interval]
+
+        last_bucket = truncate_to_bucket(end_date or now, interval)
+        first_bucket = truncate_to_bucket(
+            start_date or last_bucket - step * (DEFAULT_BUCKET_COUNT - 1), interval
+        )
+        if first_bucket > last_bucket:
+            raise BadRequestError("start_date must be before end_date.")
+
+        bucket_starts = []
+        bucket_start = first_bucket
+        while bucket_start <= last_bucket:
+            bucket_starts.append(bucket_start)
+            bucket_start += step
+            if len(bucket_starts) > MAX_BUCKET_COUNT:
+                raise BadRequestError(
+                    f"Requested range spans more than {MAX_BUCKET_COUNT} buckets."
+                )
+
+        buckets: Dict[datetime, TicketVolumeBucket] = {}
+        missing = []
+        for bucket_start in bucket_starts:
+            cached = self._closed_buckets.get((interval, bucket_start))
+            if cached is not None:
+                self._closed_buckets.move_to_end((interval, bucket_start))
+                buckets[bucket_start] = cached
+            else:
+                missing.append(bucket_start)
+
+        if missing:
+            range_start, range_end = missing[0], missing[-1] + step
+            created = await self._count_per_bucket(
+                session, Ticket.created_at, interval, range_start, range_end
+            )
+            resolved = await self._count_per_bucket(
+                session, TicketHistory.changed_at, interval, range_start, range_end,
+                TicketHistory.action_type == "status_changed",
+                TicketHistory.new_value == RESOLVED_HISTORY_VALUE,
+            )
+
+            for bucket_start in missing:
+                bucket = TicketVolumeBucket(
+                    bucket_start=bucket_start,
+                    created=created.get(bucket_start, 0),
+                    resolved=resolved.get(bucket_start, 0),
+                )
+                buckets[bucket_start] = bucket
+                if bucket_start + step + CLOSED_BUCKET_GRACE <= now:
+                    self._cache_bucket(interval, bucket)
+
+        return TicketVolumeResponse(
+            interval=interval,
+            buckets=[buckets[bucket_start] for bucket_start in bucket_starts],
+        )
@@ -3,9 +3,13 @@ from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from fastapi.exceptions import HTTPException
 from fastapi import status, Depends, Request
 from .utils import decode_token
+from .tokens import token_revocations
 from sqlmodel.ext.asyncio.session import AsyncSession 
 from src.db.main import get_session
+from src.db.session import set_current_actor
 from src.db.models import User
+from src.errors import UserNotFoundError
+from .schemas import Principal, AuthContext
 
 user_service = UserService()
 
@@ -24,16 +28,13 @@ class TokenBearer(HTTPBearer):
                 headers={"WWW-Authenticate": "Bearer"},
             )
         
-        # # Check if the token's JTI (JWT ID) is in the blocklist
-        # if await token_in_blocklist(token_data["jti"]):
-        #     # Raise 403 Forbidden error for blocklisted tokens
-        #     raise HTTPException(
-        #         status_code=status.HTTP_403_FORBIDDEN,
-        #         detail={
-        #             "error": "This token is invalid or expired",
-        #             "resolution": "Please get new token or login again"
-        #         }
-        #     )
+        # Revoked token ids are held in memory, so this costs no round trip
+        if token_revocations.is_revoked(token_data.get("jti")):
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Token has been revoked.",
+                headers={"WWW-Authenticate": "Bearer"},
+            )
 
         self.verify_token_data(token_data)      # Call child class method to verify token type (access vs refresh)
         return token_data                       # Return the decoded token data for use in route handlers
@@ -64,8 +65,12 @@ class RefreshTokenBearer(TokenBearer):
             )
 
 
+# One shared instance, so FastAPI resolves the bearer once per request
+access_token_bearer = AccessTokenBearer()
+
+
 async def get_current_user(
-        token_details: dict = Depends(AccessTokenBearer()),
+        token_details: dict = Depends(access_token_bearer),
         session: AsyncSession = Depends(get_session)
 ):
     user_email = token_details["user"]["email"]
@@ -73,12 +78,29 @@ async def get_current_user(
     return user
 
 
+async def get_auth_context(
+        token_details: dict = Depends(access_token_bearer),
+        session: AsyncSession = Depends(get_session)
+) -> AuthContext:
+    """Decode the token and resolve the caller once; shared by role_checker and the route."""
+    try:
+        principal = await user_service.get_principal(token_details["user"]["user_id"], session)
+    except (KeyError, UserNotFoundError):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="User is not Authenticated",
+        )
+    await set_current_actor(str(principal.user_id))
+    return AuthContext(token_data=token_details, principal=principal)
+
+
 def role_checker(allowed_roles : list[str]):
-    async def verify(user : User = Depends(get_current_user)):
-        if not User:
+    async def verify(auth : AuthContext = Depends(get_auth_context)):
+        user = auth.principal
+        if not user.is_active:
             raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="User is not Authenticated",
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="User account is inactive.",
             )
         user_role = getattr(user.role, "value", user.role)
         if user_role not in allowed_roles:
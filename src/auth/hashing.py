@@ -0,0 +1,99 @@
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable
+
+from src.config import Config
+from src.errors import ServiceUnavailableError
+from .utils import generate_hash_password, verify_password
+
+
+class PasswordHasherPool:
+    """Runs argon2 off the event loop in a bounded thread pool.
+
+    argon2-cffi releases the GIL while hashing, so threads hash in parallel.
+    At most max_workers calls run at once and up to max_queue more wait for
+    a worker; anything beyond that is rejected with 503 instead of piling up.
+    """
+
+    def __init__(self, max_workers: int, max_queue: int):
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="argon2")
+        self._in_flight = 0
+
+        self.completed = 0
+        self.rejected = 0
+        self.max_queue_depth = 0
+        self._total_queue_wait = 0.0
+        self.max_queue_wait = 0.0
+
+    @property
+    def queue_depth(self) -> int:
+        return max(self._in_flight - self.max_workers, 0)
+
+    async def _run(self, fn: Callable[..., Any], *args) -> Any:
+        if self._in_flight >= self.max_workers + self.max_queue:
+            self.rejected += 1
+            raise ServiceUnavailableError("Too many concurrent sign-ins. Please retry shortly.")
+
+        self._in_flight += 1
+        self.max_queue_depth = max(self.max_queue_depth, self.queue_depth)
+        submitted_at = time.perf_counter()
+
+        def timed():
+            return time.perf_counter(), fn(*args)
+
+        loop = asyncio.get_running_loop()
+        try:
+            future = self._executor.submit(timed)
+        except RuntimeError:
+            # The executor has been shut down
+            self._in_flight -= 1
+            raise
+        # The slot is held until the hash finishes, not until this coroutine
+        # does: a cancelled request (client disconnect) leaves the thread running
+        future.add_done_callback(lambda _: self._release(loop))
+        started_at, result = await asyncio.wrap_future(future)
+
+        queue_wait = started_at - submitted_at
+        self._total_queue_wait += queue_wait
+        self.max_queue_wait = max(self.max_queue_wait, queue_wait)
+        self.completed += 1
+        return result
+
+    def _release(self, loop: asyncio.AbstractEventLoop) -> None:
+        # Done callbacks run on the worker thread; the counter belongs to the loop
+        try:
+            loop.call_soon_threadsafe(self._decrement_in_flight)
+        except RuntimeError:
+            # The loop has closed (shutdown); nothing is left to admit
+            pass
+
+    def _decrement_in_flight(self) -> None:
+        self._in_flight -= 1
+
+    async def hash(self, password: str) -> str:
+        return await self._run(generate_hash_password, password)
+
+    async def verify(self, password: str, password_hash: str) -> bool:
+        return await self._run(verify_password, password, password_hash)
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def stats(self) -> dict:
+        return {
+            "workers": self.max_workers,
+            "max_queue": self.max_queue,
+            "in_flight": self._in_flight,
+            "queue_depth": self.queue_depth,
+            "max_queue_depth": self.max_queue_depth,
+            "completed": self.completed,
+            "rejected": self.rejected,
+            "avg_queue_wait_ms": round(self._total_queue_wait / self.completed * 1000, 2) if self.completed else 0.0,
+            "max_queue_wait_ms": round(self.max_queue_wait * 1000, 2),
+        }
+
+
+password_hasher = PasswordHasherPool(Config.PASSWORD_HASH_WORKERS, Config.PASSWORD_HASH_MAX_QUEUE)
@@ -3,6 +3,7 @@ from .schemas import (
     UserCreateModel,
     UserResponseModel,
     UserLoginModel,
+    LogoutRequest,
 )
 from fastapi import Depends, HTTPException, status
 from .service import UserService
@@ -11,14 +12,17 @@ from src.db.main import get_session
 from src.errors import (
     UserAlreadyExistsError,
 )
-from .utils import create_access_token, verify_password
+from .utils import create_access_token, decode_token
+from .tokens import token_revocations
+from .hashing import password_hasher
 from datetime import timedelta, datetime
+from typing import Optional
 from fastapi.responses import JSONResponse
 from src.errors import (
     NotFoundError,
     InvalidCredentialsError,
 )
-from .dependencies import get_current_user, RefreshTokenBearer
+from .dependencies import get_current_user, RefreshTokenBearer, role_checker, access_token_bearer
 
 
 
@@ -64,7 +68,7 @@ async def login(
         raise NotFoundError(email)
 
     # 2️⃣ Verify password
-    password_valid = verify_password(password, user.password_hash)
+    password_valid = await password_hasher.verify(password, user.password_hash)
     if not password_valid:
         raise InvalidCredentialsError()
 
@@ -131,3 +135,35 @@ async def get_new_access_token(
         "token_type": "bearer"
     }
 
+
+@auth_router.post(
+    "/logout",
+    status_code=status.HTTP_200_OK,
+)
+async def logout(
+    logout_data: Optional[LogoutRequest] = None,
+    token_details: dict = Depends(access_token_bearer)
+):
+    """Revoke the access token (and the refresh token, if given) until they expire."""
+    await token_revocations.revoke(token_details["jti"], token_details["exp"])
+
+    if logout_data and logout_data.refresh_token:
+        refresh_details = decode_token(logout_data.refresh_token)
+        if (
+            refresh_details
+            and refresh_details.get("refresh")
+            and refresh_details["user"].get("user_id") == token_details["user"].get("user_id")
+        ):
+            await token_revocations.revoke(refresh_details["jti"], refresh_details["exp"])
+
+    return {"detail": "Logged out successfully"}
+
+
+@auth_router.get(
+    "/password-hasher-stats",
+    status_code=status.HTTP_200_OK,
+    dependencies=[Depends(role_checker(["admin"]))],
+    summary="Get password hashing pool queue depth and wait times",
+)
+async def get_password_hasher_stats():
+    return password_hasher.stats()
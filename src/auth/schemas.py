@@ -1,7 +1,7 @@
 import uuid
 from datetime import datetime
 from typing import Optional
-from pydantic import BaseModel, Field, field_validator, ValidationInfo
+from pydantic import BaseModel, ConfigDict, Field, field_validator, ValidationInfo
 from src.errors import PasswordMismatchError
 from src.db.models.user import UserRole
 
@@ -78,3 +78,31 @@ class UserLoginModel(BaseModel):
         max_length=128,
         example="strongpassword123"
     )
+
+
+class LogoutRequest(BaseModel):
+    refresh_token : Optional[str] = Field(
+        None,
+        description="Refresh token to revoke along with the access token.",
+    )
+
+
+class Principal(BaseModel):
+    """The slice of a user that authorization checks need; cached per user_id."""
+    model_config = ConfigDict(frozen=True, from_attributes=True)
+
+    user_id : uuid.UUID
+    role : UserRole
+    is_active : bool
+
+
+class AuthContext(BaseModel):
+    """Token claims and principal of the current request, resolved once per request."""
+    model_config = ConfigDict(frozen=True)
+
+    token_data : dict
+    principal : Principal
+
+    @property
+    def user_id(self) -> uuid.UUID:
+        return self.principal.user_id
@@ -1,8 +1,11 @@
 from sqlmodel.ext.asyncio.session import AsyncSession
 from sqlmodel import select
+from uuid import UUID
 from src.db.models.user import User, UserRole
-from .schemas import UserCreateModel
-from src.auth.utils import generate_hash_password, verify_password  
+from src.errors import UserNotFoundError
+from .schemas import UserCreateModel, Principal
+from src.auth.hashing import password_hasher
+from src.user.cache import invalidate_user_lookups, principal_cache, principal_key, principal_tag
 
 
 class UserService:
@@ -14,6 +17,23 @@ class UserService:
         return user
     
 
+    async def _load_principal(self, user_id: UUID, session: AsyncSession):
+        statement = select(User.user_id, User.role, User.is_active).where(User.user_id == user_id)
+        row = (await session.execute(statement)).first()
+        if row is None:
+            raise UserNotFoundError()
+        return row
+
+    async def get_principal(self, user_id: UUID, session: AsyncSession) -> Principal:
+        """Get the user's id, role and active flag, served from the principal cache."""
+        return await principal_cache.get_or_compute(
+            principal_key(user_id),
+            lambda: self._load_principal(user_id, session),
+            response_type=Principal,
+            tags=(principal_tag(user_id),),
+        )
+
+
     async def user_exists(self, email: str, session: AsyncSession) -> bool:
         user = await self.get_user_by_email(email, session)
         return user is not None
@@ -26,12 +46,13 @@ class UserService:
         new_user = User(**user_data_dict)
 
         # Hash password before saving
-        new_user.password_hash = generate_hash_password(user_data.password)
+        new_user.password_hash = await password_hasher.hash(user_data.password)
         new_user.role = UserRole.USER
 
         # Save to DB
         session.add(new_user)
         await session.commit()
         await session.refresh(new_user)
+        await invalidate_user_lookups()
 
         return new_user
@@ -0,0 +1,131 @@
+import copy
+import hashlib
+import json
+import logging
+import time
+from collections import OrderedDict
+from typing import Optional
+
+from src.cache import CacheBackend, cache_backend
+from src.config import Config
+
+
+logger = logging.getLogger(__name__)
+
+REVOKED_KEY_PREFIX = "trackit:revoked:"
+REVOCATION_CHANNEL = "trackit:revoked"
+
+
+def token_fingerprint(token: str) -> str:
+    return hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+
+class TokenClaimsCache:
+    """LRU of verified token claims keyed by the token's SHA-256.
+
+    Only tokens whose signature was verified are stored, and an entry is
+    dropped once the token's exp has passed, so a hit is as good as a decode.
+    Claims are copied in and out, so callers may modify what they get.
+    """
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, dict]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, token: str) -> Optional[dict]:
+        key = token_fingerprint(token)
+        claims = self._entries.get(key)
+        if claims is None or claims.get("exp", 0) <= time.time():
+            self._entries.pop(key, None)
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return copy.deepcopy(claims)
+
+    def set(self, token: str, claims: dict) -> None:
+        if "exp" not in claims:
+            return
+        key = token_fingerprint(token)
+        self._entries[key] = copy.deepcopy(claims)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def stats(self) -> dict:
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
+class TokenRevocationList:
+    """Revoked token ids (jti), checked in memory on every request.
+
+    Revocations are written to the shared cache backend until the token
+    would have expired anyway, and broadcast so every worker adds them to
+    its local set. A worker loads the stored entries each time it
+    (re)subscribes, which picks up anything broadcast while it was not
+    listening, including while Redis was down at startup.
+    """
+
+    def __init__(self, backend: CacheBackend):
+        self.backend = backend
+        self._revoked: dict[str, float] = {}
+
+    async def start(self) -> None:
+        await self.backend.subscribe(REVOCATION_CHANNEL, self._on_revocation, on_subscribed=self.reload)
+
+    async def reload(self) -> None:
+        """Add every revocation stored in the backend to the local set."""
+        for key, value in (await self.backend.items(REVOKED_KEY_PREFIX)).items():
+            try:
+                self._add(key[len(REVOKED_KEY_PREFIX):], float(value))
+            except ValueError:
+                continue
+
+    def _add(self, jti: str, expires_at: float) -> None:
+        if expires_at > time.time():
+            self._revoked[jti] = expires_at
+
+    def _on_revocation(self, message: str) -> None:
+        try:
+            payload = json.loads(message)
+            self._add(payload["jti"], float(payload["exp"]))
+        except (ValueError, KeyError, TypeError):
+            logger.warning("Ignoring malformed revocation message: %r", message)
+
+    def is_revoked(self, jti: Optional[str]) -> bool:
+        if jti is None:
+            return False
+        expires_at = self._revoked.get(jti)
+        if expires_at is None:
+            return False
+        if expires_at <= time.time():
+            # The token has expired on its own; nothing left to block
+            del self._revoked[jti]
+            return False
+        return True
+
+    async def revoke(self, jti: str, expires_at: float) -> None:
+        """Revoke a token until its exp timestamp."""
+        ttl_seconds = expires_at - time.time()
+        if ttl_seconds <= 0:
+            return
+        now = time.time()
+        for stale_jti in [key for key, expires in self._revoked.items() if expires <= now]:
+            del self._revoked[stale_jti]
+        self._add(jti, expires_at)
+        await self.backend.set(f"{REVOKED_KEY_PREFIX}{jti}", str(expires_at).encode("utf-8"), ttl_seconds)
+        await self.backend.publish(REVOCATION_CHANNEL, json.dumps({"jti": jti, "exp": expires_at}))
+
+    def stats(self) -> dict:
+        return {"revoked": len(self._revoked)}
+
+
+token_claims_cache = TokenClaimsCache(Config.TOKEN_CACHE_MAX_ENTRIES)
+token_revocations = TokenRevocationList(cache_backend)
@@ -4,6 +4,7 @@ import uuid
 import logging
 from datetime import datetime, timedelta
 from src.config import Config
+from .tokens import token_claims_cache
 
 
 password_context = CryptContext(schemes=["argon2"], deprecated="auto")
@@ -45,15 +46,21 @@ def create_access_token(user_data: dict, expiry: timedelta = None, refresh: bool
 
 
 def decode_token(token: str) -> dict:
+    # Tokens verified earlier are served from the cache until they expire
+    token_data = token_claims_cache.get(token)
+    if token_data is not None:
+        return token_data
+
     try:
         token_data = jwt.decode(
             jwt=token,                         # The JWT token to decode
             key=Config.JWT_SECRET,              # Secret key used to verify the token
             algorithms=[Config.JWT_ALGORITHM]   # Algorithm(s) expected to be used for signing
         )
+        token_claims_cache.set(token, token_data)
         return token_data
 
-    except jwt.PyJWKError as e:
+    except jwt.PyJWTError as e:
         logging.exception(e)
         # Return None to indicate the token could not be decoded
         return None
\ No newline at end of file
@@ -0,0 +1,57 @@
+from src.config import Config
+from .backends import CacheBackend, MemoryCacheBackend, RedisCacheBackend
+from .shared import SharedCache
+
+
+def create_cache_backend() -> CacheBackend:
+    """Build the backend selected by CACHE_BACKEND ("memory" or "redis")."""
+    if Config.CACHE_BACKEND == "redis":
+        return RedisCacheBackend(url=Config.REDIS_URL)
+    if Config.CACHE_BACKEND == "memory":
+        return MemoryCacheBackend()
+    raise ValueError(f"Unsupported CACHE_BACKEND: {Config.CACHE_BACKEND!r}")
+
+
+cache_backend = create_cache_backend()
+
+_caches: list[SharedCache] = []
+
+
+def create_cache(namespace: str, ttl_seconds: float, max_local_entries: int = 256) -> SharedCache:
+    """Create a SharedCache on the process-wide backend."""
+    cache = SharedCache(
+        backend=cache_backend,
+        namespace=namespace,
+        ttl_seconds=ttl_seconds,
+        local_ttl_seconds=Config.CACHE_LOCAL_TTL_SECONDS,
+        max_local_entries=max_local_entries,
+    )
+    _caches.append(cache)
+    return cache
+
+
+async def start_caches() -> None:
+    """Subscribe every cache to cross-worker invalidations (call on startup)."""
+    for cache in _caches:
+        await cache.start()
+
+
+async def stop_caches() -> None:
+    await cache_backend.close()
+
+
+def cache_stats() -> dict:
+    return {cache.namespace: cache.stats() for cache in _caches}
+
+
+__all__ = [
+    "CacheBackend",
+    "MemoryCacheBackend",
+    "RedisCacheBackend",
+    "SharedCache",
+    "cache_backend",
+    "create_cache",
+    "start_caches",
+    "stop_caches",
+    "cache_stats",
+]
@@ -0,0 +1,234 @@
+import asyncio
+import logging
+import time
+from typing import Awaitable, Callable, Optional
+
+
+logger = logging.getLogger(__name__)
+
+InvalidationHandler = Callable[[str], None]
+# Awaited after each (re)subscription; lets a subscriber reload what it missed
+SubscribedHook = Callable[[], Awaitable[None]]
+
+
+class CacheBackend:
+    """Storage behind SharedCache. Failures must never break a request."""
+
+    async def get(self, key: str) -> Optional[bytes]:
+        raise NotImplementedError
+
+    async def set(self, key: str, value: bytes, ttl_seconds: float) -> None:
+        raise NotImplementedError
+
+    async def get_versions(self, keys: list[str]) -> list[int]:
+        """Current value of each version counter (0 when unset)."""
+        raise NotImplementedError
+
+    async def incr(self, key: str) -> Optional[int]:
+        raise NotImplementedError
+
+    async def items(self, prefix: str) -> dict[str, bytes]:
+        """All live values whose key starts with prefix; raises if they cannot be read."""
+        raise NotImplementedError
+
+    async def publish(self, channel: str, message: str) -> None:
+        raise NotImplementedError
+
+    async def subscribe(
+            self,
+            channel: str,
+            handler: InvalidationHandler,
+            on_subscribed: Optional[SubscribedHook] = None
+    ) -> None:
+        raise NotImplementedError
+
+    async def close(self) -> None:
+        pass
+
+
+class MemoryCacheBackend(CacheBackend):
+    """In-process stand-in for Redis: single worker deployments, dev and tests."""
+
+    def __init__(self):
+        self._values: dict[str, tuple[bytes, float]] = {}
+        self._counters: dict[str, int] = {}
+        self._handlers: dict[str, list[InvalidationHandler]] = {}
+
+    async def get(self, key: str) -> Optional[bytes]:
+        item = self._values.get(key)
+        if item is None:
+            return None
+        value, expires_at = item
+        if expires_at <= time.monotonic():
+            del self._values[key]
+            return None
+        return value
+
+    async def set(self, key: str, value: bytes, ttl_seconds: float) -> None:
+        self._values[key] = (value, time.monotonic() + ttl_seconds)
+
+    async def get_versions(self, keys: list[str]) -> list[int]:
+        return [self._counters.get(key, 0) for key in keys]
+
+    async def incr(self, key: str) -> Optional[int]:
+        self._counters[key] = self._counters.get(key, 0) + 1
+        # Expired values are only dropped lazily, so prune on writes
+        now = time.monotonic()
+        for stale_key in [k for k, (_, expires_at) in self._values.items() if expires_at <= now]:
+            del self._values[stale_key]
+        return self._counters[key]
+
+    async def items(self, prefix: str) -> dict[str, bytes]:
+        now = time.monotonic()
+        return {
+            key: value
+            for key, (value, expires_at) in self._values.items()
+            if key.startswith(prefix) and expires_at > now
+        }
+
+    async def publish(self, channel: str, message: str) -> None:
+        for handler in self._handlers.get(channel, []):
+            handler(message)
+
+    async def subscribe(
+            self,
+            channel: str,
+            handler: InvalidationHandler,
+            on_subscribed: Optional[SubscribedHook] = None
+    ) -> None:
+        self._handlers.setdefault(channel, []).append(handler)
+        if on_subscribed is not None:
+            await on_subscribed()
+
+
+class RedisCacheBackend(CacheBackend):
+    """Shared cache for multi-worker deployments.
+
+    Pass `client` to use an existing client (e.g. fakeredis.aioredis.FakeRedis
+    for offline tests) instead of connecting to `url`.
+    """
+
+    RESUBSCRIBE_DELAY_SECONDS = 1
+
+    def __init__(self, url: Optional[str] = None, client=None):
+        if client is None:
+            import redis.asyncio as redis
+            client = redis.Redis.from_url(url)
+        self._client = client
+        self._listeners: list[asyncio.Task] = []
+
+    async def get(self, key: str) -> Optional[bytes]:
+        try:
+            return await self._client.get(key)
+        except Exception:
+            logger.warning("Redis GET failed for %s", key, exc_info=True)
+            return None
+
+    async def set(self, key: str, value: bytes, ttl_seconds: float) -> None:
+        try:
+            await self._client.set(key, value, px=max(int(ttl_seconds * 1000), 1))
+        except Exception:
+            logger.warning("Redis SET failed for %s", key, exc_info=True)
+
+    async def get_versions(self, keys: list[str]) -> list[int]:
+        try:
+            values = await self._client.mget(keys)
+        except Exception:
+            logger.warning("Redis MGET failed", exc_info=True)
+            raise
+        return [int(value) if value is not None else 0 for value in values]
+
+    async def incr(self, key: str) -> Optional[int]:
+        try:
+            return await self._client.incr(key)
+        except Exception:
+            logger.warning("Redis INCR failed for %s", key, exc_info=True)
+            return None
+
+    async def items(self, prefix: str) -> dict[str, bytes]:
+        try:
+            keys = [key async for key in self._client.scan_iter(match=f"{prefix}*", count=500)]
+            values = await self._client.mget(keys) if keys else []
+        except Exception:
+            logger.warning("Redis SCAN failed for %s", prefix, exc_info=True)
+            raise
+        return {
+            (key.decode("utf-8") if isinstance(key, bytes) else key): value
+            for key, value in zip(keys, values)
+            if value is not None
+        }
+
+    async def publish(self, channel: str, message: str) -> None:
+        try:
+            await self._client.publish(channel, message)
+        except Exception:
+            logger.warning("Redis PUBLISH failed on %s", channel, exc_info=True)
+
+    async def _open_subscription(self, channel: str, on_subscribed: Optional[SubscribedHook]):
+        pubsub = self._client.pubsub()
+        try:
+            await pubsub.subscribe(channel)
+            # After subscribing, so nothing published in between is missed
+            if on_subscribed is not None:
+                await on_subscribed()
+        except BaseException:
+            await self._close_quietly(pubsub)
+            raise
+        return pubsub
+
+    async def _close_quietly(self, pubsub) -> None:
+        try:
+            await pubsub.aclose()
+        except Exception:
+            pass
+
+    async def subscribe(
+            self,
+            channel: str,
+            handler: InvalidationHandler,
+            on_subscribed: Optional[SubscribedHook] = None
+    ) -> None:
+        """Subscribe before returning, so no invalidation published afterwards is missed.
+
+        on_subscribed runs after this and every later resubscription, since
+        messages published while the subscription was down are lost.
+        """
+        try:
+            pubsub = await self._open_subscription(channel, on_subscribed)
+        except Exception:
+            logger.warning("Redis SUBSCRIBE to %s failed, retrying in background", channel, exc_info=True)
+            pubsub = None
+        self._listeners.append(asyncio.create_task(self._listen(channel, handler, on_subscribed, pubsub)))
+
+    async def _listen(
+            self,
+            channel: str,
+            handler: InvalidationHandler,
+            on_subscribed: Optional[SubscribedHook],
+            pubsub
+    ) -> None:
+        while True:
+            try:
+                if pubsub is None:
+                    pubsub = await self._open_subscription(channel, on_subscribed)
+                async for message in pubsub.listen():
+                    if message.get("type") != "message":
+                        continue
+                    data = message["data"]
+                    handler(data.decode("utf-8") if isinstance(data, bytes) else data)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.warning("Redis subscription to %s dropped, retrying", channel, exc_info=True)
+                await asyncio.sleep(self.RESUBSCRIBE_DELAY_SECONDS)
+            finally:
+                if pubsub is not None:
+                    await self._close_quietly(pubsub)
+                    pubsub = None
+
+    async def close(self) -> None:
+        for listener in self._listeners:
+            listener.cancel()
+        await asyncio.gather(*self._listeners, return_exceptions=True)
+        self._listeners.clear()
+        await self._client.aclose()
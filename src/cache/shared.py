@@ -0,0 +1,164 @@
+import hashlib
+import json
+import logging
+import time
+import uuid
+from typing import Any, Awaitable, Callable, Iterable
+
+from pydantic import TypeAdapter
+
+from src.utils.cache import TTLCache
+from .backends import CacheBackend
+
+
+logger = logging.getLogger(__name__)
+
+KEY_PREFIX = "trackit:cache"
+
+
+class SharedCache:
+    """Two-tier cache: a process-local TTLCache (L1) in front of a shared backend (L2).
+
+    Backend keys embed the current version of every tag the entry depends on.
+    Invalidating a tag bumps its version, so entries written before the bump
+    can no longer be reached by any worker, and a pub/sub message tells the
+    other workers to drop their L1 entries for that tag.
+    """
+
+    def __init__(
+            self,
+            backend: CacheBackend,
+            namespace: str,
+            ttl_seconds: float,
+            local_ttl_seconds: float,
+            max_local_entries: int
+    ):
+        self.backend = backend
+        self.namespace = namespace
+        self.ttl_seconds = ttl_seconds
+        self.local = TTLCache(min(local_ttl_seconds, ttl_seconds), max_local_entries)
+        # tag -> (version, fetched_at); refreshed from the backend after local_ttl_seconds
+        self._versions: dict[str, tuple[int, float]] = {}
+        self._version_ttl_seconds = local_ttl_seconds
+        self._instance_id = uuid.uuid4().hex
+        self._adapters: dict[Any, TypeAdapter] = {}
+        self._listeners: dict[str, list[Callable[[], None]]] = {}
+
+        self.shared_hits = 0
+        self.shared_misses = 0
+        self.backend_errors = 0
+
+    @property
+    def channel(self) -> str:
+        return f"{KEY_PREFIX}:{self.namespace}:invalidate"
+
+    def _version_key(self, tag: str) -> str:
+        return f"{KEY_PREFIX}:{self.namespace}:version:{tag}"
+
+    def _storage_key(self, key: Any, tags: tuple[str, ...], versions: list[int]) -> str:
+        digest = hashlib.sha256(repr(key).encode("utf-8")).hexdigest()
+        version_part = ".".join(f"{tag}={version}" for tag, version in zip(tags, versions))
+        return f"{KEY_PREFIX}:{self.namespace}:{digest}:{version_part}"
+
+    def _adapter(self, response_type: Any) -> TypeAdapter:
+        adapter = self._adapters.get(response_type)
+        if adapter is None:
+            adapter = self._adapters[response_type] = TypeAdapter(response_type)
+        return adapter
+
+    async def start(self) -> None:
+        await self.backend.subscribe(self.channel, self._on_invalidation)
+
+    def on_invalidate(self, tag: str, callback: Callable[[], None]) -> None:
+        """Call callback whenever tag is invalidated, by this worker or another."""
+        self._listeners.setdefault(tag, []).append(callback)
+
+    def _notify(self, tags: Iterable[str]) -> None:
+        for tag in tags:
+            for callback in self._listeners.get(tag, []):
+                callback()
+
+    def _on_invalidation(self, message: str) -> None:
+        try:
+            payload = json.loads(message)
+        except ValueError:
+            return
+        if payload.get("origin") == self._instance_id:
+            return
+        tags = payload.get("tags") or []
+        for tag in tags:
+            self._versions.pop(tag, None)
+        self.local.invalidate(*tags)
+        self._notify(tags)
+
+    async def _tag_versions(self, tags: tuple[str, ...]) -> list[int]:
+        now = time.monotonic()
+        stale = [
+            tag for tag in tags
+            if tag not in self._versions
+            or now - self._versions[tag][1] > self._version_ttl_seconds
+        ]
+        if stale:
+            fetched = await self.backend.get_versions([self._version_key(tag) for tag in stale])
+            for tag, version in zip(stale, fetched):
+                self._versions[tag] = (version, now)
+        return [self._versions[tag][0] for tag in tags]
+
+    async def get_or_compute(
+            self,
+            key: Any,
+            compute: Callable[[], Awaitable[Any]],
+            response_type: Any,
+            tags: Iterable[str] = ()
+    ) -> Any:
+        """Return the cached value for key, computing and storing it on a miss."""
+        tags = tuple(sorted(set(tags)))
+        adapter = self._adapter(response_type)
+
+        async def load() -> Any:
+            try:
+                versions = await self._tag_versions(tags)
+            except Exception:
+                # Backend unavailable: serve from the database
+                self.backend_errors += 1
+                return adapter.validate_python(await compute(), from_attributes=True)
+
+            storage_key = self._storage_key(key, tags, versions)
+            raw = await self.backend.get(storage_key)
+            if raw is not None:
+                self.shared_hits += 1
+                return adapter.validate_json(raw)
+
+            self.shared_misses += 1
+            value = adapter.validate_python(await compute(), from_attributes=True)
+            await self.backend.set(storage_key, adapter.dump_json(value), self.ttl_seconds)
+            return value
+
+        return await self.local.get_or_compute(key, load, tags)
+
+    async def invalidate(self, *tags: str) -> None:
+        """Invalidate tags in this worker, in the backend and in every other worker."""
+        self.local.invalidate(*tags)
+        self._notify(tags)
+        now = time.monotonic()
+        for tag in tags:
+            version = await self.backend.incr(self._version_key(tag))
+            if version is None:
+                self.backend_errors += 1
+                self._versions.pop(tag, None)
+            else:
+                self._versions[tag] = (version, now)
+        await self.backend.publish(
+            self.channel,
+            json.dumps({"tags": list(tags), "origin": self._instance_id}),
+        )
+
+    def stats(self) -> dict:
+        return {
+            **self.local.stats(),
+            "namespace": self.namespace,
+            "backend": type(self.backend).__name__,
+            "shared_hits": self.shared_hits,
+            "shared_misses": self.shared_misses,
+            "backend_errors": self.backend_errors,
+        }
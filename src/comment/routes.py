@@ -2,7 +2,8 @@ from fastapi import APIRouter, Depends, status
 from sqlmodel.ext.asyncio.session import AsyncSession
 from uuid import UUID
 from .service import CommentService
-from src.auth.dependencies import AccessTokenBearer, role_checker
+from src.auth.dependencies import role_checker, get_auth_context
+from src.auth.schemas import AuthContext
 from .schemas import CommentResponse, CommentCreateRequest, CommentUpdateRequest
 from src.db.main import get_session
 
@@ -20,14 +21,12 @@ AllUsers = Depends(role_checker(["user", "manager", "it_support", "admin"]))
 async def create_comment(
     comment_data: CommentCreateRequest,
     session: AsyncSession = Depends(get_session),
-    current_user: dict = Depends(AccessTokenBearer()),
+    auth: AuthContext = Depends(get_auth_context),
 ):
-    user_id = current_user["user"]["user_id"]
-
     return await comment_service.create_comment(
         content=comment_data.content,
         ticket_id=comment_data.ticket_id,
-        user_id=user_id,
+        auth=auth,
         visibility=comment_data.visibility,
         session=session,
     )
@@ -43,14 +42,12 @@ async def update_comment(
     comment_id: UUID,
     update_comment: CommentUpdateRequest,
     session: AsyncSession = Depends(get_session),
-    current_user: dict = Depends(AccessTokenBearer()),
+    auth: AuthContext = Depends(get_auth_context),
 ):
-    user_id = current_user["user"]["user_id"]
-
     return await comment_service.update_comment(
         comment_id=comment_id,
         updated_comment=update_comment.content,
-        user_id=user_id,
+        auth=auth,
         session=session,
     )
 
@@ -63,9 +60,7 @@ async def update_comment(
 async def delete_comment(
     comment_id: UUID,
     session: AsyncSession = Depends(get_session),
-    current_user: dict = Depends(AccessTokenBearer()),
+    auth: AuthContext = Depends(get_auth_context),
 ):
-    user_id = current_user["user"]["user_id"]
-
-    await comment_service.delete_comment(comment_id, user_id, session)
+    await comment_service.delete_comment(comment_id, auth, session)
     return {"detail": "Comment deleted successfully"}
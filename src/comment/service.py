@@ -1,4 +1,5 @@
-from src.db.models.user import User
+from src.auth.schemas import Principal, AuthContext
+from src.auth.service import UserService
 from src.db.models.ticket import Ticket
 from src.db.models.comment import Comment
 from src.db.models.comment import CommentVisibility
@@ -8,26 +9,29 @@ from sqlmodel import select
 from datetime import datetime
 from src.errors import (
     TicketNotFoundError,
-    UserNotFoundError,
     UnauthorizedError,
     CommentNotFoundError,
 )
+from src.ticket.cache import invalidate_ticket_detail
 
 
 INTERNAL_COMMENT_ROLES = {"admin", "it_support"}
 PRIVILEGED_ROLES = {"admin", "manager", "it_support"}
 
 
-def can_post_internal_comment(user: User) -> bool:
+def can_post_internal_comment(user: Principal) -> bool:
     """Check if the user has permission to post internal comments"""
     return user.role.value.lower() in INTERNAL_COMMENT_ROLES
 
 
-def is_privileged(user: User) -> bool:
+def is_privileged(user: Principal) -> bool:
     return user.role.value.lower() in PRIVILEGED_ROLES
 
 
 class CommentService:
+    def __init__(self):
+        self.user_service = UserService()
+
     async def get_ticket(self, ticket_id: UUID, session: AsyncSession) -> Ticket:
         ticket = (await session.execute(
             select(Ticket).where(Ticket.ticket_id == ticket_id)
@@ -36,13 +40,8 @@ class CommentService:
             raise TicketNotFoundError()
         return ticket
 
-    async def get_user(self, user_id: UUID, session: AsyncSession) -> User:
-        user = (await session.execute(
-            select(User).where(User.user_id == user_id)
-        )).scalar_one_or_none()
-        if not user:
-            raise UserNotFoundError()
-        return user
+    async def get_user(self, user_id: UUID, session: AsyncSession) -> Principal:
+        return await self.user_service.get_principal(user_id, session)
 
     async def get_comment(self, comment_id: UUID, session: AsyncSession) -> Comment:
         comment = (await session.execute(
@@ -52,7 +51,7 @@ class CommentService:
             raise CommentNotFoundError()
         return comment
 
-    def can_comment(self, ticket: Ticket, user: User, visibility: CommentVisibility) -> bool:
+    def can_comment(self, ticket: Ticket, user: Principal, visibility: CommentVisibility) -> bool:
         if visibility == CommentVisibility.INTERNAL:
             return can_post_internal_comment(user)
         return (
@@ -65,12 +64,12 @@ class CommentService:
         self,
         content: str,
         ticket_id: UUID,
-        user_id: UUID,
+        auth: AuthContext,
         visibility: CommentVisibility,
         session: AsyncSession,
     ):
         ticket = await self.get_ticket(ticket_id, session)
-        user = await self.get_user(user_id, session)
+        user = auth.principal
 
         if not self.can_comment(ticket, user, visibility):
             raise UnauthorizedError("You are not allowed to post comment on this ticket.")
@@ -78,18 +77,19 @@ class CommentService:
         new_comment = Comment(
             content=content,
             ticket_id=ticket_id,
-            user_id=user_id,
+            user_id=auth.user_id,
             visibilty=visibility,
         )
         session.add(new_comment)
         await session.commit()
         await session.refresh(new_comment)
+        await invalidate_ticket_detail(ticket_id)
         return new_comment
 
     async def update_comment(
         self,
         comment_id: UUID,
-        user_id: UUID,
+        auth: AuthContext,
         updated_comment: str,
         session: AsyncSession,
     ) -> Comment:
@@ -97,9 +97,7 @@ class CommentService:
         if not comment:
             raise CommentNotFoundError()
         
-        user = await self.get_user(user_id, session)
-        if not user:
-            raise UserNotFoundError()
+        user = auth.principal
 
         if user.role.value.lower() not in {"admin", "it_support", "manager"} and str(comment.user_id) != str(user.user_id):
             raise UnauthorizedError("Only the owner or privileged users can update this comment.")
@@ -108,25 +106,25 @@ class CommentService:
         comment.updated_at = datetime.utcnow()
         await session.commit()
         await session.refresh(comment)
+        await invalidate_ticket_detail(comment.ticket_id)
         return comment
 
     async def delete_comment(
         self,
         comment_id: UUID,
-        user_id: UUID,
+        auth: AuthContext,
         session: AsyncSession,
     ):
         comment = await self.get_comment(comment_id, session)
         if not comment:
             raise CommentNotFoundError()
         
-        user = await self.get_user(user_id, session)
-        if not user:
-            raise UserNotFoundError()
+        user = auth.principal
 
         if user.role.value.lower() != "admin" and str(comment.user_id) != str(user.user_id):
             raise UnauthorizedError("Only the owner or an admin can delete this comment.")
 
         await session.delete(comment)
         await session.commit()
+        await invalidate_ticket_detail(comment.ticket_id)
         return True
@@ -40,6 +40,7 @@ from pathlib import Path
 #### Neon Postgres Configuration ######
 from pydantic_settings import BaseSettings
 from pathlib import Path
+from typing import Optional
 
 class Settings(BaseSettings):
     """
@@ -50,10 +51,72 @@ class Settings(BaseSettings):
     JWT_SECRET : str
     JWT_ALGORITHM : str    
 
-    AWS_S3_BUCKET_NAME: str
+    # Where attachments are stored: "s3" or "local" (a directory on this machine)
+    STORAGE_BACKEND: str = "s3"
+    LOCAL_STORAGE_DIR: str = "storage"
+    # Prefix recorded in local attachments' file_url; nothing is served here, files are
+    # read only through the authorized /ticket/attachment/{id}/download endpoint
+    LOCAL_STORAGE_BASE_URL: str = "http://localhost:8000/api/v1/files"
+    LOCAL_STORAGE_WORKERS: int = 4
+
+    # Required when STORAGE_BACKEND is "s3"; credentials fall back to boto3's default chain
+    AWS_S3_BUCKET_NAME: Optional[str] = None
     AWS_S3_REGION: str = "ap-southeast-1"
-    AWS_ACCESS_KEY_ID: str
-    AWS_SECRET_ACCESS_KEY: str
+    AWS_ACCESS_KEY_ID: Optional[str] = None
+    AWS_SECRET_ACCESS_KEY: Optional[str] = None
+    # Set for S3-compatible stores (MinIO, LocalStack, moto); None means AWS
+    AWS_S3_ENDPOINT_URL: Optional[str] = None
+    # Attachment uploads run in this many threads; files above one part use multipart upload
+    S3_UPLOAD_WORKERS: int = 8
+    S3_MULTIPART_PART_SIZE_MB: int = 8
+    # Lifetime of the presigned PUT URLs handed to clients for direct uploads
+    S3_PRESIGNED_URL_EXPIRES_SECONDS: int = 900
+
+    # Hours an unresolved ticket may stay open before it counts as overdue
+    OVERDUE_SLA_HOURS_LOW: int = 720
+    OVERDUE_SLA_HOURS_MEDIUM: int = 720
+    OVERDUE_SLA_HOURS_HIGH: int = 720
+
+    # Ticket history pages
+    HISTORY_PAGE_SIZE: int = 10
+    HISTORY_MAX_PAGE_SIZE: int = 100
+
+    # Process-local cache for analytics responses
+    ANALYTICS_CACHE_TTL_SECONDS: float = 30
+    ANALYTICS_CACHE_MAX_ENTRIES: int = 256
+
+    # Shared cache tier: "memory" (single process) or "redis" (shared across workers)
+    CACHE_BACKEND: str = "memory"
+    REDIS_URL: str = "redis://localhost:6379/0"
+    # How long a worker trusts its local copy before re-checking the shared tier
+    CACHE_LOCAL_TTL_SECONDS: float = 5
+    USER_CACHE_TTL_SECONDS: float = 60
+    TICKET_CACHE_TTL_SECONDS: float = 60
+    # Authenticated user (id, role, is_active) lookups
+    PRINCIPAL_CACHE_TTL_SECONDS: float = 30
+    PRINCIPAL_CACHE_MAX_ENTRIES: int = 4096
+
+    # Database connection pool; a dashboard fill holds up to half of
+    # DB_POOL_SIZE connections at once (one per section, at most five)
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT_SECONDS: float = 30
+    DB_POOL_RECYCLE_SECONDS: int = 1800
+    DB_POOL_PRE_PING: bool = True
+    DB_ECHO: bool = False
+    DB_SSL: bool = True
+
+    # Optional read replica for read-only endpoints
+    DATABASE_REPLICA_URL: Optional[str] = None
+    # After a write, the caller reads from the primary for this long
+    REPLICA_STICKY_SECONDS: float = 5
+
+    # argon2 runs in a thread pool; calls beyond workers + queue are rejected with 503
+    PASSWORD_HASH_WORKERS: int = 4
+    PASSWORD_HASH_MAX_QUEUE: int = 64
+
+    # Verified JWT claims kept in memory, keyed by token hash
+    TOKEN_CACHE_MAX_ENTRIES: int = 10000
 
     model_config = {
         # .env is in the same folder as config.py
@@ -1,11 +1,11 @@
 from sqlalchemy import text
-from src.db.session import engine
+from src.db.session import engine, async_session_maker, read_session_maker
 from sqlmodel import SQLModel
 from typing import AsyncGenerator
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker 
+from sqlalchemy.ext.asyncio import AsyncSession
 from .models.user import User, UserRole
 from sqlalchemy import select
-from src.auth.utils import generate_hash_password
+from src.auth.hashing import password_hasher
 
 
 
@@ -13,24 +13,32 @@ from src.auth.utils import generate_hash_password
 async def init_db():
     from .models import User  # import models here to ensure they are registered
     async with engine.begin() as conn:
+        # The users trigram indexes need pg_trgm
+        await conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
         # Create all tables based on the models
         await conn.run_sync(SQLModel.metadata.create_all)
         print("Database connection established and tables created successfully!")
 
     await seed_admin_user()
+    await backfill_ticket_counters()
+    await backfill_ticket_resolutions()
 
 
 # Provide an async DB session generator
 async def get_session() -> AsyncGenerator[AsyncSession, None]:
-    async_session = async_sessionmaker(engine, expire_on_commit=False)  
-    async with async_session() as session:
+    async with async_session_maker() as session:
+        yield session
+
+
+# Session for read-only endpoints: served by the replica when one is configured
+async def get_read_session() -> AsyncGenerator[AsyncSession, None]:
+    async with read_session_maker() as session:
         yield session
 
 
 
 async def seed_admin_user():
-    async_session = async_sessionmaker(engine, expire_on_commit=False)
-    async with async_session() as session:
+    async with async_session_maker() as session:
         result = await session.execute(
             select(User).where(User.role == UserRole.ADMIN)
         )
@@ -43,7 +51,7 @@ async def seed_admin_user():
             username="admin",
             email="admin@gmail.com",
             full_name="Admin User",
-            password_hash=generate_hash_password("Admin@123" ),
+            password_hash=await password_hasher.hash("Admin@123"),
             role=UserRole.ADMIN,
         )
         session.add(admin_user)
@@ -53,6 +61,26 @@ async def seed_admin_user():
 
 
 
+# Full rebuilds lock ticket writes; they run from the admin /analytics/counters/reconcile endpoint
+async def backfill_ticket_counters():
+    from src.analytics.counters import TicketCounterService
+    async with async_session_maker() as session:
+        counts = await TicketCounterService().backfill(session)
+        if counts is not None:
+            print(f"Ticket counters backfilled ({len(counts)} counters).")
+
+
+async def backfill_ticket_resolutions():
+    from src.analytics.resolution import ResolutionMetricsService
+    resolution_service = ResolutionMetricsService()
+    async with async_session_maker() as session:
+        resolved_tickets = await resolution_service.backfill(session)
+        if resolved_tickets is not None:
+            print(f"Ticket resolutions backfilled ({resolved_tickets} tickets).")
+
+
+
+
 ###########################################################################
 ##      During Project Setup It required when no models are present 
 ###########################################################################
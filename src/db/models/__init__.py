@@ -1,5 +1,8 @@
 from .user import User, UserRole
 from .ticket import Ticket, TicketStatus, TicketPriority, IssueType
+from .ticket_counter import TicketCounter
+from .ticket_resolution import TicketResolution
+from .attachment_blob import AttachmentBlob
 
 __all__ = [
     "User",
@@ -8,4 +11,7 @@ __all__ = [
     "TicketStatus",
     "TicketPriority",
     "IssueType",
+    "TicketCounter",
+    "TicketResolution",
+    "AttachmentBlob",
 ]
@@ -1,6 +1,6 @@
 from sqlmodel import SQLModel, Field, Relationship
 import uuid
-from sqlalchemy import Column, ForeignKey
+from sqlalchemy import Column, ForeignKey, Index, String
 import sqlalchemy.dialects.postgresql as pg
 from datetime import datetime
 from typing import Optional, TYPE_CHECKING
@@ -11,6 +11,10 @@ if TYPE_CHECKING:
 
 class Attachment(SQLModel, table=True):
     __tablename__ = "attachments"
+    __table_args__ = (
+        Index("ix_attachments_ticket_id", "ticket_id"),
+        Index("ix_attachments_blob_sha256", "blob_sha256"),
+    )
 
 
     attachment_id : uuid.UUID = Field(
@@ -34,6 +38,15 @@ class Attachment(SQLModel, table=True):
     file_name : str = Field(nullable=False)
     file_url : str = Field(nullable=False)
     file_type : str = Field(nullable=False)
+    # Set for content-addressed uploads; presigned and older uploads have their own object
+    blob_sha256 : Optional[str] = Field(
+        default=None,
+        sa_column=Column(
+            String(64),
+            ForeignKey("attachment_blobs.sha256"),
+            nullable=True,
+        )
+    )
     uploaded_at : datetime = Field(
         default_factory=datetime.utcnow
     )
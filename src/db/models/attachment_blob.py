@@ -0,0 +1,42 @@
+from sqlmodel import SQLModel, Field
+from sqlalchemy import Column, String, BigInteger
+from datetime import datetime
+
+
+class AttachmentBlob(SQLModel, table=True):
+    """One stored attachment file, shared by every attachment with the same content.
+
+    ref_count is the number of attachments pointing at the blob. A blob at
+    zero keeps its row and object until a sweep after the commit removes them.
+    """
+    __tablename__ = "attachment_blobs"
+
+    sha256 : str = Field(
+        sa_column=Column(
+            String(64),
+            primary_key=True,
+            nullable=False
+        )
+    )
+
+    size : int = Field(
+        sa_column=Column(
+            BigInteger,
+            nullable=False
+        )
+    )
+
+    content_type : str = Field(nullable=False)
+
+    ref_count : int = Field(
+        default=0,
+        sa_column=Column(
+            BigInteger,
+            nullable=False,
+            server_default="0"
+        )
+    )
+
+    created_at : datetime = Field(
+        default_factory=datetime.utcnow
+    )
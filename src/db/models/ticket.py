@@ -5,6 +5,8 @@ from sqlalchemy import(
     String,
     func,
     ForeignKey,
+    Index,
+    text,
 )
 from sqlmodel import SQLModel, Field, Relationship
 from typing import List, Optional, TYPE_CHECKING
@@ -46,6 +48,29 @@ class IssueType(enum.Enum):
 
 class Ticket(SQLModel, table=True):
     __tablename__ = "tickets"
+    __table_args__ = (
+        # Serves overdue lookups without touching resolved/closed tickets
+        Index(
+            "ix_tickets_unresolved_created_at",
+            "created_at",
+            postgresql_where=text("status NOT IN ('RESOLVED', 'CLOSED')"),
+        ),
+        # my-tickets: one index per side of created_by OR assigned_to, in list order
+        Index("ix_tickets_created_by_updated_at", "created_by", "updated_at", "ticket_id"),
+        # Also covers the per-assignee analytics joins (status and created_at included)
+        Index(
+            "ix_tickets_assigned_to_updated_at",
+            "assigned_to", "updated_at", "ticket_id",
+            postgresql_include=["status", "created_at"],
+        ),
+        Index(
+            "ix_tickets_unassigned_updated_at",
+            "updated_at", "ticket_id",
+            postgresql_where=text("assigned_to IS NULL"),
+        ),
+        # Opened-today and ticket volume ranges
+        Index("ix_tickets_created_at", "created_at"),
+    )
 
     ticket_id: uuid.UUID = Field(
         sa_column=Column(
@@ -0,0 +1,27 @@
+from sqlmodel import SQLModel, Field
+from sqlalchemy import Column, String, BigInteger
+
+
+class TicketCounter(SQLModel, table=True):
+    """Rollup of ticket counts maintained by TicketService writes.
+
+    counter_key examples: status:open, priority:high, unassigned
+    """
+    __tablename__ = "ticket_counters"
+
+    counter_key : str = Field(
+        sa_column=Column(
+            String(64),
+            primary_key=True,
+            nullable=False
+        )
+    )
+
+    count : int = Field(
+        default=0,
+        sa_column=Column(
+            BigInteger,
+            nullable=False,
+            server_default="0"
+        )
+    )
@@ -1,6 +1,6 @@
 from sqlmodel import SQLModel, Field, Relationship, String
 import uuid
-from sqlalchemy import Column, DateTime, ForeignKey
+from sqlalchemy import Column, DateTime, ForeignKey, Index, text
 import sqlalchemy.dialects.postgresql as pg
 from typing import Optional, TYPE_CHECKING
 from datetime import datetime
@@ -11,6 +11,17 @@ if TYPE_CHECKING:
 
 class TicketHistory(SQLModel, table=True):
     __tablename__ = "ticket_history"
+    __table_args__ = (
+        # Per-ticket history, newest first
+        Index("ix_ticket_history_ticket_id_changed_at", "ticket_id", "changed_at", "history_id"),
+        # Resolved-per-bucket counts read only status changes
+        Index(
+            "ix_ticket_history_status_changes",
+            "changed_at",
+            postgresql_include=["new_value"],
+            postgresql_where=text("action_type = 'status_changed'"),
+        ),
+    )
 
     history_id : uuid.UUID = Field(
         sa_column=Column(
@@ -0,0 +1,53 @@
+from sqlmodel import SQLModel, Field
+import uuid
+from sqlalchemy import Column, ForeignKey, Float, Index
+import sqlalchemy.dialects.postgresql as pg
+from datetime import datetime
+from typing import Optional
+
+from .ticket import IssueType
+
+
+class TicketResolution(SQLModel, table=True):
+    """Latest resolution of a ticket, kept in step with status_changed history."""
+    __tablename__ = "ticket_resolutions"
+    __table_args__ = (
+        Index("ix_ticket_resolutions_resolved_at", "resolved_at"),
+    )
+
+    ticket_id : uuid.UUID = Field(
+        sa_column=Column(
+            pg.UUID(as_uuid=True),
+            ForeignKey("tickets.ticket_id", ondelete="CASCADE"),
+            primary_key=True,
+            nullable=False
+        )
+    )
+
+    # Assignee at the time the ticket was resolved
+    assigned_to : Optional[uuid.UUID] = Field(
+        sa_column=Column(
+            pg.UUID(as_uuid=True),
+            ForeignKey("users.user_id", ondelete="SET NULL"),
+            nullable=True
+        )
+    )
+
+    types_of_issue : IssueType = Field(
+        sa_column=Column(
+            pg.ENUM(IssueType, name="issue_types", create_type=True),
+            nullable=False
+        )
+    )
+
+    created_at : datetime = Field(
+        sa_column=Column(pg.TIMESTAMP(timezone=True), nullable=False)
+    )
+
+    resolved_at : datetime = Field(
+        sa_column=Column(pg.TIMESTAMP(timezone=True), nullable=False)
+    )
+
+    resolution_seconds : float = Field(
+        sa_column=Column(Float, nullable=False)
+    )
@@ -6,6 +6,7 @@ from sqlalchemy import(
     func,
     ForeignKey,
     Boolean,
+    Index,
 )
 from sqlmodel import SQLModel, Field, Relationship
 from typing import List, Optional, TYPE_CHECKING
@@ -30,6 +31,25 @@ class UserRole(enum.Enum):
 
 class User(SQLModel, table=True):
     __tablename__ = "users"
+    __table_args__ = (
+        # Trigram GIN indexes serve the ILIKE '%term%' filters on /analytics/users-stats
+        # (they need the pg_trgm extension)
+        Index(
+            "ix_users_full_name_trgm", "full_name",
+            postgresql_using="gin", postgresql_ops={"full_name": "gin_trgm_ops"},
+        ),
+        Index(
+            "ix_users_email_trgm", "email",
+            postgresql_using="gin", postgresql_ops={"email": "gin_trgm_ops"},
+        ),
+        Index(
+            "ix_users_username_trgm", "username",
+            postgresql_using="gin", postgresql_ops={"username": "gin_trgm_ops"},
+        ),
+        # Keyset pagination order for users-stats
+        Index("ix_users_created_at_user_id", "created_at", "user_id"),
+    )
+
     user_id : uuid.UUID = Field(
         sa_column= Column(
             pg.UUID(as_uuid=True),
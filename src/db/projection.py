@@ -0,0 +1,51 @@
+from typing import Optional
+
+from pydantic import BaseModel
+from sqlalchemy import inspect, select
+from sqlalchemy.orm import load_only, raiseload, selectinload
+
+
+class Projection:
+    """The columns and relationships of a model that one response schema reads.
+
+    select() builds a column-only statement whose rows validate straight into
+    the schema. options() is for entity queries that need nested schemas: it
+    loads only the schema's columns, selectin-loads the declared relationships
+    with their own projections and raises on any other relationship, so the
+    model's lazy="joined" defaults never run.
+    """
+
+    def __init__(
+            self,
+            model: type,
+            schema: type[BaseModel],
+            relationships: Optional[dict[str, "Projection"]] = None
+    ):
+        self.model = model
+        self.schema = schema
+        self.relationships = relationships or {}
+
+        mapper = inspect(model)
+        self.columns = []
+        for name in schema.model_fields:
+            if name in self.relationships:
+                if name not in mapper.relationships:
+                    raise ValueError(f"{model.__name__}.{name} is not a relationship.")
+            elif name in mapper.column_attrs:
+                self.columns.append(getattr(model, name))
+            else:
+                raise ValueError(
+                    f"{schema.__name__}.{name} is neither a column nor a declared relationship of {model.__name__}."
+                )
+
+    def select(self):
+        if self.relationships:
+            raise ValueError(f"{self.schema.__name__} has relationships; query the entity with options().")
+        return select(*self.columns)
+
+    def options(self) -> list:
+        options = [load_only(*self.columns)]
+        for name, projection in self.relationships.items():
+            options.append(selectinload(getattr(self.model, name)).options(*projection.options()))
+        options.append(raiseload("*"))
+        return options
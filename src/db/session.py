@@ -1,18 +1,208 @@
-from sqlalchemy.ext.asyncio import create_async_engine, AsyncEngine, async_sessionmaker
-from sqlmodel.ext.asyncio.session import AsyncSession
+from contextvars import ContextVar
+from typing import Any, Awaitable, Callable, Optional
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import create_async_engine, AsyncEngine, AsyncSession, async_sessionmaker
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+from src.cache import cache_backend
+from src.cache.shared import KEY_PREFIX
 from src.config import Config
 import ssl
+import time
 
-# Create async engine with SSL context (required by Neon)
-engine: AsyncEngine = create_async_engine(
-    url=Config.DATABASE_URL,
-    echo=True,
-    connect_args={"ssl": ssl.create_default_context()}  # Neon requires SSL
+
+class PoolMetrics:
+    """Connection checkout counters for one instrumented pool."""
+
+    def __init__(self):
+        self.checkouts = 0
+        self.timeouts = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    def record_wait(self, seconds: float) -> None:
+        self.checkouts += 1
+        self.total_wait += seconds
+        self.max_wait = max(self.max_wait, seconds)
+
+
+class InstrumentedQueuePool(AsyncAdaptedQueuePool):
+    """AsyncAdaptedQueuePool that records how long callers wait for a connection."""
+
+    metrics: PoolMetrics
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except PoolTimeoutError:
+            self.metrics.timeouts += 1
+            raise
+        self.metrics.record_wait(time.perf_counter() - started)
+        return connection
+
+
+def _connect_args() -> dict:
+    # Neon requires SSL; local databases may not support it
+    if Config.DB_SSL:
+        return {"ssl": ssl.create_default_context()}
+    return {}
+
+
+def _create_engine(url: str, metrics: PoolMetrics) -> AsyncEngine:
+    # A subclass per engine keeps its metrics across pool.recreate()
+    pool_class = type("InstrumentedQueuePool", (InstrumentedQueuePool,), {"metrics": metrics})
+    return create_async_engine(
+        url=url,
+        echo=Config.DB_ECHO,
+        poolclass=pool_class,
+        pool_size=Config.DB_POOL_SIZE,
+        max_overflow=Config.DB_MAX_OVERFLOW,
+        pool_timeout=Config.DB_POOL_TIMEOUT_SECONDS,
+        pool_recycle=Config.DB_POOL_RECYCLE_SECONDS,
+        pool_pre_ping=Config.DB_POOL_PRE_PING,
+        connect_args=_connect_args(),
+    )
+
+
+pool_metrics = PoolMetrics()
+engine: AsyncEngine = _create_engine(Config.DATABASE_URL, pool_metrics)
+
+replica_pool_metrics = PoolMetrics()
+replica_engine: Optional[AsyncEngine] = (
+    _create_engine(Config.DATABASE_REPLICA_URL, replica_pool_metrics)
+    if Config.DATABASE_REPLICA_URL else None
 )
 
-# Async session maker
+
+# ==================== Read-replica routing ====================
+
+# Set per request by the auth layer so writes and reads can be tied to a caller
+current_actor: ContextVar[Optional[str]] = ContextVar("current_actor", default=None)
+# Whether the current caller wrote within REPLICA_STICKY_SECONDS (read-your-writes)
+read_from_primary: ContextVar[bool] = ContextVar("read_from_primary", default=False)
+
+
+def _last_write_key(actor: str) -> str:
+    return f"{KEY_PREFIX}:replica:last_write:{actor}"
+
+
+async def record_write(actor: Optional[str]) -> None:
+    """Mark the caller as having written, in the cache backend every worker shares."""
+    if actor is None or replica_engine is None:
+        return
+    read_from_primary.set(True)
+    await cache_backend.set(_last_write_key(actor), b"1", Config.REPLICA_STICKY_SECONDS)
+
+
+async def set_current_actor(actor: str) -> None:
+    """Tie this request to a caller; one who just wrote keeps reading from the primary."""
+    current_actor.set(actor)
+    if replica_engine is not None:
+        read_from_primary.set(await cache_backend.get(_last_write_key(actor)) is not None)
+
+
+def on_primary(compute: Callable[[], Awaitable[Any]]) -> Callable[[], Awaitable[Any]]:
+    """Wrap a cache fill so its reads go to the primary.
+
+    A cached value outlives the request; one read from a lagging replica
+    would keep being served after the lag is gone.
+    """
+    async def load() -> Any:
+        token = read_from_primary.set(True)
+        try:
+            return await compute()
+        finally:
+            read_from_primary.reset(token)
+    return load
+
+
+class RoutingSession(Session):
+    """Session that sends reads to the replica when it was opened for reading.
+
+    Sessions from read_session_maker use the replica unless a replica is not
+    configured, the session itself has written, or the current caller wrote
+    within REPLICA_STICKY_SECONDS. Everything else goes to the primary.
+    """
+
+    def get_bind(self, mapper=None, clause=None, **kw):
+        if (
+            replica_engine is not None
+            and self.info.get("read_only")
+            and not self._flushing
+            and not self.info.get("wrote")
+            and not read_from_primary.get()
+        ):
+            return replica_engine.sync_engine
+        return engine.sync_engine
+
+
+class RoutingAsyncSession(AsyncSession):
+    """AsyncSession that records the caller's committed writes before commit() returns.
+
+    The mark lives in the shared cache backend, so the caller's next request
+    reads from the primary whichever worker serves it.
+    """
+
+    async def commit(self) -> None:
+        await super().commit()
+        if self.sync_session.info.pop("committed_write", False):
+            await record_write(current_actor.get())
+
+
+@event.listens_for(RoutingSession, "do_orm_execute")
+def _mark_statement_writes(orm_execute_state):
+    if not orm_execute_state.is_select:
+        orm_execute_state.session.info["wrote"] = True
+
+
+@event.listens_for(RoutingSession, "after_flush")
+def _mark_flush_writes(session, flush_context):
+    session.info["wrote"] = True
+
+
+@event.listens_for(RoutingSession, "after_commit")
+def _record_committed_writes(session):
+    if session.info.pop("wrote", False):
+        session.info["committed_write"] = True
+
+
+# The session factories for the whole process; build sessions from these
 async_session_maker = async_sessionmaker(
     bind=engine,
     expire_on_commit=False,
-    class_=AsyncSession,
+    class_=RoutingAsyncSession,
+    sync_session_class=RoutingSession,
+)
+
+read_session_maker = async_sessionmaker(
+    bind=engine,
+    expire_on_commit=False,
+    class_=RoutingAsyncSession,
+    sync_session_class=RoutingSession,
+    info={"read_only": True},
 )
+
+
+def _pool_stats(pool_engine: AsyncEngine, metrics: PoolMetrics) -> dict:
+    pool = pool_engine.pool
+    checkouts = metrics.checkouts
+    return {
+        "pool_size": pool.size(),
+        "max_overflow": Config.DB_MAX_OVERFLOW,
+        "checked_in": pool.checkedin(),
+        "checked_out": pool.checkedout(),
+        "overflow": max(pool.overflow(), 0),
+        "checkouts": checkouts,
+        "timeouts": metrics.timeouts,
+        "avg_wait_ms": round(metrics.total_wait / checkouts * 1000, 3) if checkouts else 0.0,
+        "max_wait_ms": round(metrics.max_wait * 1000, 3),
+    }
+
+
+def pool_stats() -> dict:
+    stats = {"primary": _pool_stats(engine, pool_metrics)}
+    if replica_engine is not None:
+        stats["replica"] = _pool_stats(replica_engine, replica_pool_metrics)
+    return stats
@@ -49,6 +49,15 @@ class UnauthorizedError(HTTPException):
         )
 
 
+class ServiceUnavailableError(HTTPException):
+    def __init__(self, message: str = "Server is busy. Please retry shortly.", retry_after: int = 1):
+        super().__init__(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=message,
+            headers={"Retry-After": str(retry_after)},
+        )
+
+
 # ==================== Ticket-specific Errors ====================
 class TicketNotFoundError(NotFoundError):
     def __init__(self):
@@ -92,7 +101,6 @@ class TicketAssignmentError(UnauthorizedError):
         super().__init__(detail=message)
 
 
-# ==================== Ticket-specific Errors ====================
 class CommentNotFoundError(NotFoundError):
     def __init__(self):
         super().__init__("Comment")
\ No newline at end of file
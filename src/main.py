@@ -1,7 +1,14 @@
-from fastapi import FastAPI
+import os
+from fastapi import FastAPI, Depends
 from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
 from src.db.main import init_db
+from src.db.session import pool_stats
+from src.cache import start_caches, stop_caches
+from src.auth.hashing import password_hasher
+from src.auth.tokens import token_revocations
+from src.auth.dependencies import role_checker
+from src.storage import storage
 from src.auth.routes import auth_router
 from src.ticket.routes import ticket_router
 from src.user.routes import user_management_router
@@ -14,8 +21,13 @@ from src.analytics.routes import analytics_router
 async def lifespan(_app: FastAPI):
     print("Starting up...")
     await init_db()
+    await start_caches()
+    await token_revocations.start()
     yield
     print("Shutting down...")
+    await stop_caches()
+    password_hasher.shutdown()
+    storage.shutdown()
 
 
 
@@ -49,6 +61,10 @@ version_prefix = f"/api/{version}"
 def root():
     return {"status": "ok"}
 
+@_app.get(f"{version_prefix}/health/db-pool", dependencies=[Depends(role_checker(["admin"]))])
+def db_pool_health():
+    return pool_stats()
+
 _app.include_router(auth_router, prefix=f"{version_prefix}/auth", tags=["Auth"])
 _app.include_router(ticket_router, prefix=f"{version_prefix}/ticket", tags=["Tickets"])
 _app.include_router(user_management_router, prefix=f"{version_prefix}/user", tags=["User Management"])
@@ -0,0 +1,91 @@
+import asyncio
+import mimetypes
+import uuid
+from fastapi import HTTPException, status
+from src.config import Config
+from .base import (
+    StorageBackend,
+    ObjectInfo,
+    ALLOWED_FILE_TYPES,
+    MAX_FILE_SIZE_MB,
+    MAX_FILE_SIZE_BYTES,
+    validate_file_type,
+    validate_upload,
+    blob_key,
+    attachment_key_prefix,
+    TICKET_KEYS_PREFIX,
+)
+from .local import LocalStorage
+from .s3 import S3Storage
+
+
+def create_storage() -> StorageBackend:
+    """Build the backend selected by STORAGE_BACKEND ("s3" or "local")."""
+    if Config.STORAGE_BACKEND == "s3":
+        return S3Storage(
+            bucket=Config.AWS_S3_BUCKET_NAME,
+            region=Config.AWS_S3_REGION,
+            access_key_id=Config.AWS_ACCESS_KEY_ID,
+            secret_access_key=Config.AWS_SECRET_ACCESS_KEY,
+            endpoint_url=Config.AWS_S3_ENDPOINT_URL,
+            max_workers=Config.S3_UPLOAD_WORKERS,
+            part_size=Config.S3_MULTIPART_PART_SIZE_MB * 1024 * 1024,
+        )
+    if Config.STORAGE_BACKEND == "local":
+        return LocalStorage(
+            root=Config.LOCAL_STORAGE_DIR,
+            base_url=Config.LOCAL_STORAGE_BASE_URL,
+            max_workers=Config.LOCAL_STORAGE_WORKERS,
+        )
+    raise ValueError(f"Unsupported STORAGE_BACKEND: {Config.STORAGE_BACKEND!r}")
+
+
+storage = create_storage()
+
+
+def create_presigned_upload(ticket_id: uuid.UUID, content_type: str, size: int) -> dict:
+    """Reserve a key under the ticket's prefix and presign a PUT for it."""
+    if not storage.supports_presigned_uploads:
+        raise HTTPException(
+            status_code = status.HTTP_501_NOT_IMPLEMENTED,
+            detail = f"Direct uploads are not supported by the {storage.name} storage backend."
+        )
+    file_extension = mimetypes.guess_extension(content_type or "") or ""
+    key = f"{attachment_key_prefix(ticket_id)}{uuid.uuid4()}{file_extension}"
+    expires_in = Config.S3_PRESIGNED_URL_EXPIRES_SECONDS
+    return {
+        "key": key,
+        "upload_url": storage.presign_put(key, content_type, size, expires_in),
+        # The client must send these exactly; they are part of the signature
+        "headers": {"Content-Type": content_type, "Content-Length": str(size)},
+        "expires_in": expires_in,
+    }
+
+
+async def verify_presigned_uploads(keys: list[str]) -> list[dict]:
+    """Verify direct uploads concurrently; see StorageBackend.verify_upload."""
+    results = await asyncio.gather(*(storage.verify_upload(key) for key in keys), return_exceptions=True)
+    for result in results:
+        if isinstance(result, BaseException):
+            raise result
+    return results
+
+
+__all__ = [
+    "StorageBackend",
+    "ObjectInfo",
+    "LocalStorage",
+    "S3Storage",
+    "ALLOWED_FILE_TYPES",
+    "MAX_FILE_SIZE_MB",
+    "MAX_FILE_SIZE_BYTES",
+    "validate_file_type",
+    "validate_upload",
+    "blob_key",
+    "attachment_key_prefix",
+    "TICKET_KEYS_PREFIX",
+    "create_storage",
+    "storage",
+    "create_presigned_upload",
+    "verify_presigned_uploads",
+]
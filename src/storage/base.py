@@ -0,0 +1,246 @@
+import asyncio
+import hashlib
+import logging
+import mimetypes
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime
+from functools import partial
+from typing import Any, AsyncIterator, Callable, Optional
+from fastapi import UploadFile, HTTPException, status
+
+
+logger = logging.getLogger(__name__)
+
+ALLOWED_FILE_TYPES = {
+    "image/jpeg", "image/png", "application/pdf",
+    "application/msword", "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+    "application/vnd.ms-excel", "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+}
+MAX_FILE_SIZE_MB = 10
+MAX_FILE_SIZE_BYTES = MAX_FILE_SIZE_MB * 1024 * 1024
+
+# Bytes read from an upload or a stored object per call
+READ_CHUNK_SIZE = 1024 * 1024
+
+
+def validate_file_type(content_type: Optional[str], size: Optional[int]) -> None:
+    """Reject a file by type, and by size when it is known."""
+    if content_type not in ALLOWED_FILE_TYPES:
+        raise HTTPException(
+            status_code = status.HTTP_400_BAD_REQUEST,
+            detail = "Unsupported file type."
+        )
+    if size is not None and size > MAX_FILE_SIZE_BYTES:
+        raise file_too_large()
+
+
+def validate_upload(file: UploadFile) -> None:
+    """Reject a file by type, and by size when the multipart parser already knows it."""
+    validate_file_type(file.content_type, file.size)
+
+
+def file_too_large() -> HTTPException:
+    return HTTPException(
+        status_code = status.HTTP_400_BAD_REQUEST,
+        detail = f"File size exceeds the maximum limit of {MAX_FILE_SIZE_MB} MB."
+    )
+
+
+def upload_failed(error: Exception) -> HTTPException:
+    return HTTPException(
+        status_code = status.HTTP_500_INTERNAL_SERVER_ERROR,
+        detail = f"Upload failed: {str(error)}"
+    )
+
+
+def blob_key(sha256: str) -> str:
+    """Key of a content-addressed attachment blob."""
+    return f"blobs/{sha256}"
+
+
+# Direct (presigned) uploads live under tickets/<ticket_id>/
+TICKET_KEYS_PREFIX = "tickets/"
+
+
+def attachment_key_prefix(ticket_id: uuid.UUID) -> str:
+    return f"{TICKET_KEYS_PREFIX}{ticket_id}/"
+
+
+@dataclass(frozen=True)
+class ObjectInfo:
+    size: int
+    content_type: Optional[str]
+    etag: Optional[str]
+    last_modified: Optional[datetime]
+
+
+class StorageBackend:
+    """Where attachment files live.
+
+    Backends implement the primitives (_put, head, delete, stream, list_objects,
+    file_url);
+    validation, hashing, concurrent uploads and cleanup are shared. Blocking
+    I/O runs in a bounded thread pool so it never stalls the event loop.
+    """
+
+    name = "storage"
+    supports_presigned_uploads = False
+
+    def __init__(self, max_workers: int):
+        self.max_workers = max_workers
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=f"{self.name}-io")
+
+        self.uploaded = 0
+        self.bytes_uploaded = 0
+        self.failed = 0
+
+    async def _call(self, fn: Callable[..., Any], *args, **kwargs) -> Any:
+        return await asyncio.get_running_loop().run_in_executor(self._executor, partial(fn, *args, **kwargs))
+
+    # ==================== Backend primitives ====================
+
+    def file_url(self, key: str) -> str:
+        raise NotImplementedError
+
+    async def _put(self, file: UploadFile, key: str) -> int:
+        """Store the file under key and return its size, enforcing the size limit."""
+        raise NotImplementedError
+
+    async def head(self, key: str) -> Optional[ObjectInfo]:
+        """Metadata of a stored object, or None if it does not exist."""
+        raise NotImplementedError
+
+    async def delete(self, key: str) -> None:
+        raise NotImplementedError
+
+    def stream(
+            self,
+            key: str,
+            start: int = 0,
+            end: Optional[int] = None,
+            chunk_size: int = READ_CHUNK_SIZE
+    ) -> AsyncIterator[bytes]:
+        """Bytes start..end (inclusive; end None means to the end) in chunks of at most chunk_size."""
+        raise NotImplementedError
+
+    async def list_objects(self, prefix: str) -> list[tuple[str, datetime]]:
+        """Key and last-modified time of every object whose key starts with prefix."""
+        raise NotImplementedError
+
+    def presign_put(self, key: str, content_type: str, size: int, expires_in: int) -> str:
+        raise NotImplementedError
+
+    def key_from_url(self, url: str) -> Optional[str]:
+        """The key of an object by its file_url, or None if the URL is not in this store."""
+        prefix = self.file_url("")
+        if not url.startswith(prefix) or len(url) == len(prefix):
+            return None
+        return url[len(prefix):]
+
+    # ==================== Uploads ====================
+
+    def new_key(self, file: UploadFile) -> str:
+        file_extension = mimetypes.guess_extension(file.content_type) or ""
+        return f"{uuid.uuid4()}{file_extension}"
+
+    async def hash_file(self, file: UploadFile) -> tuple[str, int]:
+        """SHA-256 and size of a file, read in chunks under the size limit."""
+        validate_upload(file)
+        digest = hashlib.sha256()
+        size = 0
+        await file.seek(0)
+        while chunk := await file.read(READ_CHUNK_SIZE):
+            size += len(chunk)
+            if size > MAX_FILE_SIZE_BYTES:
+                raise file_too_large()
+            # hashlib releases the GIL on large buffers
+            await self._call(digest.update, chunk)
+        await file.seek(0)
+        return digest.hexdigest(), size
+
+    async def upload(self, file: UploadFile, key: Optional[str] = None) -> str:
+        """Upload one file, under a fresh key unless one is given, and return its URL."""
+        validate_upload(file)
+        key = key or self.new_key(file)
+
+        await file.seek(0)
+        try:
+            size = await self._put(file, key)
+        except HTTPException:
+            self.failed += 1
+            raise
+
+        self.uploaded += 1
+        self.bytes_uploaded += size
+        return self.file_url(key)
+
+    async def upload_many(self, files: list[UploadFile], keys: Optional[list[str]] = None) -> list[str]:
+        """Upload files concurrently; if any fails, delete the ones that succeeded."""
+        for file in files:
+            validate_upload(file)
+        keys = keys or [self.new_key(file) for file in files]
+
+        results = await asyncio.gather(
+            *(self.upload(file, key) for file, key in zip(files, keys)), return_exceptions=True
+        )
+        failures = [result for result in results if isinstance(result, BaseException)]
+        if failures:
+            uploaded_keys = [key for key, result in zip(keys, results) if isinstance(result, str)]
+            await self.delete_many(uploaded_keys)
+            raise failures[0]
+        return results
+
+    async def verify_upload(self, key: str) -> dict:
+        """Check a directly uploaded object against the upload limits.
+
+        Returns its content type and size. An object that breaks the limits
+        is deleted before the error is raised.
+        """
+        try:
+            info = await self.head(key)
+        except HTTPException:
+            raise
+        except Exception as e:
+            raise upload_failed(e)
+        if info is None:
+            raise HTTPException(
+                status_code = status.HTTP_400_BAD_REQUEST,
+                detail = f"No uploaded file found for {key}."
+            )
+
+        try:
+            validate_file_type(info.content_type, info.size)
+        except HTTPException:
+            await self._delete_quietly(key)
+            self.failed += 1
+            raise
+
+        self.uploaded += 1
+        self.bytes_uploaded += info.size
+        return {"content_type": info.content_type, "size": info.size}
+
+    # ==================== Cleanup ====================
+
+    async def _delete_quietly(self, key: str) -> None:
+        try:
+            await self.delete(key)
+        except Exception:
+            logger.warning("Could not delete stored object %s", key)
+
+    async def delete_many(self, keys: list[str]) -> None:
+        """Delete objects concurrently, logging rather than raising on failure."""
+        await asyncio.gather(*(self._delete_quietly(key) for key in keys))
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def stats(self) -> dict:
+        return {
+            "backend": self.name,
+            "workers": self.max_workers,
+            "uploaded": self.uploaded,
+            "bytes_uploaded": self.bytes_uploaded,
+            "failed": self.failed,
+        }
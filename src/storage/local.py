@@ -0,0 +1,176 @@
+import errno
+import logging
+import mimetypes
+import os
+import uuid
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import AsyncIterator, BinaryIO, Optional
+from fastapi import UploadFile, HTTPException, status
+from .base import (
+    StorageBackend,
+    ObjectInfo,
+    MAX_FILE_SIZE_BYTES,
+    READ_CHUNK_SIZE,
+    file_too_large,
+    upload_failed,
+)
+
+
+logger = logging.getLogger(__name__)
+
+
+def _fileno(file: BinaryIO) -> Optional[int]:
+    """The descriptor behind an upload spool, without forcing an in-memory spool to disk."""
+    # SpooledTemporaryFile.fileno() would roll an in-memory buffer over to disk
+    raw = getattr(file, "_file", file)
+    try:
+        return raw.fileno()
+    except (AttributeError, OSError, ValueError):
+        return None
+
+
+class LocalStorage(StorageBackend):
+    """Attachments in a directory on local disk, for development, tests and offline benchmarks.
+
+    Uploads that the multipart parser spooled to disk are copied in the
+    kernel with sendfile; small in-memory uploads are written directly. Files
+    are written to a temporary name and renamed into place, so readers never
+    see a partial object. Reads are served in ranges with pread.
+    """
+
+    name = "local"
+
+    def __init__(
+            self,
+            root: str,
+            base_url: str,
+            max_workers: int
+    ):
+        super().__init__(max_workers)
+        self.root = Path(root).resolve()
+        self.base_url = base_url.rstrip("/")
+        self.root.mkdir(parents=True, exist_ok=True)
+
+    def _path(self, key: str) -> Path:
+        path = (self.root / key).resolve()
+        if not path.is_relative_to(self.root) or path == self.root:
+            raise HTTPException(
+                status_code = status.HTTP_400_BAD_REQUEST,
+                detail = "Invalid storage key."
+            )
+        return path
+
+    def file_url(self, key: str) -> str:
+        return f"{self.base_url}/{key}"
+
+    # ==================== Uploads ====================
+
+    def _copy(self, source: BinaryIO, target: BinaryIO) -> int:
+        source_fd = _fileno(source)
+        if source_fd is not None:
+            # The spool is a buffered file; sendfile only sees what reached the descriptor
+            source.flush()
+            size = os.fstat(source_fd).st_size
+            if size > MAX_FILE_SIZE_BYTES:
+                raise file_too_large()
+            try:
+                offset = 0
+                while offset < size:
+                    sent = os.sendfile(target.fileno(), source_fd, offset, size - offset)
+                    if sent == 0:
+                        break
+                    offset += sent
+                return offset
+            except OSError as e:
+                # Not every platform or filesystem supports file-to-file sendfile
+                if e.errno not in (errno.EINVAL, errno.ENOSYS, errno.ENOTSUP, errno.ENOTSOCK):
+                    raise
+                target.seek(0)
+                target.truncate()
+
+        source.seek(0)
+        size = 0
+        while chunk := source.read(READ_CHUNK_SIZE):
+            size += len(chunk)
+            if size > MAX_FILE_SIZE_BYTES:
+                raise file_too_large()
+            target.write(chunk)
+        return size
+
+    def _write(self, source: BinaryIO, path: Path) -> int:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temporary = path.with_name(f".{path.name}.{uuid.uuid4().hex}.tmp")
+        try:
+            with open(temporary, "wb") as target:
+                size = self._copy(source, target)
+            os.replace(temporary, path)
+        except BaseException:
+            temporary.unlink(missing_ok=True)
+            raise
+        return size
+
+    async def _put(self, file: UploadFile, key: str) -> int:
+        path = self._path(key)
+        try:
+            return await self._call(self._write, file.file, path)
+        except OSError as e:
+            raise upload_failed(e)
+
+    # ==================== Reads and deletes ====================
+
+    def _stat(self, key: str) -> Optional[ObjectInfo]:
+        try:
+            stat = os.stat(self._path(key))
+        except FileNotFoundError:
+            return None
+        return ObjectInfo(
+            size=stat.st_size,
+            content_type=mimetypes.guess_type(key)[0],
+            etag=f'"{stat.st_size:x}-{stat.st_mtime_ns:x}"',
+            last_modified=datetime.fromtimestamp(stat.st_mtime, timezone.utc),
+        )
+
+    async def head(self, key: str) -> Optional[ObjectInfo]:
+        return await self._call(self._stat, key)
+
+    async def delete(self, key: str) -> None:
+        await self._call(self._path(key).unlink, missing_ok=True)
+
+    def _list_objects(self, prefix: str) -> list[tuple[str, datetime]]:
+        directory = self.root / prefix.rpartition("/")[0]
+        if not directory.is_dir():
+            return []
+        objects = []
+        for path in directory.rglob("*"):
+            # Dot files are uploads still being written
+            if not path.is_file() or path.name.startswith("."):
+                continue
+            key = path.relative_to(self.root).as_posix()
+            if key.startswith(prefix):
+                objects.append((key, datetime.fromtimestamp(path.stat().st_mtime, timezone.utc)))
+        return objects
+
+    async def list_objects(self, prefix: str) -> list[tuple[str, datetime]]:
+        return await self._call(self._list_objects, prefix)
+
+    async def stream(
+            self,
+            key: str,
+            start: int = 0,
+            end: Optional[int] = None,
+            chunk_size: int = READ_CHUNK_SIZE
+    ) -> AsyncIterator[bytes]:
+        fd = await self._call(os.open, self._path(key), os.O_RDONLY)
+        try:
+            if end is None:
+                end = (await self._call(os.fstat, fd)).st_size - 1
+            position = start
+            while position <= end:
+                chunk = await self._call(os.pread, fd, min(chunk_size, end - position + 1), position)
+                if not chunk:
+                    break
+                yield chunk
+                position += len(chunk)
+        finally:
+            os.close(fd)
@@ -0,0 +1,119 @@
+from datetime import timezone
+from email.utils import format_datetime
+from typing import Optional
+from urllib.parse import quote
+from fastapi import HTTPException, Response, status
+from fastapi.responses import StreamingResponse
+from .base import StorageBackend
+
+
+def parse_range(header: Optional[str], size: int) -> Optional[tuple[int, int]]:
+    """The inclusive (start, end) a single-range Range header asks for.
+
+    Returns None when the whole object should be sent: no header, a header
+    we do not understand, or several ranges (which servers may ignore).
+    Raises 416 when the range lies outside the object.
+    """
+    if not header or not header.startswith("bytes=") or "," in header:
+        return None
+    first, _, last = header[len("bytes="):].strip().partition("-")
+    try:
+        if first:
+            start = int(first)
+            end = int(last) if last else None
+        elif last:
+            # bytes=-N is the last N bytes
+            start = max(size - int(last), 0)
+            end = None
+        else:
+            return None
+    except ValueError:
+        return None
+    if start < 0 or (end is not None and end < start):
+        return None
+    if start >= size:
+        raise HTTPException(
+            status_code = status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE,
+            detail = "Requested range not satisfiable.",
+            headers = {"Content-Range": f"bytes */{size}"},
+        )
+    return start, size - 1 if end is None else min(end, size - 1)
+
+
+def etag_matches(header: Optional[str], etag: Optional[str]) -> bool:
+    """Whether an If-None-Match header lists the ETag (weak comparison)."""
+    if not header or not etag:
+        return False
+    if header.strip() == "*":
+        return True
+    tag = etag.removeprefix("W/")
+    return any(candidate.strip().removeprefix("W/") == tag for candidate in header.split(","))
+
+
+def content_disposition(file_name: str) -> str:
+    """An attachment Content-Disposition with an ASCII fallback and the UTF-8 name."""
+    fallback = "".join(
+        ch for ch in file_name.encode("ascii", "ignore").decode()
+        if ch.isprintable() and ch not in '"\\'
+    ) or "download"
+    return f"attachment; filename=\"{fallback}\"; filename*=UTF-8''{quote(file_name)}"
+
+
+async def object_response(
+        storage: StorageBackend,
+        key: str,
+        range_header: Optional[str] = None,
+        media_type: Optional[str] = None,
+        etag: Optional[str] = None,
+        if_none_match: Optional[str] = None,
+        if_range: Optional[str] = None,
+        headers: Optional[dict[str, str]] = None
+) -> Response:
+    """Stream a stored object, or the part of it a Range header asks for.
+
+    Pass etag when the caller already knows it (content-addressed objects)
+    so a matching If-None-Match is answered with 304 without touching
+    storage. The body is read in fixed-size chunks, never held in full.
+    """
+    headers = {"Accept-Ranges": "bytes", **(headers or {})}
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={**headers, "ETag": etag})
+
+    info = await storage.head(key)
+    if info is None:
+        raise HTTPException(
+            status_code = status.HTTP_404_NOT_FOUND,
+            detail = "File not found."
+        )
+
+    etag = etag or info.etag
+    if etag:
+        headers["ETag"] = etag
+    if info.last_modified:
+        headers["Last-Modified"] = format_datetime(info.last_modified.astimezone(timezone.utc), usegmt=True)
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    media_type = media_type or info.content_type or "application/octet-stream"
+
+    if info.size == 0:
+        return Response(content=b"", media_type=media_type, headers=headers)
+
+    # A Range applies only if the client's copy (If-Range) is still current
+    if if_range is not None and (not etag or if_range.strip() != etag or etag.startswith("W/")):
+        range_header = None
+    byte_range = parse_range(range_header, info.size)
+    if byte_range is None:
+        start, end = 0, info.size - 1
+        status_code = status.HTTP_200_OK
+    else:
+        start, end = byte_range
+        status_code = status.HTTP_206_PARTIAL_CONTENT
+        headers["Content-Range"] = f"bytes {start}-{end}/{info.size}"
+    headers["Content-Length"] = str(end - start + 1)
+
+    return StreamingResponse(
+        storage.stream(key, start, end),
+        status_code=status_code,
+        media_type=media_type,
+        headers=headers,
+    )
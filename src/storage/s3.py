@@ -0,0 +1,209 @@
+import logging
+import threading
+from datetime import datetime
+from typing import AsyncIterator, Optional
+from fastapi import UploadFile
+from botocore.exceptions import BotoCoreError, ClientError
+from .base import (
+    StorageBackend,
+    ObjectInfo,
+    MAX_FILE_SIZE_BYTES,
+    READ_CHUNK_SIZE,
+    file_too_large,
+    upload_failed,
+    validate_file_type,
+)
+
+
+logger = logging.getLogger(__name__)
+
+# S3 rejects multipart parts under 5 MB (except the last one)
+MIN_PART_SIZE = 5 * 1024 * 1024
+
+
+class S3Storage(StorageBackend):
+    """Attachments in an S3 (or S3-compatible) bucket.
+
+    The boto3 client is built on first use, so importing the app needs no
+    AWS configuration. Each upload is read in chunks and the size limit is
+    enforced as bytes arrive; a file that fits in one part is sent with a
+    single PutObject, anything larger with a multipart upload, so at most
+    one part per file is held in memory.
+    """
+
+    name = "s3"
+    supports_presigned_uploads = True
+
+    def __init__(
+            self,
+            bucket: Optional[str],
+            region: str,
+            access_key_id: Optional[str],
+            secret_access_key: Optional[str],
+            endpoint_url: Optional[str],
+            max_workers: int,
+            part_size: int
+    ):
+        if not bucket:
+            raise ValueError("AWS_S3_BUCKET_NAME is required for the s3 storage backend.")
+        super().__init__(max_workers)
+        self.bucket = bucket
+        self.region = region
+        self.access_key_id = access_key_id
+        self.secret_access_key = secret_access_key
+        self.endpoint_url = endpoint_url
+        self.part_size = max(part_size, MIN_PART_SIZE)
+        self.multipart_uploads = 0
+
+        self._client = None
+        self._client_lock = threading.Lock()
+
+    @property
+    def client(self):
+        if self._client is None:
+            with self._client_lock:
+                if self._client is None:
+                    import boto3
+                    from botocore.config import Config as BotoConfig
+
+                    self._client = boto3.client(
+                        "s3",
+                        region_name=self.region,
+                        aws_access_key_id=self.access_key_id,
+                        aws_secret_access_key=self.secret_access_key,
+                        endpoint_url=self.endpoint_url,
+                        # SigV4 signs Content-Type and Content-Length into presigned PUT URLs
+                        config=BotoConfig(max_pool_connections=self.max_workers, signature_version="s3v4"),
+                    )
+        return self._client
+
+    def file_url(self, key: str) -> str:
+        if self.endpoint_url:
+            return f"{self.endpoint_url.rstrip('/')}/{self.bucket}/{key}"
+        return f"https://{self.bucket}.s3.{self.region}.amazonaws.com/{key}"
+
+    # ==================== Uploads ====================
+
+    async def _read_part(self, file: UploadFile, total: int) -> bytes:
+        """Read up to one part, failing as soon as the file passes the size limit."""
+        part = bytearray()
+        while len(part) < self.part_size:
+            chunk = await file.read(min(READ_CHUNK_SIZE, self.part_size - len(part)))
+            if not chunk:
+                break
+            part += chunk
+            if total + len(part) > MAX_FILE_SIZE_BYTES:
+                raise file_too_large()
+        return bytes(part)
+
+    async def _upload_multipart(self, file: UploadFile, key: str, first_part: bytes) -> int:
+        upload = await self._call(
+            self.client.create_multipart_upload,
+            Bucket=self.bucket, Key=key, ContentType=file.content_type,
+        )
+        upload_id = upload["UploadId"]
+        parts = []
+        total = 0
+        part = first_part
+        try:
+            while part:
+                response = await self._call(
+                    self.client.upload_part,
+                    Bucket=self.bucket, Key=key, UploadId=upload_id,
+                    PartNumber=len(parts) + 1, Body=part,
+                )
+                parts.append({"PartNumber": len(parts) + 1, "ETag": response["ETag"]})
+                total += len(part)
+                part = await self._read_part(file, total)
+
+            await self._call(
+                self.client.complete_multipart_upload,
+                Bucket=self.bucket, Key=key, UploadId=upload_id,
+                MultipartUpload={"Parts": parts},
+            )
+        except BaseException:
+            try:
+                await self._call(
+                    self.client.abort_multipart_upload,
+                    Bucket=self.bucket, Key=key, UploadId=upload_id,
+                )
+            except (BotoCoreError, ClientError):
+                logger.warning("Could not abort multipart upload %s for %s", upload_id, key)
+            raise
+        self.multipart_uploads += 1
+        return total
+
+    async def _put(self, file: UploadFile, key: str) -> int:
+        try:
+            first_part = await self._read_part(file, 0)
+            if len(first_part) < self.part_size:
+                await self._call(
+                    self.client.put_object,
+                    Bucket=self.bucket, Key=key, Body=first_part, ContentType=file.content_type,
+                )
+                return len(first_part)
+            return await self._upload_multipart(file, key, first_part)
+        except (BotoCoreError, ClientError) as e:
+            raise upload_failed(e)
+
+    def presign_put(self, key: str, content_type: str, size: int, expires_in: int) -> str:
+        """A URL the client can PUT exactly `size` bytes of `content_type` to."""
+        validate_file_type(content_type, size)
+        return self.client.generate_presigned_url(
+            "put_object",
+            Params={"Bucket": self.bucket, "Key": key, "ContentType": content_type, "ContentLength": size},
+            ExpiresIn=expires_in,
+        )
+
+    # ==================== Reads and deletes ====================
+
+    async def head(self, key: str) -> Optional[ObjectInfo]:
+        try:
+            response = await self._call(self.client.head_object, Bucket=self.bucket, Key=key)
+        except ClientError as e:
+            if e.response.get("Error", {}).get("Code") in ("404", "NoSuchKey", "NotFound"):
+                return None
+            raise
+        return ObjectInfo(
+            size=response["ContentLength"],
+            content_type=response.get("ContentType"),
+            etag=response.get("ETag"),
+            last_modified=response.get("LastModified"),
+        )
+
+    async def delete(self, key: str) -> None:
+        await self._call(self.client.delete_object, Bucket=self.bucket, Key=key)
+
+    def _list_objects(self, prefix: str) -> list[tuple[str, datetime]]:
+        paginator = self.client.get_paginator("list_objects_v2")
+        return [
+            (item["Key"], item["LastModified"])
+            for page in paginator.paginate(Bucket=self.bucket, Prefix=prefix)
+            for item in page.get("Contents", [])
+        ]
+
+    async def list_objects(self, prefix: str) -> list[tuple[str, datetime]]:
+        return await self._call(self._list_objects, prefix)
+
+    async def stream(
+            self,
+            key: str,
+            start: int = 0,
+            end: Optional[int] = None,
+            chunk_size: int = READ_CHUNK_SIZE
+    ) -> AsyncIterator[bytes]:
+        byte_range = f"bytes={start}-{'' if end is None else end}"
+        response = await self._call(self.client.get_object, Bucket=self.bucket, Key=key, Range=byte_range)
+        body = response["Body"]
+        try:
+            while chunk := await self._call(body.read, chunk_size):
+                yield chunk
+        finally:
+            body.close()
+
+    def stats(self) -> dict:
+        return {
+            **super().stats(),
+            "part_size": self.part_size,
+            "multipart_uploads": self.multipart_uploads,
+        }
@@ -0,0 +1,193 @@
+import asyncio
+import logging
+from collections import Counter
+from datetime import datetime
+from typing import Optional
+from fastapi import UploadFile
+from sqlmodel.ext.asyncio.session import AsyncSession
+from sqlmodel import select, func
+from sqlalchemy import case, delete, update
+from sqlalchemy.dialects.postgresql import insert
+from src.db.models.attachment_blob import AttachmentBlob
+from src.storage import storage, blob_key, validate_upload
+
+
+logger = logging.getLogger(__name__)
+
+
+class AttachmentBlobService:
+    """Content-addressed attachment storage with reference counting.
+
+    Each distinct file is stored once, under blobs/<sha256>. Reference counts
+    change on the caller's session and commit with the attachment rows that
+    caused them. release only lowers counts; a blob at zero keeps its row and
+    object until delete_unreferenced runs after the commit, so a rolled back
+    delete never leaves rows pointing at a removed object. store_many treats
+    a blob going from zero to n like a new one and uploads it again.
+    """
+
+    def __init__(self):
+        self.deduplicated_uploads = 0
+        self.bytes_deduplicated = 0
+
+    async def store_many(
+            self,
+            session: AsyncSession,
+            files: list[UploadFile]
+    ) -> list[str]:
+        """Take a reference on each file's blob, uploading content not stored yet.
+
+        Returns the SHA-256 of each file, in order.
+        """
+        for file in files:
+            validate_upload(file)
+        hashed = await asyncio.gather(*(storage.hash_file(file) for file in files))
+        digests = [digest for digest, _ in hashed]
+        references = Counter(digests)
+        first_file = {}
+        for file, (digest, size) in zip(files, hashed):
+            first_file.setdefault(digest, (file, size))
+
+        now = datetime.utcnow()
+        # Sorted so concurrent requests lock blob rows in the same order
+        statement = insert(AttachmentBlob).values([
+            {
+                "sha256": digest,
+                "size": first_file[digest][1],
+                "content_type": first_file[digest][0].content_type,
+                "ref_count": references[digest],
+                "created_at": now,
+            }
+            for digest in sorted(references)
+        ])
+        statement = statement.on_conflict_do_update(
+            index_elements=[AttachmentBlob.sha256],
+            set_={"ref_count": AttachmentBlob.ref_count + statement.excluded.ref_count},
+        ).returning(AttachmentBlob.sha256, AttachmentBlob.ref_count)
+        rows = (await session.execute(statement)).all()
+
+        # A blob whose count is only this request's references was just created
+        new_digests = [row.sha256 for row in rows if row.ref_count == references[row.sha256]]
+        if new_digests:
+            await storage.upload_many(
+                [first_file[digest][0] for digest in new_digests],
+                keys=[blob_key(digest) for digest in new_digests],
+            )
+
+        skipped = len(files) - len(new_digests)
+        if skipped:
+            uploaded_bytes = sum(first_file[digest][1] for digest in new_digests)
+            saved = sum(size for _, size in hashed) - uploaded_bytes
+            self.deduplicated_uploads += skipped
+            self.bytes_deduplicated += saved
+            logger.info("Deduplicated %d of %d attachments, %d bytes not uploaded", skipped, len(files), saved)
+        return digests
+
+    async def release(
+            self,
+            session: AsyncSession,
+            digests: list[str]
+    ) -> list[str]:
+        """Drop one reference per digest.
+
+        Call after the attachment rows are flushed and before commit. Returns
+        the digests left unreferenced; pass them to delete_unreferenced once
+        the caller has committed.
+        """
+        references = Counter(digests)
+        if not references:
+            return []
+
+        ordered = sorted(references)
+        await session.execute(
+            select(AttachmentBlob.sha256)
+            .where(AttachmentBlob.sha256.in_(ordered))
+            .order_by(AttachmentBlob.sha256)
+            .with_for_update()
+        )
+        rows = (await session.execute(
+            update(AttachmentBlob)
+            .where(AttachmentBlob.sha256.in_(ordered))
+            .values(ref_count=AttachmentBlob.ref_count - case(references, value=AttachmentBlob.sha256))
+            .returning(AttachmentBlob.sha256, AttachmentBlob.ref_count)
+            .execution_options(synchronize_session=False)
+        )).all()
+        return sorted(row.sha256 for row in rows if row.ref_count <= 0)
+
+    async def delete_unreferenced(
+            self,
+            session: AsyncSession,
+            digests: Optional[list[str]] = None
+    ) -> int:
+        """Delete the objects and rows of blobs that are still unreferenced.
+
+        Takes committed state only: call after commit, with the digests from
+        release or None to sweep every blob at zero. Each blob is re-locked and
+        re-checked, and its row is removed only after its object is, in its
+        own transaction. Returns how many blobs were deleted.
+        """
+        if digests is None:
+            digests = (await session.execute(
+                select(AttachmentBlob.sha256)
+                .where(AttachmentBlob.ref_count <= 0)
+                .order_by(AttachmentBlob.sha256)
+            )).scalars().all()
+            await session.commit()
+
+        deleted = 0
+        for digest in digests:
+            try:
+                # A concurrent store_many that took a reference wins; the row is skipped
+                unreferenced = (await session.execute(
+                    select(AttachmentBlob.sha256)
+                    .where(AttachmentBlob.sha256 == digest, AttachmentBlob.ref_count <= 0)
+                    .with_for_update()
+                )).scalar_one_or_none()
+                if unreferenced is None:
+                    await session.commit()
+                    continue
+                await storage.delete(blob_key(digest))
+                await session.execute(
+                    delete(AttachmentBlob)
+                    .where(AttachmentBlob.sha256 == digest)
+                    .execution_options(synchronize_session=False)
+                )
+                await session.commit()
+                deleted += 1
+            except Exception:
+                # The row stays at zero for the next sweep
+                await session.rollback()
+                logger.warning("Could not delete unreferenced blob %s", digest, exc_info=True)
+        return deleted
+
+    async def storage_stats(
+            self,
+            session: AsyncSession
+    ) -> dict:
+        """Stored versus referenced attachment bytes, and what this process skipped uploading."""
+        row = (await session.execute(
+            select(
+                func.count(AttachmentBlob.sha256).label("blobs"),
+                func.coalesce(func.sum(AttachmentBlob.ref_count), 0).label("references"),
+                func.coalesce(func.sum(AttachmentBlob.size), 0).label("stored_bytes"),
+                func.coalesce(func.sum(AttachmentBlob.size * AttachmentBlob.ref_count), 0).label("referenced_bytes"),
+            )
+        )).one()
+        return {
+            "blobs": row.blobs,
+            "references": row.references,
+            "stored_bytes": row.stored_bytes,
+            "referenced_bytes": row.referenced_bytes,
+            "bytes_saved": row.referenced_bytes - row.stored_bytes,
+            "deduplicated_uploads": self.deduplicated_uploads,
+            "bytes_deduplicated": self.bytes_deduplicated,
+        }
+
+
+attachment_blob_service = AttachmentBlobService()
+
+
+__all__ = [
+    "AttachmentBlobService",
+    "attachment_blob_service",
+]
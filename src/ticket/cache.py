@@ -0,0 +1,27 @@
+from uuid import UUID
+from src.config import Config
+from src.cache import create_cache
+
+
+ticket_cache = create_cache("tickets", ttl_seconds=Config.TICKET_CACHE_TTL_SECONDS)
+
+
+def ticket_tag(ticket_id: UUID) -> str:
+    return f"ticket:{ticket_id}"
+
+
+def ticket_detail_key(ticket_id: UUID) -> tuple:
+    return ("ticket-detail", str(ticket_id))
+
+
+async def invalidate_ticket_detail(ticket_id: UUID) -> None:
+    """Call after a committed write to a ticket, its attachments or its comments."""
+    await ticket_cache.invalidate(ticket_tag(ticket_id))
+
+
+__all__ = [
+    "ticket_cache",
+    "ticket_tag",
+    "ticket_detail_key",
+    "invalidate_ticket_detail",
+]
@@ -0,0 +1,29 @@
+from src.db.models.attachment import Attachment
+from src.db.models.comment import Comment
+from src.db.models.ticket import Ticket
+from src.db.models.ticket_history import TicketHistory
+from src.db.projection import Projection
+from src.comment.schemas import CommentResponse
+from .schemas import AttachmentResponse, TicketDetails, TicketHistoryListResponse, TicketSummaryResponse
+
+
+# What each ticket read endpoint loads; see Projection
+TICKET_SUMMARY = Projection(Ticket, TicketSummaryResponse)
+
+TICKET_DETAILS = Projection(
+    Ticket,
+    TicketDetails,
+    relationships={
+        "attachments": Projection(Attachment, AttachmentResponse),
+        "comments": Projection(Comment, CommentResponse),
+    },
+)
+
+TICKET_HISTORY_ENTRY = Projection(TicketHistory, TicketHistoryListResponse)
+
+
+__all__ = [
+    "TICKET_SUMMARY",
+    "TICKET_DETAILS",
+    "TICKET_HISTORY_ENTRY",
+]
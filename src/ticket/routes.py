@@ -1,17 +1,21 @@
-from fastapi import APIRouter, Depends, status, File, UploadFile,Form
+from fastapi import APIRouter, Depends, status, File, UploadFile,Form, Query, Header
 from sqlmodel.ext.asyncio.session import AsyncSession
 from uuid import UUID
 
-from .service import TicketService, TicketCreateRequest, TicketUpdateRequest, TicketStatus, TicketPriority
-from .schemas import TicketDetails, TicketResponse, TicketSummaryResponse
-from src.auth.dependencies import role_checker, AccessTokenBearer
-from src.db.main import get_session
+from .service import TicketService, TicketCreateRequest, TicketUpdateRequest, TicketStatus, TicketPriority, IssueType, TICKET_PAGE_SIZE, HISTORY_PAGE_SIZE
+from .schemas import TicketDetails, TicketResponse, TicketSummaryResponse, TicketPageResponse, AttachmentResponse, AttachmentUploadUrlsRequest, AttachmentUploadUrlsResponse, AttachmentFinalizeRequest
+from src.auth.dependencies import role_checker, get_auth_context
+from src.auth.schemas import AuthContext
+from src.db.main import get_session, get_read_session
 from src.db.models import User, UserRole
 from typing import Optional
 import json
 
 from src.db.models.ticket_history import TicketHistory
-from src.ticket.schemas import TicketHistoryPaginatedResponse
+from src.ticket.schemas import TicketHistoryPaginatedResponse, HistoryTotal
+from src.config import Config
+from src.storage import storage
+from src.storage.responses import object_response, content_disposition
 
 
 ticket_router = APIRouter()
@@ -44,9 +48,8 @@ async def create_ticket(
     assigned_to: Optional[str] = Form(None),
     files: Optional[list[UploadFile]] = File(None),
     session: AsyncSession = Depends(get_session),
-    current_user: dict = Depends(AccessTokenBearer()),
+    auth: AuthContext = Depends(get_auth_context),
 ):
-    user_id = current_user["user"]["user_id"]
     ticket_dict = {
         "subject": subject,
         "description": description,
@@ -61,7 +64,7 @@ async def create_ticket(
 
     return await ticket_service.create_ticket_with_attachments(
         ticket_object,
-        user_id,
+        auth,
         files,
         session
     )
@@ -92,10 +95,8 @@ async def update_ticket(
     assigned_to: Optional[str] = Form(None),
     files: Optional[list[UploadFile]] = File(None),
     session: AsyncSession = Depends(get_session),
-    current_user: dict = Depends(AccessTokenBearer()),
+    auth: AuthContext = Depends(get_auth_context),
 ):
-    user_id = current_user["user"]["user_id"]
-
     # Build update dict with only provided fields
     ticket_dict = {}
     if subject is not None:
@@ -117,7 +118,7 @@ async def update_ticket(
         ticket_id=ticket_id,
         ticket_data=ticket_object,
         files=files,
-        user_id=user_id,
+        auth=auth,
         session=session
     )
 
@@ -125,30 +126,54 @@ async def update_ticket(
 @ticket_router.get(
     "/my-tickets",
     status_code=status.HTTP_200_OK,
-    response_model=list[TicketSummaryResponse],
+    response_model=TicketPageResponse,
     dependencies=[AllUsers],
 )
 async def get_my_tickets(
-    session : AsyncSession = Depends(get_session),
-    current_user: dict = Depends(AccessTokenBearer()),
+    session : AsyncSession = Depends(get_read_session),
+    auth: AuthContext = Depends(get_auth_context),
+    cursor: Optional[str] = Query(None, description="Cursor returned as next_cursor by the previous page"),
+    limit: int = Query(TICKET_PAGE_SIZE, ge=1, le=100, description="Number of tickets per page"),
+    status: Optional[TicketStatus] = Query(None),
+    priority: Optional[TicketPriority] = Query(None),
+    types_of_issue: Optional[IssueType] = Query(None),
 ):
-    user_id = current_user["user"]["user_id"]
-    return await ticket_service.get_user_tickets(user_id, session)
+    """Tickets created by or assigned to the current user, most recently updated first."""
+    return await ticket_service.get_user_tickets(
+        auth,
+        session,
+        cursor=cursor,
+        limit=limit,
+        status=status,
+        priority=priority,
+        types_of_issue=types_of_issue
+    )
 
 @ticket_router.get(
     "/unassigned",
     status_code=status.HTTP_200_OK,
-    response_model=list[TicketSummaryResponse],
+    response_model=TicketPageResponse,
     dependencies=[PrivilegedRoles],
-    summary="Get all unassigned tickets",
+    summary="Get unassigned tickets",
 )
 async def get_unassigned_tickets(
-    session : AsyncSession = Depends(get_session),
-    current_user: dict = Depends(AccessTokenBearer()),
+    session : AsyncSession = Depends(get_read_session),
+    cursor: Optional[str] = Query(None, description="Cursor returned as next_cursor by the previous page"),
+    limit: int = Query(TICKET_PAGE_SIZE, ge=1, le=100, description="Number of tickets per page"),
+    status: Optional[TicketStatus] = Query(None),
+    priority: Optional[TicketPriority] = Query(None),
+    types_of_issue: Optional[IssueType] = Query(None),
 ):
-    """Get a list of all tickets that are not assigned to any user.
+    """Get a page of tickets that are not assigned to any user, most recently updated first.
     Only accessible by admin, manager, and IT support roles."""
-    return await ticket_service.get_unassigned_tickets(session)
+    return await ticket_service.get_unassigned_tickets(
+        session,
+        cursor=cursor,
+        limit=limit,
+        status=status,
+        priority=priority,
+        types_of_issue=types_of_issue
+    )
 
 @ticket_router.get(
         "/{ticket_id}",
@@ -159,7 +184,7 @@ async def get_unassigned_tickets(
 async def get_ticket_by_id(
     ticket_id: UUID,
     session : AsyncSession = Depends(get_session),
-    current_user: dict = Depends(AccessTokenBearer()),
+    auth: AuthContext = Depends(get_auth_context),
 ):
     
     """
@@ -169,8 +194,7 @@ async def get_ticket_by_id(
     - User is assigned to the ticket
     """
 
-    user_id = current_user["user"]["user_id"]
-    return await ticket_service.get_user_ticket(ticket_id,user_id,session)
+    return await ticket_service.get_user_ticket(ticket_id, auth, session)
 
 
 
@@ -182,10 +206,9 @@ async def get_ticket_by_id(
 async def delete_ticket(
     ticket_id: UUID,
     session: AsyncSession = Depends(get_session),
-    current_user: dict = Depends(AccessTokenBearer()),
+    auth: AuthContext = Depends(get_auth_context),
 ):
-    user_id = current_user["user"]["user_id"] 
-    return await ticket_service.delete_ticket(ticket_id, user_id, session)
+    return await ticket_service.delete_ticket(ticket_id, auth, session)
 
 
 @ticket_router.delete(
@@ -196,10 +219,72 @@ async def delete_ticket(
 async def delete_attachment(
     attachment_id: UUID,
     session: AsyncSession = Depends(get_session),
-    current_user: dict = Depends(AccessTokenBearer()),
+    auth: AuthContext = Depends(get_auth_context),
+):
+    return await ticket_service.delete_attachment(attachment_id, auth, session)
+
+
+@ticket_router.get(
+    "/attachment/{attachment_id}/download",
+    dependencies=[AllUsers],
+    summary="Download an attachment, optionally a byte range of it",
+)
+async def download_attachment(
+    attachment_id: UUID,
+    range: Optional[str] = Header(None),
+    if_none_match: Optional[str] = Header(None),
+    if_range: Optional[str] = Header(None),
+    session: AsyncSession = Depends(get_read_session),
+    auth: AuthContext = Depends(get_auth_context),
 ):
-    user_id = current_user["user"]["user_id"]
-    return await ticket_service.delete_attachment(attachment_id, user_id, session)
+    attachment, key, etag = await ticket_service.get_attachment_download(attachment_id, auth, session)
+    return await object_response(
+        storage,
+        key,
+        range,
+        media_type=attachment.file_type,
+        etag=etag,
+        if_none_match=if_none_match,
+        if_range=if_range,
+        # Revalidate every time so revoked access is enforced; unchanged files cost a 304
+        headers={
+            "Cache-Control": "private, no-cache",
+            "Content-Disposition": content_disposition(attachment.file_name),
+        },
+    )
+
+
+@ticket_router.post(
+    "/{ticket_id}/attachments/upload-urls",
+    status_code=status.HTTP_201_CREATED,
+    response_model=AttachmentUploadUrlsResponse,
+    dependencies=[AllUsers],
+    summary="Get presigned URLs to upload attachments directly to storage",
+)
+async def create_attachment_upload_urls(
+    ticket_id: UUID,
+    request: AttachmentUploadUrlsRequest,
+    session: AsyncSession = Depends(get_read_session),
+    auth: AuthContext = Depends(get_auth_context),
+):
+    uploads = await ticket_service.create_attachment_upload_urls(ticket_id, request.files, auth, session)
+    return {"uploads": uploads}
+
+
+@ticket_router.post(
+    "/{ticket_id}/attachments/finalize",
+    status_code=status.HTTP_201_CREATED,
+    response_model=list[AttachmentResponse],
+    dependencies=[AllUsers],
+    summary="Attach files uploaded with presigned URLs",
+)
+async def finalize_attachment_uploads(
+    ticket_id: UUID,
+    request: AttachmentFinalizeRequest,
+    session: AsyncSession = Depends(get_session),
+    auth: AuthContext = Depends(get_auth_context),
+):
+    return await ticket_service.finalize_attachment_uploads(ticket_id, request.files, auth, session)
 
 
 # @ticket_router.get(
@@ -228,19 +313,22 @@ async def get_ticket_history(
     status : Optional[str] = None,
     priority : Optional[str] = None,
     changed_by : Optional[UUID] = None,
-    page: int = 1,
-    session : AsyncSession = Depends(get_session),
-    current_user: dict = Depends(AccessTokenBearer())
+    cursor: Optional[str] = Query(None, description="Cursor returned as next_cursor by the previous page"),
+    limit: int = Query(HISTORY_PAGE_SIZE, ge=1, le=Config.HISTORY_MAX_PAGE_SIZE, description="Number of entries per page"),
+    total: HistoryTotal = Query(HistoryTotal.CACHED, description="exact, cached (until the ticket changes) or none"),
+    session : AsyncSession = Depends(get_read_session),
+    auth: AuthContext = Depends(get_auth_context)
 ):
-    user_id = current_user["user"]["user_id"]
     return await ticket_service.get_ticket_history(
         ticket_id=ticket_id,
-        user_id=user_id,
+        auth=auth,
         session=session,
         status=TicketStatus(status) if status else None,
         priority=TicketPriority(priority) if priority else None,
         changed_by=changed_by,
-        page=page
+        cursor=cursor,
+        limit=limit,
+        total=total
     )
 
 
@@ -1,11 +1,15 @@
-from pydantic import BaseModel, Field, ConfigDict
+from pydantic import BaseModel, Field, ConfigDict, field_validator, ValidationInfo
 from datetime import datetime
 import uuid 
 from typing import Optional, List
+import enum
 from src.db.models.ticket import TicketStatus, TicketPriority, IssueType
 from src.comment.schemas import CommentResponse
 
 
+# Attachments are read only through this endpoint, which checks ticket access
+ATTACHMENT_DOWNLOAD_PATH = "/api/v1/ticket/attachment/{attachment_id}/download"
+
 
 class AttachmentResponse(BaseModel):
     attachment_id : uuid.UUID
@@ -18,6 +22,48 @@ class AttachmentResponse(BaseModel):
     class Config:
         orm_mode = True
 
+    @field_validator("file_url")
+    def download_url(cls, v, info: ValidationInfo):
+        # The stored URL stays internal; clients get the authorized download route
+        if "attachment_id" not in info.data:
+            return v
+        return ATTACHMENT_DOWNLOAD_PATH.format(attachment_id=info.data["attachment_id"])
+
+# Files per presigned upload or finalize request
+MAX_DIRECT_UPLOADS = 10
+
+
+class AttachmentUploadRequest(BaseModel):
+    file_name : str = Field(..., min_length=1, max_length=255)
+    file_type : str
+    size : int = Field(..., gt=0)
+
+
+class AttachmentUploadUrlsRequest(BaseModel):
+    files : List[AttachmentUploadRequest] = Field(..., min_length=1, max_length=MAX_DIRECT_UPLOADS)
+
+
+class PresignedUploadResponse(BaseModel):
+    key : str
+    file_name : str
+    upload_url : str
+    headers : dict[str, str]
+    expires_in : int
+
+
+class AttachmentUploadUrlsResponse(BaseModel):
+    uploads : List[PresignedUploadResponse]
+
+
+class FinalizedUpload(BaseModel):
+    key : str
+    file_name : str = Field(..., min_length=1, max_length=255)
+
+
+class AttachmentFinalizeRequest(BaseModel):
+    files : List[FinalizedUpload] = Field(..., min_length=1, max_length=MAX_DIRECT_UPLOADS)
+
+
 class TicketResponse(BaseModel):
     ticket_id : uuid.UUID
     subject : str
@@ -57,6 +103,11 @@ class TicketSummaryResponse(BaseModel):
         orm_mode = True
 
 
+class TicketPageResponse(BaseModel):
+    tickets: List[TicketSummaryResponse]
+    next_cursor: Optional[str] = None
+
+
 class TicketCreateRequest(BaseModel):
     subject : str = Field(
         ..., 
@@ -101,10 +152,16 @@ class TicketHistoryListResponse(BaseModel):
         from_attributes = True
 
 
+class HistoryTotal(str, enum.Enum):
+    EXACT = "exact"    # COUNT on every request
+    CACHED = "cached"  # COUNT cached until the ticket next changes
+    NONE = "none"      # skip the count
+
+
 class TicketHistoryPaginatedResponse(BaseModel):
     histories: List[TicketHistoryListResponse]
-    total: int
-    page: int
+    next_cursor: Optional[str] = None
+    total: Optional[int] = None
     page_size: int
 
     class Config:
@@ -1,47 +1,79 @@
-from datetime import datetime
+import logging
+from datetime import datetime, timedelta, timezone
 from fastapi import HTTPException, status
 from sqlmodel.ext.asyncio.session import AsyncSession
 from sqlmodel import select, func
+from sqlalchemy import tuple_, union_all
 from uuid import UUID
+import uuid
 
-from src.db.models.ticket import Ticket, TicketStatus, TicketPriority
+from src.db.models.ticket import Ticket, TicketStatus, TicketPriority, IssueType
 from src.db.models.user import User, UserRole
+from src.auth.schemas import Principal, AuthContext
+from src.auth.service import UserService
 from src.ticket.schemas import TicketCreateRequest, TicketUpdateRequest
 from src.errors import TicketNotFoundError, UserNotFoundError, UnauthorizedError, InvalidTicketUpdateError, TicketPriorityUpdateError, TicketStatusUpdateError, TicketAssignmentError, BadRequestError, AttachmentNotFoundError
 
 from sqlalchemy.orm import selectinload  ## required for fetching comments
 from src.db.models.comment import Comment
 from fastapi import UploadFile
-from src.utils.s3_utils import upload_file_to_s3
+from src.storage import storage, blob_key, attachment_key_prefix, TICKET_KEYS_PREFIX, create_presigned_upload, verify_presigned_uploads
 from src.db.models.attachment import Attachment
 from src.db.models.ticket_history import TicketHistory
+from src.analytics.counters import TicketCounterService
+from src.analytics.resolution import ResolutionMetricsService
+from src.analytics.cache import invalidate_ticket_analytics
+from src.ticket.blobs import attachment_blob_service
+from src.ticket.cache import ticket_cache, ticket_tag, ticket_detail_key, invalidate_ticket_detail
+from src.ticket.schemas import TicketDetails, HistoryTotal, AttachmentUploadRequest, FinalizedUpload
+from src.ticket.projections import TICKET_SUMMARY, TICKET_DETAILS, TICKET_HISTORY_ENTRY
+from src.utils.cache import make_cache_key
+from src.config import Config
+from src.db.session import on_primary
+from src.utils.pagination import encode_cursor, decode_cursor
 
 from typing import Optional
 
 
 
 
-HISTORY_PAGE_SIZE = 10
+logger = logging.getLogger(__name__)
+
+HISTORY_PAGE_SIZE = Config.HISTORY_PAGE_SIZE
+TICKET_PAGE_SIZE = 20
+
+# How long past its presigned URL's expiry a direct upload may wait to be finalized
+UNFINALIZED_UPLOAD_GRACE = timedelta(hours=1)
 
 
 
 PRIVILEGED_ROLES = {"admin", "manager", "it_support"}
-def is_privileged(user: User) -> bool:
+def is_privileged(user: Principal) -> bool:
     """Check if the user has a privileged role."""
     return user.role.value.lower() in PRIVILEGED_ROLES
 
 
 class TicketService:
+    def __init__(self):
+        self.counter_service = TicketCounterService()
+        self.resolution_service = ResolutionMetricsService()
+        self.user_service = UserService()
+        self.blob_service = attachment_blob_service
 
     # ==================== Helper Methods ====================
     async def get_ticket(
             self,
             ticket_id : UUID,
-            session : AsyncSession
+            session : AsyncSession,
+            for_update : bool = False
     ) -> Ticket:
-        ticket = (await session.execute(
-            select(Ticket).where(Ticket.ticket_id == ticket_id)
-        )).scalar_one_or_none()
+        """Load a ticket; for_update locks its row until commit and reloads its values."""
+        statement = select(Ticket).where(Ticket.ticket_id == ticket_id)
+        if for_update:
+            # Writers that derive counter changes from the old values must not
+            # both read the same old values
+            statement = statement.with_for_update(of=Ticket).execution_options(populate_existing=True)
+        ticket = (await session.execute(statement)).scalar_one_or_none()
 
         if not ticket:
             raise TicketNotFoundError()
@@ -53,14 +85,8 @@ class TicketService:
             self,
             user_id : UUID,
             session : AsyncSession
-    ) -> User:
-        user = (await session.execute(
-            select(User).where(User.user_id == user_id)
-        )).scalar_one_or_none()
-
-        if not user:
-            raise UserNotFoundError()
-        return user
+    ) -> Principal:
+        return await self.user_service.get_principal(user_id, session)
     
 
 
@@ -69,7 +95,7 @@ class TicketService:
             self,
             user_id : UUID,
             session : AsyncSession
-    ) -> User:
+    ) -> Principal:
         user = await self.get_user(user_id, session)
         if not is_privileged(user):
             raise HTTPException(
@@ -84,7 +110,7 @@ class TicketService:
     def check_ticket_access(
             self,
             ticket : Ticket,
-            user : User,
+            user : Principal,
             user_id : UUID,
     ) -> bool:
         has_access = (
@@ -102,7 +128,7 @@ class TicketService:
     def validate_ticket_update_permission(
         self,
         update_data: dict,
-        user: User,
+        user: Principal,
         ticket: Ticket,
         user_id : UUID
 ):
@@ -155,7 +181,7 @@ class TicketService:
     def check_delete_permission(
             self,
             ticket : Ticket,
-            user : User,
+            user : Principal,
             user_id : UUID
     ):
         if ticket.created_by != user_id and not is_privileged(user):
@@ -175,38 +201,45 @@ class TicketService:
         return attachment
     
 
-    async def log_ticket_history(
+    def log_ticket_history(
             self,
             ticket_id : UUID,
-            action_type : str,
-            old_value : Optional[str],
-            new_value : Optional[str],
+            changes : list[tuple[str, Optional[str], Optional[str]]],
             changed_by : UUID,
             session : AsyncSession
-    ):
-        history_entry = TicketHistory(
-            ticket_id=ticket_id,
-            action_type=action_type,
-            old_value=old_value,
-            new_value=new_value,
-            changed_by=changed_by,
-            changed_at=datetime.utcnow()
-        )
-        session.add(history_entry)
-        await session.commit()
-        await session.refresh(history_entry)
-        return history_entry
+    ) -> list[TicketHistory]:
+        """Stage one history entry per (action_type, old_value, new_value).
+
+        Nothing is written here: the entries are inserted in one batch when
+        the caller's transaction flushes, together with the ticket change.
+        """
+        changed_at = datetime.utcnow()
+        history_entries = [
+            TicketHistory(
+                ticket_id=ticket_id,
+                action_type=action_type,
+                old_value=old_value,
+                new_value=new_value,
+                changed_by=changed_by,
+                changed_at=changed_at
+            )
+            for action_type, old_value, new_value in changes
+        ]
+        session.add_all(history_entries)
+        return history_entries
         
         # ==================== Main Service Methods ====================
 
     async def create_ticket(
             self,
             ticket_data : TicketCreateRequest,
-            user_id : UUID,
+            auth : AuthContext,
             session : AsyncSession,
     ):
-        # Create ticket instance
+        user_id = auth.user_id
+        # Create ticket instance; the id is set here so history can reference it before the flush
         new_ticket = Ticket(
+            ticket_id=uuid.uuid4(),
             subject=ticket_data.subject,
             description=ticket_data.description,
             priority=ticket_data.priority,
@@ -219,74 +252,157 @@ class TicketService:
             new_ticket.assigned_to = ticket_data.assigned_to
 
         session.add(new_ticket)
-        await session.commit()
-        await session.refresh(new_ticket)
-
         # Log ticket creation in history
-        await self.log_ticket_history(
+        self.log_ticket_history(
             ticket_id=new_ticket.ticket_id,
-            action_type="created",
-            old_value=None,
-            new_value=f"Ticket created with status: {new_ticket.status.value}",
+            changes=[("created", None, f"Ticket created with status: {new_ticket.status.value}")],
             changed_by=user_id,
             session=session
         )
+        await self.counter_service.apply_change(
+            session, [], self.counter_service.ticket_counter_keys(new_ticket)
+        )
+        # Ticket, history entry and counters commit together
+        await session.commit()
+        await invalidate_ticket_analytics()
 
         return new_ticket
     
 
 
 
-    async def get_user_ticket(
+    async def _load_ticket_details(
         self,
         ticket_id: UUID,
-        user_id: UUID,
         session: AsyncSession,
-    ):
+    ) -> Ticket:
         result = await session.execute(
             select(Ticket)
-            .options(
-                selectinload(Ticket.comments),
-                selectinload(Ticket.attachments),
-            )
+            .options(*TICKET_DETAILS.options())
             .where(Ticket.ticket_id == ticket_id)
         )
         ticket = result.scalar_one_or_none()
         if not ticket:
             raise TicketNotFoundError()
+        return ticket
 
-        user = await self.get_user(user_id, session)
-        self.check_ticket_access(ticket, user, user_id)
+    async def get_user_ticket(
+        self,
+        ticket_id: UUID,
+        auth: AuthContext,
+        session: AsyncSession,
+    ) -> TicketDetails:
+        # The cached details are shared by all readers; access is checked per request
+        ticket = await ticket_cache.get_or_compute(
+            ticket_detail_key(ticket_id),
+            lambda: self._load_ticket_details(ticket_id, session),
+            response_type=TicketDetails,
+            tags=(ticket_tag(ticket_id),),
+        )
+
+        self.check_ticket_access(ticket, auth.principal, auth.user_id)
         
         return ticket
     
 
 
+    def _ticket_page_filters(
+            self,
+            cursor: Optional[str],
+            status: Optional[TicketStatus],
+            priority: Optional[TicketPriority],
+            types_of_issue: Optional[IssueType]
+    ) -> list:
+        """Filter and keyset predicates shared by the ticket list endpoints."""
+        filters = []
+        if status:
+            filters.append(Ticket.status == status)
+        if priority:
+            filters.append(Ticket.priority == priority)
+        if types_of_issue:
+            filters.append(Ticket.types_of_issue == types_of_issue)
+
+        if cursor:
+            values = decode_cursor(cursor)
+            try:
+                last_updated_at = datetime.fromisoformat(values["updated_at"])
+                last_ticket_id = UUID(values["ticket_id"])
+            except (KeyError, TypeError, ValueError):
+                raise BadRequestError("Invalid pagination cursor.")
+            filters.append(
+                tuple_(Ticket.updated_at, Ticket.ticket_id) < tuple_(last_updated_at, last_ticket_id)
+            )
+        return filters
+
+    def _newest_first(self, statement, limit: int):
+        return statement.order_by(Ticket.updated_at.desc(), Ticket.ticket_id.desc()).limit(limit + 1)
+
+    def _ticket_page(self, rows: list, limit: int) -> dict:
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = encode_cursor({
+                "updated_at": rows[-1].updated_at.isoformat(),
+                "ticket_id": str(rows[-1].ticket_id),
+            })
+        return {
+            "tickets": [dict(row._mapping) for row in rows],
+            "next_cursor": next_cursor,
+        }
+
     async def get_user_tickets(
             self,
-            user_id : UUID,
-            session : AsyncSession
-    ):
-        user_tickets = select(Ticket).where(
-            (Ticket.created_by == user_id) | (Ticket.assigned_to == user_id)
+            auth : AuthContext,
+            session : AsyncSession,
+            cursor: Optional[str] = None,
+            limit: int = TICKET_PAGE_SIZE,
+            status: Optional[TicketStatus] = None,
+            priority: Optional[TicketPriority] = None,
+            types_of_issue: Optional[IssueType] = None
+    ) -> dict:
+        """Get a page of tickets created by or assigned to the user, most recently updated first."""
+        user_id = auth.user_id
+        filters = self._ticket_page_filters(cursor, status, priority, types_of_issue)
+
+        # One ordered index scan per side of the OR, merged and cut to the page size,
+        # so each page reads about limit rows however deep the cursor is
+        created = self._newest_first(
+            TICKET_SUMMARY.select().where(Ticket.created_by == user_id, *filters), limit
+        )
+        assigned = self._newest_first(
+            TICKET_SUMMARY.select().where(
+                Ticket.assigned_to == user_id, Ticket.created_by != user_id, *filters
+            ),
+            limit,
         )
-        result = await session.execute(user_tickets)
-        tickets = result.scalars().all()
-        if not tickets:
+        user_tickets = union_all(created, assigned).subquery()
+        statement = (
+            select(user_tickets)
+            .order_by(user_tickets.c.updated_at.desc(), user_tickets.c.ticket_id.desc())
+            .limit(limit + 1)
+        )
+        rows = (await session.execute(statement)).all()
+        # A user without tickets is a 404; filters or a cursor that match nothing are an empty page
+        if not rows and not cursor and not (status or priority or types_of_issue):
             raise TicketNotFoundError()
-        return tickets
+        return self._ticket_page(rows, limit)
     
     async def get_unassigned_tickets(
             self,
-            session : AsyncSession
-    ):
-        """Get all tickets that are not assigned to any user."""
-        unassigned_tickets = select(Ticket).where(
-            Ticket.assigned_to.is_(None)
+            session : AsyncSession,
+            cursor: Optional[str] = None,
+            limit: int = TICKET_PAGE_SIZE,
+            status: Optional[TicketStatus] = None,
+            priority: Optional[TicketPriority] = None,
+            types_of_issue: Optional[IssueType] = None
+    ) -> dict:
+        """Get a page of tickets that are not assigned to any user, most recently updated first."""
+        filters = self._ticket_page_filters(cursor, status, priority, types_of_issue)
+        statement = self._newest_first(
+            TICKET_SUMMARY.select().where(Ticket.assigned_to.is_(None), *filters), limit
         )
-        result = await session.execute(unassigned_tickets)
-        tickets = result.scalars().all()
-        return tickets
+        rows = (await session.execute(statement)).all()
+        return self._ticket_page(rows, limit)
     
 
 
@@ -295,11 +411,12 @@ class TicketService:
             self,
             ticket_id : UUID,
             ticket_data : TicketUpdateRequest,
-            user_id : UUID,
+            auth : AuthContext,
             session : AsyncSession
     ) -> Ticket:
-        ticket = await self.get_ticket(ticket_id, session)
-        user = await self.get_user(user_id, session)
+        ticket = await self.get_ticket(ticket_id, session, for_update=True)
+        user = auth.principal
+        user_id = auth.user_id
 
         update_data = ticket_data.model_dump(exclude_unset=True)
         if not update_data:
@@ -317,24 +434,38 @@ class TicketService:
         # for field, value in update_data.items():
         #     setattr(ticket, field, value)
 
+        old_counter_keys = self.counter_service.ticket_counter_keys(ticket)
+        changes = []
         for field, value in update_data.items():
             old_value = str(getattr(ticket, field))
             setattr(ticket, field, value)
             new_value = str(value)
             if old_value != new_value:
-                await self.log_ticket_history(
-                    ticket_id=ticket.ticket_id,
-                    action_type=f"{field}_changed",
-                    old_value=old_value,
-                    new_value=new_value,
-                    changed_by=user_id,
-                    session=session
-                )
+                changes.append((f"{field}_changed", old_value, new_value))
 
         ticket.updated_at = datetime.utcnow()
 
+        # One unit of work: the ticket UPDATE, a batched history INSERT,
+        # one counter upsert and the resolution row, then a single commit
+        history_entries = self.log_ticket_history(
+            ticket_id=ticket.ticket_id,
+            changes=changes,
+            changed_by=user_id,
+            session=session
+        )
+        await self.counter_service.apply_change(
+            session, old_counter_keys, self.counter_service.ticket_counter_keys(ticket)
+        )
+        status_entry = next((entry for entry in history_entries if entry.action_type == "status_changed"), None)
+        if status_entry is not None:
+            # Same timestamp as the history entry, which rebuild() reads
+            await self.resolution_service.record_status_change(
+                session, ticket, ticket.status, status_entry.changed_at
+            )
+
         await session.commit()
-        await session.refresh(ticket)
+        await invalidate_ticket_analytics()
+        await invalidate_ticket_detail(ticket.ticket_id)
         return ticket
     
 
@@ -343,17 +474,47 @@ class TicketService:
     async def delete_ticket(
             self,
             ticket_id : UUID,
-            user_id : UUID,
+            auth : AuthContext,
             session : AsyncSession
     ):
-        ticket = await self.get_ticket(ticket_id,session)
-        user = await self.get_user(user_id, session)
+        ticket = await self.get_ticket(ticket_id, session, for_update=True)
+
+        self.check_delete_permission(ticket, auth.principal, auth.user_id)
 
-        self.check_delete_permission(ticket,user,user_id)
+        blob_digests = (await session.execute(
+            select(Attachment.blob_sha256).where(
+                Attachment.ticket_id == ticket_id,
+                Attachment.blob_sha256.is_not(None),
+            )
+        )).scalars().all()
 
         await session.delete(ticket)
+        await self.counter_service.apply_change(
+            session, self.counter_service.ticket_counter_keys(ticket), []
+        )
+        unreferenced = []
+        if blob_digests:
+            await session.flush()
+            unreferenced = await self.blob_service.release(session, blob_digests)
         await session.commit()
+        await invalidate_ticket_analytics(deleted=True)
+        await invalidate_ticket_detail(ticket_id)
+        if unreferenced:
+            await self.blob_service.delete_unreferenced(session, unreferenced)
+        # Direct uploads, finalized or not, have their own objects under the ticket's prefix
+        await self._delete_ticket_uploads(ticket_id)
         return None
+
+    async def _delete_ticket_uploads(
+            self,
+            ticket_id : UUID
+    ) -> None:
+        try:
+            objects = await storage.list_objects(attachment_key_prefix(ticket_id))
+        except Exception:
+            logger.warning("Could not list uploads of deleted ticket %s", ticket_id, exc_info=True)
+            return
+        await storage.delete_many([key for key, _ in objects])
     
     async def attach_files_to_ticket(
     self,
@@ -363,29 +524,136 @@ class TicketService:
 ):
         attachments_list = []  
 
-        for file in files:
-            file_url = await upload_file_to_s3(file)
+        # Content already stored for another attachment is not uploaded again
+        digests = await self.blob_service.store_many(session, files)
+        for file, digest in zip(files, digests):
             attachment = Attachment(
                 ticket_id=ticket.ticket_id,
                 file_name=file.filename,
-                file_url=file_url,
+                file_url=storage.file_url(blob_key(digest)),
                 file_type=file.content_type,
+                blob_sha256=digest,
             )
             session.add(attachment)
             attachments_list.append(attachment)
 
         await session.commit()
+        await invalidate_ticket_detail(ticket.ticket_id)
         return attachments_list
 
+
+    async def create_attachment_upload_urls(
+            self,
+            ticket_id : UUID,
+            files : list[AttachmentUploadRequest],
+            auth : AuthContext,
+            session : AsyncSession
+    ) -> list[dict]:
+        """Presigned PUT URLs so clients upload straight to S3, not through the API."""
+        ticket = await self.get_ticket(ticket_id, session)
+        self.check_ticket_access(ticket, auth.principal, auth.user_id)
+
+        return [
+            {"file_name": file.file_name, **create_presigned_upload(ticket.ticket_id, file.file_type, file.size)}
+            for file in files
+        ]
+
+
+    async def finalize_attachment_uploads(
+            self,
+            ticket_id : UUID,
+            uploads : list[FinalizedUpload],
+            auth : AuthContext,
+            session : AsyncSession
+    ) -> list[Attachment]:
+        """Verify presigned uploads and record them as attachments.
+
+        Safe to retry: keys already attached to the ticket are returned as they
+        are instead of being added again.
+        """
+        ticket = await self.get_ticket(ticket_id, session)
+        self.check_ticket_access(ticket, auth.principal, auth.user_id)
+
+        prefix = attachment_key_prefix(ticket.ticket_id)
+        keys = [upload.key for upload in uploads]
+        if len(set(keys)) != len(keys):
+            raise BadRequestError("Each upload can only be finalized once per request.")
+        for key in keys:
+            if not key.startswith(prefix) or "/" in key[len(prefix):]:
+                raise BadRequestError("Upload does not belong to this ticket.")
+
+        file_urls = {upload.key: storage.file_url(upload.key) for upload in uploads}
+        existing = {
+            attachment.file_url: attachment
+            for attachment in (await session.execute(
+                select(Attachment).where(
+                    Attachment.ticket_id == ticket.ticket_id,
+                    Attachment.file_url.in_(file_urls.values()),
+                )
+            )).scalars()
+        }
+
+        pending = [upload for upload in uploads if file_urls[upload.key] not in existing]
+        objects = await verify_presigned_uploads([upload.key for upload in pending])
+        new_attachments = [
+            Attachment(
+                ticket_id=ticket.ticket_id,
+                file_name=upload.file_name,
+                file_url=file_urls[upload.key],
+                file_type=uploaded["content_type"],
+            )
+            for upload, uploaded in zip(pending, objects)
+        ]
+        if new_attachments:
+            session.add_all(new_attachments)
+            await session.commit()
+            await invalidate_ticket_detail(ticket.ticket_id)
+            existing.update((attachment.file_url, attachment) for attachment in new_attachments)
+
+        return [existing[file_urls[upload.key]] for upload in uploads]
+
+
+    async def delete_unfinalized_uploads(
+            self,
+            session : AsyncSession
+    ) -> int:
+        """Delete direct uploads that no attachment references and that can no longer be finalized.
+
+        An upload counts as abandoned once its presigned URL has been expired
+        for UNFINALIZED_UPLOAD_GRACE. Returns how many objects were deleted.
+        """
+        cutoff = (
+            datetime.now(timezone.utc)
+            - timedelta(seconds=Config.S3_PRESIGNED_URL_EXPIRES_SECONDS)
+            - UNFINALIZED_UPLOAD_GRACE
+        )
+        candidates = {
+            storage.file_url(key): key
+            for key, last_modified in await storage.list_objects(TICKET_KEYS_PREFIX)
+            if last_modified < cutoff
+        }
+        file_urls = list(candidates)
+        referenced = set()
+        for start in range(0, len(file_urls), 1000):
+            referenced.update((await session.execute(
+                select(Attachment.file_url).where(Attachment.file_url.in_(file_urls[start:start + 1000]))
+            )).scalars())
+
+        abandoned = [key for file_url, key in candidates.items() if file_url not in referenced]
+        await storage.delete_many(abandoned)
+        if abandoned:
+            logger.info("Deleted %d unfinalized uploads", len(abandoned))
+        return len(abandoned)
+
     
     async def create_ticket_with_attachments(
             self,
             ticket_data : TicketCreateRequest,
-            user_id : UUID,
+            auth : AuthContext,
             files : Optional[list[UploadFile]],
             session : AsyncSession,
     ):
-        ticket = await self.create_ticket(ticket_data, user_id, session)
+        ticket = await self.create_ticket(ticket_data, auth, session)
         if files:
             await self.attach_files_to_ticket(ticket, files, session)
 
@@ -395,6 +663,7 @@ class TicketService:
                 selectinload(Ticket.attachments),
             )
             .where(Ticket.ticket_id == ticket.ticket_id)
+            .execution_options(populate_existing=True)
         )
 
         ticket = result.scalar_one()
@@ -404,42 +673,78 @@ class TicketService:
             self,
             ticket_id : UUID,
             ticket_data : TicketUpdateRequest,
-            user_id : UUID,
+            auth : AuthContext,
             files : Optional[list[UploadFile]],
             session : AsyncSession
     ) -> Ticket:
-        ticket = await self.update_ticket(ticket_id, ticket_data, user_id, session)
+        ticket = await self.update_ticket(ticket_id, ticket_data, auth, session)
         if files:
             await self.attach_files_to_ticket(ticket, files, session)
 
-        # Reload ticket with attachments
+        # Reload ticket with attachments and the values as stored
         result = await session.execute(
             select(Ticket)
             .options(selectinload(Ticket.attachments))
             .where(Ticket.ticket_id == ticket.ticket_id)
+            .execution_options(populate_existing=True)
         )
 
         ticket = result.scalar_one()
         return ticket
     
 
+    async def get_attachment_download(
+            self,
+            attachment_id : UUID,
+            auth : AuthContext,
+            session : AsyncSession
+    ) -> tuple[Attachment, str, Optional[str]]:
+        """The attachment, its storage key and, for content-addressed files, its ETag."""
+        attachment = await self.get_attachment(attachment_id, session)
+        ticket = await self.get_ticket(attachment.ticket_id, session)
+        self.check_ticket_access(ticket, auth.principal, auth.user_id)
+
+        if attachment.blob_sha256:
+            return attachment, blob_key(attachment.blob_sha256), f'"{attachment.blob_sha256}"'
+        key = storage.key_from_url(attachment.file_url)
+        if key is None:
+            # Stored somewhere other than the configured backend
+            raise AttachmentNotFoundError()
+        return attachment, key, None
+
+
     async def delete_attachment(
             self,
             attachment_id : UUID,
-            user_id : UUID,
+            auth : AuthContext,
             session : AsyncSession
     ):
         attachment = await self.get_attachment(attachment_id, session)
         ticket = await self.get_ticket(attachment.ticket_id, session)
-        user = await self.get_user(user_id, session)
 
-        is_creator = str(ticket.created_by) == str(user_id)
-        user_is_admin = user.role.value.lower() == "admin"
+        is_creator = str(ticket.created_by) == str(auth.user_id)
+        user_is_admin = auth.principal.role.value.lower() == "admin"
         if not (is_creator or user_is_admin):
             raise UnauthorizedError()
         
         await session.delete(attachment)
+        unreferenced = []
+        own_key = None
+        if attachment.blob_sha256:
+            # Storage is removed only with the blob's last reference, after commit
+            await session.flush()
+            unreferenced = await self.blob_service.release(session, [attachment.blob_sha256])
+        else:
+            # A direct upload's object belongs to this attachment alone
+            key = storage.key_from_url(attachment.file_url)
+            if key is not None and key.startswith(attachment_key_prefix(ticket.ticket_id)):
+                own_key = key
         await session.commit()
+        await invalidate_ticket_detail(ticket.ticket_id)
+        if unreferenced:
+            await self.blob_service.delete_unreferenced(session, unreferenced)
+        if own_key is not None:
+            await storage.delete_many([own_key])
     
     # async def get_ticket_history(
     #         self,
@@ -461,27 +766,30 @@ class TicketService:
     async def get_ticket_history(
         self,
         ticket_id: UUID,
-        user_id: UUID,
+        auth: AuthContext,
         session: AsyncSession,
         status: Optional[TicketStatus] = None,
         priority: Optional[TicketPriority] = None,
         changed_by: Optional[UUID] = None,
-        page: int = 1,
+        cursor: Optional[str] = None,
+        limit: int = HISTORY_PAGE_SIZE,
+        total: HistoryTotal = HistoryTotal.CACHED,
 ):
-        user = await self.get_user(user_id, session)
-
-        page = max(page, 1)
-        offset = (page - 1) * HISTORY_PAGE_SIZE
+        """Get a page of a ticket's history, newest first."""
+        user = auth.principal
+        user_id = auth.user_id
 
         base_query = (
-            select(TicketHistory)
+            TICKET_HISTORY_ENTRY.select()
             .join(Ticket, Ticket.ticket_id == TicketHistory.ticket_id)
         )
 
         filters = []
 
-        if not is_privileged(user):
-            filters.append(Ticket.created_by == user_id)
+        # Only restricted callers are limited to their own tickets
+        owner_id = None if is_privileged(user) else user_id
+        if owner_id:
+            filters.append(Ticket.created_by == owner_id)
 
         if ticket_id:
             filters.append(TicketHistory.ticket_id == ticket_id)
@@ -496,25 +804,62 @@ class TicketService:
         if filters:
             base_query = base_query.where(*filters)
 
-        # Get paginated results
+        # Seek past the last entry of the previous page instead of OFFSET,
+        # so every page is one short scan of ix_ticket_history_ticket_id_changed_at
+        history_query = base_query
+        if cursor:
+            values = decode_cursor(cursor)
+            try:
+                last_changed_at = datetime.fromisoformat(values["changed_at"])
+                last_history_id = UUID(values["history_id"])
+            except (KeyError, TypeError, ValueError):
+                raise BadRequestError("Invalid pagination cursor.")
+            history_query = history_query.where(
+                tuple_(TicketHistory.changed_at, TicketHistory.history_id)
+                < tuple_(last_changed_at, last_history_id)
+            )
+
         history_query = (
-            base_query
-            .order_by(TicketHistory.changed_at.desc())
-            .offset(offset)
-            .limit(HISTORY_PAGE_SIZE)
+            history_query
+            .order_by(TicketHistory.changed_at.desc(), TicketHistory.history_id.desc())
+            .limit(limit + 1)
         )
-
-        # Build a separate query to count total matching records
-        # This is needed for pagination metadata (total pages, etc.)
-        # We use the same base_query (with filters) to ensure accurate count
-        count_query = select(func.count()).select_from(base_query.subquery())
-
-        histories = (await session.execute(history_query)).scalars().all()  # Execute the history query and fetch all matching TicketHistory records
-        total_count = (await session.execute(count_query)).scalar_one() # Execute the count query to get the total number of matching records
+        histories = (await session.execute(history_query)).all()
+
+        next_cursor = None
+        if len(histories) > limit:
+            histories = histories[:limit]
+            next_cursor = encode_cursor({
+                "changed_at": histories[-1].changed_at.isoformat(),
+                "history_id": str(histories[-1].history_id),
+            })
+
+        async def count_history() -> int:
+            count_query = select(func.count()).select_from(base_query.subquery())
+            return (await session.execute(count_query)).scalar_one()
+
+        total_count = None
+        if total == HistoryTotal.EXACT:
+            total_count = await count_history()
+        elif total == HistoryTotal.CACHED:
+            # History only changes together with the ticket, which invalidates its tag
+            total_count = await ticket_cache.get_or_compute(
+                make_cache_key(
+                    "ticket-history-total",
+                    ticket_id=ticket_id,
+                    owner_id=owner_id,
+                    status=status,
+                    priority=priority,
+                    changed_by=changed_by,
+                ),
+                on_primary(count_history),
+                response_type=int,
+                tags=(ticket_tag(ticket_id),),
+            )
 
         return {
             "histories": histories,
+            "next_cursor": next_cursor,
             "total": total_count,
-            "page": page,
-            "page_size": HISTORY_PAGE_SIZE
+            "page_size": limit
         }
@@ -0,0 +1,47 @@
+from uuid import UUID
+from src.config import Config
+from src.cache import create_cache
+from src.utils.cache import make_cache_key
+
+
+# Any user create/role/status change can reorder or refilter the listings
+USER_LIST_TAG = "user-list"
+
+user_cache = create_cache("users", ttl_seconds=Config.USER_CACHE_TTL_SECONDS)
+# Kept short: a role or status change elsewhere is picked up within this window
+# even if an invalidation message is lost
+principal_cache = create_cache(
+    "principals",
+    ttl_seconds=Config.PRINCIPAL_CACHE_TTL_SECONDS,
+    max_local_entries=Config.PRINCIPAL_CACHE_MAX_ENTRIES,
+)
+
+
+def principal_tag(user_id: UUID) -> str:
+    return f"user:{user_id}"
+
+
+def principal_key(user_id: UUID) -> tuple:
+    return ("principal", str(user_id))
+
+
+async def invalidate_user_lookups() -> None:
+    """Call after a committed user create or role/status change."""
+    await user_cache.invalidate(USER_LIST_TAG)
+
+
+async def invalidate_principal(user_id: UUID) -> None:
+    """Call after a committed change to a user's role or active status."""
+    await principal_cache.invalidate(principal_tag(user_id))
+
+
+__all__ = [
+    "user_cache",
+    "make_cache_key",
+    "principal_cache",
+    "principal_tag",
+    "principal_key",
+    "invalidate_user_lookups",
+    "invalidate_principal",
+    "USER_LIST_TAG",
+]
@@ -2,6 +2,7 @@ from fastapi import APIRouter, Depends, status, Query
 from .service import UserManagementService
 from src.auth.dependencies import role_checker, AccessTokenBearer
 from .schemas import UserRole, UserRoleUpdateRequest, UserStatusUpdateRequest, UserListResponse, UserResponse
+from .cache import user_cache, make_cache_key, USER_LIST_TAG
 
 from src.db.main import get_session
 
@@ -40,11 +41,16 @@ async def list_all_users(
     is_active : bool | None = None,
     session = Depends(get_session)
 ):
-    return await user_management_service.list_all_users(
-        session=session,
-        page=page,
-        page_size=page_size,
-        is_active=is_active
+    return await user_cache.get_or_compute(
+        make_cache_key("all-users", page=page, page_size=page_size, is_active=is_active),
+        lambda: user_management_service.list_all_users(
+            session=session,
+            page=page,
+            page_size=page_size,
+            is_active=is_active
+        ),
+        response_type=UserListResponse,
+        tags=(USER_LIST_TAG,),
     )
 
 @user_management_router.get(
@@ -59,12 +65,17 @@ async def list_users_by_role(
     page_size : int = Query(10, ge=1, le=100),
     session = Depends(get_session)
 ):
-    return await user_management_service.list_all_users(
-        session=session,
-        page=page,
-        page_size=page_size,
-        role=role
-)
+    return await user_cache.get_or_compute(
+        make_cache_key("users-by-role", role=role, page=page, page_size=page_size),
+        lambda: user_management_service.list_all_users(
+            session=session,
+            page=page,
+            page_size=page_size,
+            role=role
+        ),
+        response_type=UserListResponse,
+        tags=(USER_LIST_TAG,),
+    )
 
 @user_management_router.patch(
     "/status/{user_id}",
@@ -3,6 +3,14 @@ from sqlmodel.ext.asyncio.session import AsyncSession
 from src.db.models.user import User, UserRole
 from sqlmodel import select, func
 from fastapi import HTTPException
+from src.analytics.cache import invalidate_user_analytics
+from src.db.projection import Projection
+from .cache import invalidate_user_lookups, invalidate_principal
+from .schemas import UserResponse
+
+
+# User lists never need password_hash
+USER_RESPONSE = Projection(User, UserResponse)
 
 
 class UserManagementService:
@@ -38,6 +46,9 @@ class UserManagementService:
         user.role = new_role
         await session.commit()
         await session.refresh(user)
+        await invalidate_user_analytics()
+        await invalidate_user_lookups()
+        await invalidate_principal(user.user_id)
         return user
     
     async def list_all_users(
@@ -48,7 +59,7 @@ class UserManagementService:
             role : UserRole | None = None,
             is_active : bool | None = None,
     ) -> dict:
-        statement = select(User)
+        statement = USER_RESPONSE.select()
         count_statement = select(func.count()).select_from(User)
 
         # If role is provided, only select users with that role.
@@ -66,7 +77,7 @@ class UserManagementService:
         offset = (page - 1) * page_size
         query = statement.offset(offset).limit(page_size).order_by(User.created_at.desc())
 
-        users = (await session.execute(query)).scalars().all()
+        users = (await session.execute(query)).all()
 
         return {
             "users": users,
@@ -91,6 +102,9 @@ class UserManagementService:
         user.is_active = is_active
         await session.commit()
         await session.refresh(user)
+        await invalidate_user_analytics()
+        await invalidate_user_lookups()
+        await invalidate_principal(user.user_id)
         return user
 
     async def get_all_admins(
@@ -0,0 +1,152 @@
+import asyncio
+import time
+from collections import OrderedDict
+from datetime import datetime
+from enum import Enum
+from typing import Any, Awaitable, Callable, Iterable, Optional
+from uuid import UUID
+
+
+def _normalize(value: Any) -> Any:
+    """Turn a query parameter into a hashable, order-independent value."""
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return tuple(sorted(str(_normalize(item)) for item in value))
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, UUID):
+        return str(value)
+    return value
+
+
+def make_cache_key(endpoint: str, **params) -> tuple:
+    """Cache key from an endpoint name and its query params (None params are dropped)."""
+    return (endpoint, tuple(sorted(
+        (name, _normalize(value)) for name, value in params.items() if value is not None
+    )))
+
+
+class _Entry:
+    __slots__ = ("value", "expires_at", "tags")
+
+    def __init__(self, value: Any, expires_at: float, tags: frozenset):
+        self.value = value
+        self.expires_at = expires_at
+        self.tags = tags
+
+
+class TTLCache:
+    """Process-local TTL + LRU cache with tag invalidation and request coalescing.
+
+    Concurrent misses for the same key share one computation. Invalidating a
+    tag drops matching entries and stops in-flight computations that started
+    before the invalidation from being stored.
+    """
+
+    def __init__(self, ttl_seconds: float, max_entries: int):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Any, _Entry]" = OrderedDict()
+        self._inflight: dict[Any, asyncio.Future] = {}
+        self._generation = 0
+
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def get(self, key: Any) -> Optional[_Entry]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry.expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return entry
+
+    def set(self, key: Any, value: Any, tags: Iterable[str] = ()) -> None:
+        self._entries[key] = _Entry(value, time.monotonic() + self.ttl_seconds, frozenset(tags))
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def invalidate(self, *tags: str) -> None:
+        """Drop entries carrying any of the given tags."""
+        tags = set(tags)
+        self._generation += 1
+        self.invalidations += 1
+        for key in [key for key, entry in self._entries.items() if entry.tags & tags]:
+            del self._entries[key]
+        # New requests must not join computations that may have read stale data
+        self._inflight.clear()
+
+    def clear(self) -> None:
+        self._generation += 1
+        self._entries.clear()
+        self._inflight.clear()
+
+    async def get_or_compute(
+            self,
+            key: Any,
+            compute: Callable[[], Awaitable[Any]],
+            tags: Iterable[str] = ()
+    ) -> Any:
+        while True:
+            entry = self.get(key)
+            if entry is not None:
+                self.hits += 1
+                return entry.value
+
+            inflight = self._inflight.get(key)
+            if inflight is None:
+                break
+
+            self.coalesced += 1
+            try:
+                return await asyncio.shield(inflight)
+            except asyncio.CancelledError:
+                # Re-raise our own cancellation; if the leader was cancelled, retry
+                if not inflight.cancelled():
+                    raise
+
+        self.misses += 1
+        future = asyncio.get_running_loop().create_future()
+        # Mark exceptions as retrieved when nobody is waiting on them
+        future.add_done_callback(lambda done: done.cancelled() or done.exception())
+        self._inflight[key] = future
+        generation = self._generation
+
+        try:
+            value = await compute()
+        except Exception as exc:
+            future.set_exception(exc)
+            raise
+        except BaseException:
+            future.cancel()
+            raise
+        finally:
+            if self._inflight.get(key) is future:
+                del self._inflight[key]
+
+        if generation == self._generation:
+            self.set(key, value, tags)
+        future.set_result(value)
+        return value
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses + self.coalesced
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "ttl_seconds": self.ttl_seconds,
+            "hits": self.hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+            "hit_ratio": round((self.hits + self.coalesced) / lookups, 4) if lookups else 0.0,
+        }
@@ -0,0 +1,22 @@
+import base64
+import json
+
+from src.errors import BadRequestError
+
+
+def encode_cursor(values: dict) -> str:
+    """Encode keyset values into an opaque, URL-safe cursor token."""
+    raw = json.dumps(values, default=str).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii")
+
+
+def decode_cursor(cursor: str) -> dict:
+    """Decode a cursor token produced by encode_cursor."""
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+    except ValueError:
+        raise BadRequestError("Invalid pagination cursor.")
+
+    if not isinstance(values, dict):
+        raise BadRequestError("Invalid pagination cursor.")
+    return values
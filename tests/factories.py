@@ -0,0 +1,35 @@
+from src.auth.schemas import AuthContext, Principal
+from src.db.models.user import User, UserRole
+from src.db.models.ticket import Ticket, TicketStatus, TicketPriority, IssueType
+
+
+async def create_user(session, name: str, role: UserRole = UserRole.USER) -> User:
+    user = User(
+        username=name,
+        email=f"{name}@example.com",
+        full_name=name.title(),
+        password_hash="not-a-real-hash",
+        role=role,
+    )
+    session.add(user)
+    await session.commit()
+    return user
+
+
+def make_ticket(created_by, status: TicketStatus = TicketStatus.OPEN, **fields) -> Ticket:
+    return Ticket(
+        subject=fields.pop("subject", "Printer jam"),
+        description=fields.pop("description", "The printer on floor two is jammed."),
+        priority=fields.pop("priority", TicketPriority.LOW),
+        types_of_issue=fields.pop("types_of_issue", IssueType.HARDWARE),
+        status=status,
+        created_by=created_by,
+        **fields,
+    )
+
+
+def auth_context(user: User) -> AuthContext:
+    return AuthContext(
+        token_data={"user": {"user_id": str(user.user_id)}},
+        principal=Principal.model_validate(user),
+    )
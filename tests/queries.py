@@ -0,0 +1,49 @@
+from contextlib import contextmanager
+from typing import Any, Iterator
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+
+@contextmanager
+def recorded_statements(engine: AsyncEngine) -> Iterator[list[str]]:
+    """Collect the SQL sent through engine inside the block."""
+    statements: list[str] = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine.sync_engine, "before_cursor_execute", record)
+    try:
+        yield statements
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", record)
+
+
+@contextmanager
+def recorded_queries(engine: AsyncEngine) -> Iterator[list[tuple[str, Any]]]:
+    """Collect the SQL sent through engine inside the block with its driver parameters."""
+    queries: list[tuple[str, Any]] = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        queries.append((statement, parameters))
+
+    event.listen(engine.sync_engine, "before_cursor_execute", record)
+    try:
+        yield queries
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", record)
+
+
+@contextmanager
+def recorded_commits(engine: AsyncEngine) -> Iterator[list[None]]:
+    """Collect one item per transaction committed through engine inside the block."""
+    commits: list[None] = []
+
+    def record(conn):
+        commits.append(None)
+
+    event.listen(engine.sync_engine, "commit", record)
+    try:
+        yield commits
+    finally:
+        event.remove(engine.sync_engine, "commit", record)
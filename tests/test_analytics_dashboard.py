@@ -0,0 +1,32 @@
+import pytest
+from sqlalchemy import event
+from src.analytics.service import AnalyticsService
+from src.db.session import engine
+
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_dashboard_sections_share_a_bounded_number_of_connections(db, monkeypatch):
+    monkeypatch.setattr("src.analytics.service.DASHBOARD_MAX_CONNECTIONS", 2)
+    checked_out = []
+    peak = 0
+
+    def checkout(dbapi_connection, record, proxy):
+        nonlocal peak
+        checked_out.append(record)
+        peak = max(peak, len(checked_out))
+
+    def checkin(dbapi_connection, record):
+        checked_out.remove(record)
+
+    event.listen(engine.sync_engine, "checkout", checkout)
+    event.listen(engine.sync_engine, "checkin", checkin)
+    try:
+        dashboard = await AnalyticsService().get_analytics_dashboard()
+    finally:
+        event.remove(engine.sync_engine, "checkout", checkout)
+        event.remove(engine.sync_engine, "checkin", checkin)
+
+    assert peak == 2
+    assert len(dashboard.section_timings_ms) == 5
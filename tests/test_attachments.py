@@ -0,0 +1,234 @@
+import asyncio
+import io
+import os
+import time
+import httpx
+import pytest
+from urllib.parse import urlparse
+from fastapi import HTTPException, UploadFile
+from sqlmodel import select, func
+from starlette.datastructures import Headers
+from src.auth.utils import create_access_token
+from src.db.models.attachment import Attachment
+from src.db.models.attachment_blob import AttachmentBlob
+from src.db.session import async_session_maker
+from src.main import _app
+from src.storage import storage, blob_key, attachment_key_prefix
+from src.storage.base import upload_failed
+from src.ticket.schemas import AttachmentResponse
+from src.ticket.blobs import attachment_blob_service
+from src.ticket.service import TicketService
+from tests.factories import auth_context, create_user, make_ticket
+
+
+pytestmark = pytest.mark.anyio
+
+
+def pdf(name: str, content: bytes) -> UploadFile:
+    return UploadFile(
+        file=io.BytesIO(content),
+        filename=name,
+        size=len(content),
+        headers=Headers({"content-type": "application/pdf"}),
+    )
+
+
+def stored_files() -> list[str]:
+    return [name for _, _, names in os.walk(storage.root) for name in names]
+
+
+async def test_failed_upload_removes_the_stored_files(session, monkeypatch):
+    user = await create_user(session, "reporter")
+    ticket = make_ticket(user.user_id)
+    session.add(ticket)
+    await session.commit()
+
+    put = storage._put
+    in_flight = 0
+    max_in_flight = 0
+
+    async def slow_put(file, key):
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        try:
+            await asyncio.sleep(0.05)
+            if file.filename == "broken.pdf":
+                # Fail after the other uploads have been stored
+                await asyncio.sleep(0.05)
+                raise upload_failed(OSError("disk full"))
+            return await put(file, key)
+        finally:
+            in_flight -= 1
+
+    monkeypatch.setattr(storage, "_put", slow_put)
+    files = [pdf(f"file-{index}.pdf", f"content {index}".encode()) for index in range(3)]
+    files.append(pdf("broken.pdf", b"broken content"))
+
+    before = stored_files()
+    with pytest.raises(HTTPException) as error:
+        await TicketService().attach_files_to_ticket(ticket, files, session)
+    await session.rollback()
+
+    assert error.value.status_code == 500
+    assert max_in_flight == len(files)
+    assert stored_files() == before
+    async with async_session_maker() as check_session:
+        attachments = (await check_session.execute(select(func.count()).select_from(Attachment))).scalar_one()
+        blobs = (await check_session.execute(select(func.count()).select_from(AttachmentBlob))).scalar_one()
+    assert (attachments, blobs) == (0, 0)
+
+
+async def test_stored_files_are_not_served_without_authorization():
+    url = await storage.upload(pdf("private.pdf", b"private content"))
+
+    transport = httpx.ASGITransport(app=_app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        response = await client.get(urlparse(url).path)
+    assert response.status_code == 404
+    await storage.delete(storage.key_from_url(url))
+
+
+async def test_attachment_url_goes_through_the_download_endpoint(session):
+    user = await create_user(session, "reporter")
+    ticket = make_ticket(user.user_id)
+    session.add(ticket)
+    await session.commit()
+    [attachment] = await TicketService().attach_files_to_ticket(ticket, [pdf("report.pdf", b"report")], session)
+    await session.commit()
+    token = create_access_token(user_data={"email": user.email, "user_id": str(user.user_id)})
+
+    response = AttachmentResponse.model_validate(attachment, from_attributes=True)
+    assert response.file_url == f"/api/v1/ticket/attachment/{attachment.attachment_id}/download"
+
+    transport = httpx.ASGITransport(app=_app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        assert (await client.get(response.file_url)).status_code in (401, 403)
+        download = await client.get(response.file_url, headers={"Authorization": f"Bearer {token}"})
+    assert download.status_code == 200
+    assert download.content == b"report"
+
+
+async def attached_ticket(session, content: bytes):
+    user = await create_user(session, "reporter")
+    ticket = make_ticket(user.user_id)
+    session.add(ticket)
+    await session.commit()
+    [attachment] = await TicketService().attach_files_to_ticket(ticket, [pdf("report.pdf", content)], session)
+    await session.commit()
+    return user, attachment
+
+
+async def blob_ref_count(sha256: str):
+    async with async_session_maker() as check_session:
+        blob = await check_session.get(AttachmentBlob, sha256)
+    return None if blob is None else blob.ref_count
+
+
+async def test_failed_delete_commit_keeps_the_blob(session, monkeypatch):
+    user, attachment = await attached_ticket(session, b"kept content")
+    sha256, attachment_id = attachment.blob_sha256, attachment.attachment_id
+
+    async def failing_commit():
+        await session.rollback()
+        raise OSError("connection lost")
+
+    monkeypatch.setattr(session, "commit", failing_commit)
+    with pytest.raises(OSError):
+        await TicketService().delete_attachment(attachment_id, auth_context(user), session)
+
+    assert await storage.head(blob_key(sha256)) is not None
+    assert await blob_ref_count(sha256) == 1
+
+
+async def test_deleted_attachment_removes_the_blob_after_commit(session):
+    user, attachment = await attached_ticket(session, b"removed content")
+    sha256 = attachment.blob_sha256
+
+    await TicketService().delete_attachment(attachment.attachment_id, auth_context(user), session)
+
+    assert await storage.head(blob_key(sha256)) is None
+    assert await blob_ref_count(sha256) is None
+
+
+async def test_sweep_skips_a_blob_referenced_again(session):
+    user, attachment = await attached_ticket(session, b"shared content")
+    sha256 = attachment.blob_sha256
+
+    await session.delete(attachment)
+    await session.flush()
+    unreferenced = await attachment_blob_service.release(session, [sha256])
+    await session.commit()
+    assert unreferenced == [sha256]
+    assert await blob_ref_count(sha256) == 0
+
+    # The same content is attached again before the sweep runs
+    ticket = make_ticket(user.user_id)
+    session.add(ticket)
+    await session.commit()
+    await TicketService().attach_files_to_ticket(ticket, [pdf("again.pdf", b"shared content")], session)
+    await session.commit()
+
+    assert await attachment_blob_service.delete_unreferenced(session, unreferenced) == 0
+    assert await storage.head(blob_key(sha256)) is not None
+    assert await blob_ref_count(sha256) == 1
+
+
+async def direct_upload(session, ticket, name: str, finalize: bool = True) -> str:
+    """Store an object the way a presigned upload does, optionally recording its attachment."""
+    key = f"{attachment_key_prefix(ticket.ticket_id)}{name}"
+    file_url = await storage.upload(pdf(name, name.encode()), key)
+    if finalize:
+        session.add(Attachment(ticket_id=ticket.ticket_id, file_name=name, file_url=file_url, file_type="application/pdf"))
+        await session.commit()
+    return key
+
+
+def age(key: str, seconds: float) -> None:
+    past = time.time() - seconds
+    os.utime(storage.root / key, (past, past))
+
+
+async def test_deleting_a_direct_upload_removes_its_object(session):
+    user = await create_user(session, "reporter")
+    ticket = make_ticket(user.user_id)
+    session.add(ticket)
+    await session.commit()
+    key = await direct_upload(session, ticket, "direct.pdf")
+    attachment_id = (await session.execute(select(Attachment.attachment_id))).scalar_one()
+
+    await TicketService().delete_attachment(attachment_id, auth_context(user), session)
+
+    assert await storage.head(key) is None
+
+
+async def test_deleting_a_ticket_removes_its_direct_uploads(session):
+    user = await create_user(session, "reporter")
+    ticket = make_ticket(user.user_id)
+    session.add(ticket)
+    await session.commit()
+    finalized = await direct_upload(session, ticket, "finalized.pdf")
+    unfinalized = await direct_upload(session, ticket, "unfinalized.pdf", finalize=False)
+
+    await TicketService().delete_ticket(ticket.ticket_id, auth_context(user), session)
+
+    assert await storage.head(finalized) is None
+    assert await storage.head(unfinalized) is None
+
+
+async def test_sweep_deletes_only_abandoned_uploads(session):
+    user = await create_user(session, "reporter")
+    ticket = make_ticket(user.user_id)
+    session.add(ticket)
+    await session.commit()
+    finalized = await direct_upload(session, ticket, "finalized.pdf")
+    abandoned = await direct_upload(session, ticket, "abandoned.pdf", finalize=False)
+    in_progress = await direct_upload(session, ticket, "in-progress.pdf", finalize=False)
+    for key in (finalized, abandoned):
+        age(key, 2 * 24 * 3600)
+
+    assert await TicketService().delete_unfinalized_uploads(session) == 1
+
+    assert await storage.head(abandoned) is None
+    assert await storage.head(finalized) is not None
+    assert await storage.head(in_progress) is not None
@@ -0,0 +1,87 @@
+import asyncio
+import threading
+import time
+import httpx
+import pytest
+from src.auth.hashing import PasswordHasherPool
+from src.auth.utils import create_access_token
+from src.db.models.user import UserRole
+from src.db.session import engine
+from src.errors import ServiceUnavailableError
+from src.main import _app
+from src.user.cache import invalidate_principal
+from tests.factories import create_user, make_ticket
+from tests.queries import recorded_statements
+
+
+pytestmark = pytest.mark.anyio
+
+
+def principal_lookups(statements: list[str]) -> int:
+    return sum("FROM users" in statement for statement in statements)
+
+
+async def test_principal_is_resolved_once_per_request(session):
+    user = await create_user(session, "reporter", UserRole.USER)
+    session.add(make_ticket(user.user_id))
+    await session.commit()
+    token = create_access_token(user_data={"email": user.email, "user_id": str(user.user_id)})
+    await invalidate_principal(user.user_id)
+
+    transport = httpx.ASGITransport(app=_app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        with recorded_statements(engine) as statements:
+            # role_checker and the route both depend on the auth context
+            response = await client.get(
+                "/api/v1/ticket/my-tickets", headers={"Authorization": f"Bearer {token}"}
+            )
+        assert response.status_code == 200
+        assert principal_lookups(statements) == 1
+
+        with recorded_statements(engine) as statements:
+            response = await client.get(
+                "/api/v1/ticket/my-tickets", headers={"Authorization": f"Bearer {token}"}
+            )
+        assert response.status_code == 200
+        assert principal_lookups(statements) == 0
+
+
+async def test_db_pool_stats_are_admin_only(session):
+    user = await create_user(session, "reporter", UserRole.USER)
+    admin = await create_user(session, "admin", UserRole.ADMIN)
+
+    transport = httpx.ASGITransport(app=_app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        async def get_pool_stats(as_user=None):
+            headers = {}
+            if as_user is not None:
+                token = create_access_token(user_data={"email": as_user.email, "user_id": str(as_user.user_id)})
+                headers["Authorization"] = f"Bearer {token}"
+            return await client.get("/api/v1/health/db-pool", headers=headers)
+
+        assert (await get_pool_stats()).status_code in (401, 403)
+        assert (await get_pool_stats(user)).status_code == 403
+        response = await get_pool_stats(admin)
+    assert response.status_code == 200
+    assert "primary" in response.json()
+
+
+async def test_cancelled_hash_keeps_its_slot_until_the_thread_finishes():
+    pool = PasswordHasherPool(max_workers=1, max_queue=0)
+    release = threading.Event()
+    try:
+        hashing = asyncio.create_task(pool._run(release.wait))
+        await asyncio.sleep(0.01)
+
+        # The client disconnects; the argon2 thread keeps running
+        hashing.cancel()
+        await asyncio.gather(hashing, return_exceptions=True)
+        with pytest.raises(ServiceUnavailableError):
+            await asyncio.wait_for(pool._run(time.sleep, 0), timeout=1)
+    finally:
+        release.set()
+
+    await asyncio.sleep(0.05)
+    await pool._run(time.sleep, 0)
+    assert pool.stats()["rejected"] == 1
+    pool.shutdown()
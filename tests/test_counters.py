@@ -0,0 +1,135 @@
+import asyncio
+import pytest
+from src.analytics.counters import TicketCounterService, status_counter_key
+from src.db.models.ticket import TicketStatus, IssueType
+from src.db.models.ticket_counter import TicketCounter
+from src.db.models.user import UserRole
+from src.db.session import async_session_maker, engine
+from src.errors import TicketNotFoundError
+from src.ticket.schemas import TicketCreateRequest, TicketUpdateRequest
+from src.ticket.service import TicketService
+from tests.factories import auth_context, create_user, make_ticket
+from tests.queries import recorded_statements
+
+
+pytestmark = pytest.mark.anyio
+
+OPEN = status_counter_key(TicketStatus.OPEN)
+IN_PROGRESS = status_counter_key(TicketStatus.IN_PROGRESS)
+
+
+async def move(old_keys: list[str], new_keys: list[str]) -> None:
+    async with async_session_maker() as session:
+        await TicketCounterService().apply_change(session, old_keys, new_keys)
+        # Hold the row locks for a moment so the opposite transition has to wait
+        await asyncio.sleep(0.01)
+        await session.commit()
+
+
+async def test_opposite_transitions_keep_counts(db):
+    async with async_session_maker() as session:
+        session.add_all([
+            TicketCounter(counter_key=OPEN, count=20),
+            TicketCounter(counter_key=IN_PROGRESS, count=20),
+        ])
+        await session.commit()
+
+    transitions = []
+    for _ in range(10):
+        transitions.append(move([OPEN], [IN_PROGRESS]))
+        transitions.append(move([IN_PROGRESS], [OPEN]))
+    await asyncio.gather(*transitions)
+
+    async with async_session_maker() as session:
+        counts = await TicketCounterService().get_counts(session, [OPEN, IN_PROGRESS])
+    assert counts == {OPEN: 20, IN_PROGRESS: 20}
+
+
+async def test_concurrent_reconciles_do_not_collide(session):
+    user = await create_user(session, "reporter")
+    for status in (TicketStatus.OPEN, TicketStatus.OPEN, TicketStatus.IN_PROGRESS):
+        session.add(make_ticket(user.user_id, status))
+    await session.commit()
+
+    async def reconcile():
+        async with async_session_maker() as reconcile_session:
+            return await TicketCounterService().reconcile(reconcile_session)
+
+    # Several workers starting at once each rebuild the counters
+    results = await asyncio.gather(*(reconcile() for _ in range(4)))
+
+    assert all(counts == results[0] for counts in results)
+    async with async_session_maker() as check_session:
+        counts = await TicketCounterService().get_counts(check_session, [OPEN, IN_PROGRESS])
+    assert counts == {OPEN: 2, IN_PROGRESS: 1}
+
+
+async def test_backfill_rebuilds_only_missing_counters(session):
+    user = await create_user(session, "reporter")
+    session.add(make_ticket(user.user_id, TicketStatus.OPEN))
+    await session.commit()
+
+    async with async_session_maker() as backfill_session:
+        counts = await TicketCounterService().backfill(backfill_session)
+    assert counts[OPEN] == 1
+
+    # Counters exist now: a restart must not lock or rescan tickets
+    async with async_session_maker() as backfill_session:
+        with recorded_statements(engine) as statements:
+            assert await TicketCounterService().backfill(backfill_session) is None
+    assert len(statements) == 1
+    assert "FROM ticket_counters" in statements[0]
+
+
+@pytest.fixture
+def slow_counter_changes(monkeypatch):
+    """Widen the window between reading a ticket and adjusting its counters."""
+    apply_change = TicketCounterService.apply_change
+
+    async def slow_apply_change(self, session, old_keys, new_keys):
+        await asyncio.sleep(0.02)
+        await apply_change(self, session, old_keys, new_keys)
+
+    monkeypatch.setattr(TicketCounterService, "apply_change", slow_apply_change)
+
+
+async def create_open_ticket(session):
+    admin = await create_user(session, "admin", UserRole.ADMIN)
+    ticket = await TicketService().create_ticket(
+        TicketCreateRequest(subject="Printer jam", description="The printer is jammed.", types_of_issue=IssueType.HARDWARE),
+        auth_context(admin),
+        session,
+    )
+    return admin, ticket.ticket_id
+
+
+async def test_concurrent_updates_of_one_ticket_keep_counts(session, slow_counter_changes):
+    admin, ticket_id = await create_open_ticket(session)
+
+    async def start_progress():
+        async with async_session_maker() as update_session:
+            await TicketService().update_ticket(
+                ticket_id, TicketUpdateRequest(status=TicketStatus.IN_PROGRESS), auth_context(admin), update_session
+            )
+
+    await asyncio.gather(*(start_progress() for _ in range(4)))
+
+    async with async_session_maker() as check_session:
+        counts = await TicketCounterService().get_counts(check_session, [OPEN, IN_PROGRESS])
+    assert counts == {OPEN: 0, IN_PROGRESS: 1}
+
+
+async def test_concurrent_deletes_of_one_ticket_keep_counts(session, slow_counter_changes):
+    admin, ticket_id = await create_open_ticket(session)
+
+    async def delete():
+        async with async_session_maker() as delete_session:
+            await TicketService().delete_ticket(ticket_id, auth_context(admin), delete_session)
+
+    results = await asyncio.gather(*(delete() for _ in range(4)), return_exceptions=True)
+
+    assert sum(result is None for result in results) == 1
+    assert all(isinstance(result, TicketNotFoundError) for result in results if result is not None)
+    async with async_session_maker() as check_session:
+        counts = await TicketCounterService().get_counts(check_session, [OPEN])
+    assert counts == {OPEN: 0}
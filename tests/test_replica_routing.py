@@ -0,0 +1,73 @@
+import asyncio
+import contextvars
+import fakeredis
+import pytest
+from sqlalchemy.ext.asyncio import create_async_engine
+from src.cache.backends import RedisCacheBackend
+from src.config import Config
+from src.db import session as db_session
+from src.db.models.ticket_counter import TicketCounter
+from src.db.models.user import UserRole
+from src.db.session import async_session_maker, read_session_maker, set_current_actor
+from src.ticket.schemas import HistoryTotal
+from src.ticket.service import TicketService
+from tests.factories import auth_context, create_user, make_ticket
+from tests.queries import recorded_statements
+
+
+pytestmark = pytest.mark.anyio
+
+
+def in_new_request(coro):
+    """Run coro with fresh context variables, as a new request would."""
+    return asyncio.create_task(coro, context=contextvars.Context())
+
+
+@pytest.fixture
+async def replica(db, monkeypatch):
+    replica_engine = create_async_engine(Config.DATABASE_URL)
+    monkeypatch.setattr(db_session, "replica_engine", replica_engine)
+    yield replica_engine
+    await replica_engine.dispose()
+
+
+async def test_write_mark_is_shared_across_workers(replica, monkeypatch):
+    server = fakeredis.FakeServer()
+    worker_a = RedisCacheBackend(client=fakeredis.FakeAsyncRedis(server=server))
+    worker_b = RedisCacheBackend(client=fakeredis.FakeAsyncRedis(server=server))
+
+    async def write(actor):
+        monkeypatch.setattr(db_session, "cache_backend", worker_a)
+        await set_current_actor(actor)
+        async with async_session_maker() as session:
+            session.add(TicketCounter(counter_key=f"test:{actor}", count=1))
+            await session.commit()
+
+    async def read_bind(actor):
+        monkeypatch.setattr(db_session, "cache_backend", worker_b)
+        await set_current_actor(actor)
+        async with read_session_maker() as session:
+            return session.sync_session.get_bind()
+
+    await in_new_request(write("writer"))
+
+    assert await in_new_request(read_bind("writer")) is db_session.engine.sync_engine
+    assert await in_new_request(read_bind("someone-else")) is replica.sync_engine
+
+
+async def test_cached_history_total_is_counted_on_the_primary(replica, session):
+    admin = await create_user(session, "admin", UserRole.ADMIN)
+    ticket = make_ticket(admin.user_id)
+    session.add(ticket)
+    await session.commit()
+
+    with recorded_statements(db_session.engine) as primary_statements, \
+            recorded_statements(replica) as replica_statements:
+        async with read_session_maker() as read_session:
+            await TicketService().get_ticket_history(
+                ticket.ticket_id, auth_context(admin), read_session, total=HistoryTotal.CACHED
+            )
+
+    assert any("ORDER BY" in statement for statement in replica_statements)
+    assert not any("count(" in statement for statement in replica_statements)
+    assert any("count(" in statement for statement in primary_statements)
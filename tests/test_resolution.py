@@ -0,0 +1,60 @@
+import asyncio
+import pytest
+from sqlmodel import select
+from src.analytics.resolution import ResolutionMetricsService
+from src.db.models.ticket import TicketStatus
+from src.db.models.ticket_history import TicketHistory
+from src.db.models.ticket_resolution import TicketResolution
+from src.db.models.user import UserRole
+from src.db.session import async_session_maker
+from src.ticket.schemas import TicketUpdateRequest
+from src.ticket.service import TicketService
+from tests.factories import auth_context, create_user, make_ticket
+
+
+pytestmark = pytest.mark.anyio
+
+
+async def resolve_ticket(session):
+    admin = await create_user(session, "admin", UserRole.ADMIN)
+    ticket = make_ticket(admin.user_id)
+    session.add(ticket)
+    await session.commit()
+    await TicketService().update_ticket(
+        ticket.ticket_id, TicketUpdateRequest(status=TicketStatus.RESOLVED), auth_context(admin), session
+    )
+    return ticket
+
+
+async def test_resolved_at_matches_history(session):
+    ticket = await resolve_ticket(session)
+
+    async with async_session_maker() as check_session:
+        changed_at = (await check_session.execute(
+            select(TicketHistory.changed_at).where(
+                TicketHistory.ticket_id == ticket.ticket_id,
+                TicketHistory.action_type == "status_changed",
+            )
+        )).scalar_one()
+        live = (await check_session.execute(select(TicketResolution))).scalar_one()
+        assert live.resolved_at == changed_at
+
+        await ResolutionMetricsService().rebuild(check_session)
+        rebuilt = (await check_session.execute(select(TicketResolution))).scalar_one()
+    assert (rebuilt.resolved_at, rebuilt.resolution_seconds) == (live.resolved_at, live.resolution_seconds)
+
+
+async def test_concurrent_backfills_do_not_collide(session):
+    await resolve_ticket(session)
+    async with async_session_maker() as clear_session:
+        await clear_session.execute(TicketResolution.__table__.delete())
+        await clear_session.commit()
+
+    async def backfill():
+        async with async_session_maker() as backfill_session:
+            return await ResolutionMetricsService().backfill(backfill_session)
+
+    # Several workers starting at once; only the first finds the table empty
+    results = await asyncio.gather(*(backfill() for _ in range(4)))
+
+    assert sorted(results, key=lambda count: count is None) == [1, None, None, None]
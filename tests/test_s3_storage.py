@@ -0,0 +1,132 @@
+import io
+import os
+import boto3
+import pytest
+from fastapi import HTTPException, UploadFile
+from moto import mock_aws
+from starlette.datastructures import Headers
+from src.storage import S3Storage, MAX_FILE_SIZE_BYTES
+from src.storage.s3 import MIN_PART_SIZE
+
+
+pytestmark = pytest.mark.anyio
+
+BUCKET = "trackit-attachments"
+
+
+@pytest.fixture
+def s3(monkeypatch):
+    """An S3Storage on moto's in-process S3, with the smallest part size S3 allows."""
+    monkeypatch.setenv("AWS_ACCESS_KEY_ID", "testing")
+    monkeypatch.setenv("AWS_SECRET_ACCESS_KEY", "testing")
+    with mock_aws():
+        client = boto3.client("s3", region_name="us-east-1")
+        client.create_bucket(Bucket=BUCKET)
+        storage = S3Storage(
+            bucket=BUCKET,
+            region="us-east-1",
+            access_key_id="testing",
+            secret_access_key="testing",
+            endpoint_url=None,
+            max_workers=4,
+            part_size=MIN_PART_SIZE,
+        )
+        yield storage, client
+        storage.shutdown()
+
+
+def pdf(name: str, content: bytes, known_size: bool = True) -> UploadFile:
+    return UploadFile(
+        file=io.BytesIO(content),
+        filename=name,
+        # Streamed uploads reach _put without a size, so the limit is enforced while reading
+        size=len(content) if known_size else None,
+        headers=Headers({"content-type": "application/pdf"}),
+    )
+
+
+def stored_keys(client) -> list[str]:
+    return sorted(item["Key"] for item in client.list_objects_v2(Bucket=BUCKET).get("Contents", []))
+
+
+def open_multipart_uploads(client) -> list:
+    return client.list_multipart_uploads(Bucket=BUCKET).get("Uploads", [])
+
+
+def object_bytes(client, key: str) -> bytes:
+    return client.get_object(Bucket=BUCKET, Key=key)["Body"].read()
+
+
+async def test_file_larger_than_one_part_uses_multipart_upload(s3):
+    storage, client = s3
+    content = os.urandom(MIN_PART_SIZE + MIN_PART_SIZE // 2)
+
+    url = await storage.upload(pdf("large.pdf", content), "large.pdf")
+
+    assert storage.key_from_url(url) == "large.pdf"
+    assert storage.multipart_uploads == 1
+    assert object_bytes(client, "large.pdf") == content
+    assert (await storage.head("large.pdf")).content_type == "application/pdf"
+    assert open_multipart_uploads(client) == []
+
+
+async def test_small_file_uses_a_single_put(s3):
+    storage, client = s3
+    content = os.urandom(1024)
+
+    await storage.upload(pdf("small.pdf", content), "small.pdf")
+
+    assert storage.multipart_uploads == 0
+    assert object_bytes(client, "small.pdf") == content
+
+
+async def test_oversize_upload_is_aborted_without_leaving_anything(s3):
+    storage, client = s3
+    content = os.urandom(MAX_FILE_SIZE_BYTES + 1)
+
+    with pytest.raises(HTTPException) as error:
+        await storage.upload(pdf("oversize.pdf", content, known_size=False), "oversize.pdf")
+
+    assert error.value.status_code == 400
+    assert stored_keys(client) == []
+    assert open_multipart_uploads(client) == []
+    assert storage.failed == 1
+
+
+async def test_concurrent_uploads_store_every_file(s3):
+    storage, client = s3
+    contents = {f"file-{index}.pdf": os.urandom(MIN_PART_SIZE + index * 1024) for index in range(4)}
+    contents["small.pdf"] = os.urandom(2048)
+
+    urls = await storage.upload_many(
+        [pdf(key, content) for key, content in contents.items()], keys=list(contents)
+    )
+
+    assert [storage.key_from_url(url) for url in urls] == list(contents)
+    for key, content in contents.items():
+        assert object_bytes(client, key) == content
+    assert storage.multipart_uploads == 4
+    assert open_multipart_uploads(client) == []
+
+
+async def test_failed_concurrent_upload_removes_the_others(s3):
+    storage, client = s3
+    files = [pdf(f"file-{index}.pdf", os.urandom(MIN_PART_SIZE + 1024)) for index in range(3)]
+    files.append(pdf("oversize.pdf", os.urandom(MAX_FILE_SIZE_BYTES + 1), known_size=False))
+
+    with pytest.raises(HTTPException):
+        await storage.upload_many(files, keys=[file.filename for file in files])
+
+    assert stored_keys(client) == []
+    assert open_multipart_uploads(client) == []
+
+
+async def test_list_objects_filters_by_prefix(s3):
+    storage, client = s3
+    for key in ("tickets/a/1.pdf", "tickets/a/2.pdf", "tickets/b/1.pdf", "blobs/abc"):
+        client.put_object(Bucket=BUCKET, Key=key, Body=b"x")
+
+    objects = await storage.list_objects("tickets/a/")
+
+    assert sorted(key for key, _ in objects) == ["tickets/a/1.pdf", "tickets/a/2.pdf"]
+    assert all(last_modified.tzinfo is not None for _, last_modified in objects)
@@ -0,0 +1,107 @@
+import asyncio
+import fakeredis
+import pytest
+from src.cache.backends import RedisCacheBackend
+from src.cache.shared import SharedCache
+
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+def redis_server():
+    return fakeredis.FakeServer()
+
+
+@pytest.fixture
+async def backends(redis_server):
+    """Two workers' backends on one Redis server."""
+    created = [
+        RedisCacheBackend(client=fakeredis.FakeAsyncRedis(server=redis_server))
+        for _ in range(2)
+    ]
+    yield created
+    for backend in created:
+        await backend.close()
+
+
+def shared_cache(backend: RedisCacheBackend) -> SharedCache:
+    return SharedCache(
+        backend=backend,
+        namespace="test",
+        ttl_seconds=60,
+        local_ttl_seconds=60,
+        max_local_entries=16,
+    )
+
+
+async def eventually(condition, timeout: float = 1.0) -> bool:
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not condition():
+        if asyncio.get_running_loop().time() > deadline:
+            return False
+        await asyncio.sleep(0.01)
+    return True
+
+
+async def test_redis_backend_values_and_versions(backends):
+    backend = backends[0]
+
+    await backend.set("trackit:test:a", b"1", ttl_seconds=60)
+    await backend.set("trackit:test:short", b"2", ttl_seconds=0.05)
+    assert await backend.get("trackit:test:a") == b"1"
+    assert await backend.get("trackit:test:missing") is None
+
+    await asyncio.sleep(0.1)
+    assert await backend.get("trackit:test:short") is None
+    assert await backend.items("trackit:test:") == {"trackit:test:a": b"1"}
+
+    assert await backend.incr("trackit:test:version") == 1
+    assert await backend.incr("trackit:test:version") == 2
+    assert await backend.get_versions(["trackit:test:version", "trackit:test:unset"]) == [2, 0]
+
+
+async def test_redis_backend_swallows_errors():
+    backend = RedisCacheBackend(client=fakeredis.FakeAsyncRedis(connected=False))
+
+    assert await backend.get("trackit:test:a") is None
+    await backend.set("trackit:test:a", b"1", ttl_seconds=60)
+    assert await backend.incr("trackit:test:version") is None
+    await backend.publish("trackit:test:channel", "message")
+
+
+async def test_second_worker_reads_the_shared_tier(backends):
+    worker_a, worker_b = (shared_cache(backend) for backend in backends)
+    calls = []
+
+    async def compute():
+        calls.append(None)
+        return 42
+
+    assert await worker_a.get_or_compute("answer", compute, int, tags=("t",)) == 42
+    assert await worker_b.get_or_compute("answer", compute, int, tags=("t",)) == 42
+    assert len(calls) == 1
+    assert worker_b.shared_hits == 1
+
+
+async def test_invalidation_reaches_the_other_worker(backends):
+    worker_a, worker_b = (shared_cache(backend) for backend in backends)
+    await worker_a.start()
+    await worker_b.start()
+    notified = []
+    worker_b.on_invalidate("t", lambda: notified.append(None))
+
+    value = 1
+
+    async def compute():
+        return value
+
+    assert await worker_b.get_or_compute("key", compute, int, tags=("t",)) == 1
+    value = 2
+    # Served from worker B's local tier until the invalidation arrives
+    assert await worker_b.get_or_compute("key", compute, int, tags=("t",)) == 1
+
+    await worker_a.invalidate("t")
+
+    assert await eventually(lambda: notified)
+    assert await worker_b.get_or_compute("key", compute, int, tags=("t",)) == 2
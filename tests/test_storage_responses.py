@@ -0,0 +1,123 @@
+import io
+import pytest
+from fastapi import HTTPException, UploadFile
+from starlette.datastructures import Headers
+from src.storage import LocalStorage
+from src.storage.responses import parse_range, etag_matches, object_response
+
+
+pytestmark = pytest.mark.anyio
+
+CONTENT = bytes(range(100))
+
+
+@pytest.fixture
+async def stored(tmp_path):
+    storage = LocalStorage(root=str(tmp_path), base_url="http://test/files", max_workers=2)
+    file = UploadFile(
+        file=io.BytesIO(CONTENT),
+        filename="data.pdf",
+        size=len(CONTENT),
+        headers=Headers({"content-type": "application/pdf"}),
+    )
+    await storage.upload(file, "data.pdf")
+    yield storage, "data.pdf"
+    storage.shutdown()
+
+
+async def body(response) -> bytes:
+    return b"".join([chunk async for chunk in response.body_iterator])
+
+
+# ==================== parse_range ====================
+
+@pytest.mark.parametrize("header, expected", [
+    ("bytes=0-9", (0, 9)),
+    ("bytes=90-", (90, 99)),
+    ("bytes=-10", (90, 99)),
+    ("bytes=-500", (0, 99)),
+    ("bytes=95-200", (95, 99)),
+    (None, None),
+    ("bytes=0-1,5-6", None),
+    ("items=0-9", None),
+    ("bytes=9-0", None),
+    ("bytes=a-b", None),
+])
+def test_parse_range(header, expected):
+    assert parse_range(header, 100) == expected
+
+
+def test_parse_range_past_the_end_is_unsatisfiable():
+    with pytest.raises(HTTPException) as error:
+        parse_range("bytes=100-", 100)
+    assert error.value.status_code == 416
+    assert error.value.headers["Content-Range"] == "bytes */100"
+
+
+@pytest.mark.parametrize("header, etag, expected", [
+    ('"abc"', '"abc"', True),
+    ('"x", W/"abc"', '"abc"', True),
+    ('"abc"', 'W/"abc"', True),
+    ("*", '"abc"', True),
+    ('"x"', '"abc"', False),
+    (None, '"abc"', False),
+    ('"abc"', None, False),
+])
+def test_etag_matches(header, etag, expected):
+    assert etag_matches(header, etag) is expected
+
+
+# ==================== object_response ====================
+
+async def test_range_request_gets_partial_content(stored):
+    storage, key = stored
+    response = await object_response(storage, key, "bytes=10-19")
+    assert response.status_code == 206
+    assert response.headers["Content-Range"] == "bytes 10-19/100"
+    assert response.headers["Content-Length"] == "10"
+    assert await body(response) == CONTENT[10:20]
+
+
+async def test_unsatisfiable_range_is_416(stored):
+    storage, key = stored
+    with pytest.raises(HTTPException) as error:
+        await object_response(storage, key, "bytes=200-")
+    assert error.value.status_code == 416
+
+
+async def test_known_etag_is_304_without_reading_storage(stored):
+    storage, _ = stored
+    # The key does not exist: a matching ETag must be answered before any lookup
+    response = await object_response(storage, "missing.pdf", etag='"digest"', if_none_match='"digest"')
+    assert response.status_code == 304
+    assert response.headers["ETag"] == '"digest"'
+
+
+async def test_stored_etag_is_304(stored):
+    storage, key = stored
+    etag = (await storage.head(key)).etag
+    response = await object_response(storage, key, if_none_match=etag)
+    assert response.status_code == 304
+
+
+async def test_if_range_mismatch_sends_the_whole_object(stored):
+    storage, key = stored
+    response = await object_response(storage, key, "bytes=10-19", if_range='"stale"')
+    assert response.status_code == 200
+    assert "Content-Range" not in response.headers
+    assert await body(response) == CONTENT
+
+
+async def test_if_range_match_sends_the_range(stored):
+    storage, key = stored
+    etag = (await storage.head(key)).etag
+    response = await object_response(storage, key, "bytes=10-19", if_range=etag)
+    assert response.status_code == 206
+    assert await body(response) == CONTENT[10:20]
+
+
+async def test_missing_object_is_404(stored):
+    storage, _ = stored
+    with pytest.raises(HTTPException) as error:
+        await object_response(storage, "missing.pdf")
+    assert error.value.status_code == 404
@@ -0,0 +1,31 @@
+import pytest
+from src.db.models.ticket import TicketStatus, TicketPriority
+from src.errors import TicketNotFoundError
+from src.ticket.service import TicketService
+from tests.factories import auth_context, create_user, make_ticket
+
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_my_tickets_without_tickets_is_not_found(session):
+    user = await create_user(session, "reporter")
+
+    with pytest.raises(TicketNotFoundError):
+        await TicketService().get_user_tickets(auth_context(user), session)
+
+
+async def test_my_tickets_filters_matching_nothing_give_an_empty_page(session):
+    user = await create_user(session, "reporter")
+    session.add(make_ticket(user.user_id, TicketStatus.OPEN, priority=TicketPriority.LOW))
+    await session.commit()
+
+    page = await TicketService().get_user_tickets(
+        auth_context(user), session, status=TicketStatus.RESOLVED
+    )
+    assert page == {"tickets": [], "next_cursor": None}
+
+    page = await TicketService().get_user_tickets(
+        auth_context(user), session, priority=TicketPriority.HIGH
+    )
+    assert page == {"tickets": [], "next_cursor": None}
@@ -0,0 +1,81 @@
+import uuid
+import pytest
+from sqlalchemy.exc import IntegrityError
+from sqlmodel import select, func
+from src.analytics.counters import TicketCounterService, status_counter_key
+from src.db.models.ticket import Ticket, TicketStatus, IssueType
+from src.db.models.ticket_history import TicketHistory
+from src.db.models.user import UserRole
+from src.db.session import async_session_maker, engine
+from src.ticket.schemas import TicketCreateRequest, TicketUpdateRequest
+from src.ticket.service import TicketService
+from tests.factories import auth_context, create_user
+from tests.queries import recorded_commits, recorded_statements
+
+
+pytestmark = pytest.mark.anyio
+
+NEW_TICKET = TicketCreateRequest(
+    subject="Printer jam",
+    description="The printer on floor two is jammed.",
+    types_of_issue=IssueType.HARDWARE,
+)
+
+
+async def test_create_ticket_is_one_transaction(session):
+    admin = await create_user(session, "admin", UserRole.ADMIN)
+
+    with recorded_commits(engine) as commits, recorded_statements(engine) as statements:
+        await TicketService().create_ticket(NEW_TICKET, auth_context(admin), session)
+
+    # Ticket INSERT, history INSERT, one counter upsert
+    assert len(commits) == 1
+    assert len(statements) == 3
+
+
+async def test_update_ticket_is_one_transaction(session):
+    admin = await create_user(session, "admin", UserRole.ADMIN)
+    ticket = await TicketService().create_ticket(NEW_TICKET, auth_context(admin), session)
+
+    with recorded_commits(engine) as commits, recorded_statements(engine) as statements:
+        await TicketService().update_ticket(
+            ticket.ticket_id, TicketUpdateRequest(status=TicketStatus.RESOLVED), auth_context(admin), session
+        )
+
+    # Ticket SELECT and UPDATE, history INSERT, counter upsert, resolution upsert
+    assert len(commits) == 1
+    assert len(statements) == 5
+
+
+async def test_failed_history_insert_rolls_back_the_update(session, monkeypatch):
+    admin = await create_user(session, "admin", UserRole.ADMIN)
+    ticket = await TicketService().create_ticket(NEW_TICKET, auth_context(admin), session)
+    ticket_id = ticket.ticket_id
+
+    log_ticket_history = TicketService.log_ticket_history
+
+    def log_with_unknown_user(self, ticket_id, changes, changed_by, session):
+        # changed_by must reference a user, so the history INSERT fails
+        return log_ticket_history(self, ticket_id, changes, uuid.uuid4(), session)
+
+    monkeypatch.setattr(TicketService, "log_ticket_history", log_with_unknown_user)
+    with pytest.raises(IntegrityError):
+        await TicketService().update_ticket(
+            ticket_id, TicketUpdateRequest(status=TicketStatus.IN_PROGRESS), auth_context(admin), session
+        )
+    await session.rollback()
+
+    async with async_session_maker() as check_session:
+        status = (await check_session.execute(
+            select(Ticket.status).where(Ticket.ticket_id == ticket_id)
+        )).scalar_one()
+        history_entries = (await check_session.execute(
+            select(func.count()).select_from(TicketHistory).where(TicketHistory.ticket_id == ticket_id)
+        )).scalar_one()
+        counts = await TicketCounterService().get_counts(
+            check_session, [status_counter_key(TicketStatus.OPEN), status_counter_key(TicketStatus.IN_PROGRESS)]
+        )
+
+    assert status == TicketStatus.OPEN
+    assert history_entries == 1
+    assert counts == {status_counter_key(TicketStatus.OPEN): 1}
@@ -0,0 +1,40 @@
+from datetime import datetime, timedelta, timezone
+import pytest
+from src.analytics.schemas import VolumeInterval
+from src.analytics.timeseries import CLOSED_BUCKET_GRACE, INTERVAL_STEPS, TicketVolumeService
+from src.db.models.user import UserRole
+from src.ticket.service import TicketService
+from tests.factories import auth_context, create_user, make_ticket
+
+
+pytestmark = pytest.mark.anyio
+
+
+def created_counts(volume) -> list[int]:
+    return [bucket.created for bucket in volume.buckets]
+
+
+async def test_recently_closed_buckets_are_not_cached(session):
+    volume_service = TicketVolumeService()
+    await volume_service.get_ticket_volume(session, VolumeInterval.HOUR)
+
+    cutoff = datetime.now(timezone.utc) - CLOSED_BUCKET_GRACE
+    step = INTERVAL_STEPS[VolumeInterval.HOUR]
+    assert volume_service._closed_buckets
+    assert all(bucket_start + step <= cutoff for _, bucket_start in volume_service._closed_buckets)
+
+
+async def test_ticket_delete_clears_closed_buckets(session):
+    admin = await create_user(session, "admin", UserRole.ADMIN)
+    ticket = make_ticket(admin.user_id, created_at=datetime.now(timezone.utc) - timedelta(days=3))
+    session.add(ticket)
+    await session.commit()
+
+    volume_service = TicketVolumeService()
+    before = await volume_service.get_ticket_volume(session, VolumeInterval.DAY)
+    assert sum(created_counts(before)) == 1
+
+    await TicketService().delete_ticket(ticket.ticket_id, auth_context(admin), session)
+
+    after = await volume_service.get_ticket_volume(session, VolumeInterval.DAY)
+    assert sum(created_counts(after)) == 0
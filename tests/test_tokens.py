@@ -0,0 +1,98 @@
+import asyncio
+import time
+import fakeredis
+import pytest
+from redis.exceptions import ConnectionError
+from src.auth.tokens import TokenClaimsCache, TokenRevocationList
+from src.cache.backends import RedisCacheBackend
+
+
+def test_cached_claims_are_not_shared_with_callers():
+    cache = TokenClaimsCache(max_entries=4)
+    claims = {"user": {"user_id": "1", "role": "user"}, "exp": time.time() + 60}
+    cache.set("token", claims)
+
+    claims["user"]["role"] = "admin"
+    first = cache.get("token")
+    first["user"]["role"] = "admin"
+    first["exp"] = 0
+
+    second = cache.get("token")
+    assert second["user"]["role"] == "user"
+    assert second["exp"] > time.time()
+
+
+@pytest.fixture
+def redis_server(monkeypatch):
+    monkeypatch.setattr(RedisCacheBackend, "RESUBSCRIBE_DELAY_SECONDS", 0.01)
+    return fakeredis.FakeServer()
+
+
+@pytest.fixture
+async def backends(redis_server):
+    created = []
+
+    def create():
+        backend = RedisCacheBackend(client=fakeredis.FakeAsyncRedis(server=redis_server))
+        created.append(backend)
+        return backend
+
+    yield create
+    for backend in created:
+        await backend.close()
+
+
+async def wait_for(condition, timeout: float = 1.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            return False
+        await asyncio.sleep(0.01)
+    return True
+
+
+@pytest.mark.anyio
+async def test_worker_started_during_redis_outage_loads_revocations(redis_server, backends):
+    await TokenRevocationList(backends()).revoke("logged-out", time.time() + 60)
+
+    redis_server.connected = False
+    revocations = TokenRevocationList(backends())
+    await revocations.start()
+    assert not revocations.is_revoked("logged-out")
+
+    redis_server.connected = True
+    assert await wait_for(lambda: revocations.is_revoked("logged-out"))
+
+
+@pytest.mark.anyio
+async def test_revocation_published_while_resubscribing_is_not_lost(backends):
+    backend = backends()
+    drop = asyncio.Event()
+    open_pubsub = backend._client.pubsub
+    subscriptions = 0
+
+    def pubsub():
+        nonlocal subscriptions
+        subscriptions += 1
+        real = open_pubsub()
+        if subscriptions > 1:
+            return real
+
+        async def listen():
+            # Stops reading, then loses the connection: what was published in between is gone
+            await drop.wait()
+            raise ConnectionError("connection lost")
+            yield
+
+        real.listen = listen
+        return real
+
+    backend._client.pubsub = pubsub
+    revocations = TokenRevocationList(backend)
+    await revocations.start()
+
+    await TokenRevocationList(backends()).revoke("logged-out", time.time() + 60)
+    drop.set()
+
+    assert await wait_for(lambda: revocations.is_revoked("logged-out"))
+    assert subscriptions == 2